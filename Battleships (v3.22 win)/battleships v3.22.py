@@ -13,22 +13,32 @@
 version = 3.22
 
 import tkinter as tk
-import random
-import datetime
 import os.path
+import shutil
 
 import platform
 
 # Custom widgets module
 from frameworks.custom_widgets import *
 
+# Headless game engine (turns, ships, computer logic)
+from frameworks.engine import DIFFICULTIES, Game
+from frameworks import storage
+from frameworks.history import History
+from frameworks.replay import PLAYER, SUNK, HIT, ReplayLog
+from frameworks.coords import INDEX_TO_ALPHA
+
 
 # Set to true if operating system is windows
 windows = True if (platform.system() == "Windows") else False
 
+# Steps the board scale goes up in as the window gets bigger (see window_scale)
+SCALE_STEP = 0.25
+
 
 ### Function for switching between different screens ###
-#   – Screens can be of splash, setup, game (with 'Game' object arg)
+#   – Screens can be of splash, setup, game (with 'Game' object arg),
+#     replay (with a saved game record arg)
 #   – Note: All screens (splash, setup etc.) are of type tk.Frame
 #####
 def switch_screen(screen, args=None):
@@ -40,6 +50,11 @@ def switch_screen(screen, args=None):
     if screen == 'splash': current_screen = SplashScreen(root)
     elif screen == 'setup': current_screen = SetupWindow(root)
     elif screen == 'game': current_screen = GameWindow(root, args)
+    elif screen == 'replay': current_screen = ReplayWindow(root, args)
+
+    # Boards are drawn at the window's current scale
+    if hasattr(current_screen, 'resize'):
+        current_screen.resize(scale)
 
     # Packs the new screen frame into the root window
     current_screen.pack()
@@ -51,6 +66,30 @@ def switch_screen(screen, args=None):
     root.after(50, white.destroy)
 
 
+### Scale to draw boards at for a window size, 1 is the original 850x600 layout ###
+#   – Goes up in steps of SCALE_STEP, so grid geometry is only ever worked out
+#     for a few sizes (see GridGeometry), and never goes below 1
+#####
+def window_scale(width, height):
+    scale = min(width / 850, height / 600)
+
+    return max(1, int(scale / SCALE_STEP) * SCALE_STEP)
+
+
+### Called (debounced) when the window is resized, rescales the current screen ###
+def resize_window(width, height):
+    global scale
+
+    new_scale = window_scale(width, height)
+    if new_scale == scale:
+        return
+
+    scale = new_scale
+
+    if hasattr(current_screen, 'resize'):
+        current_screen.resize(scale)
+
+
 ### Splash screen to load a saved game, start a new game or view scoreboard ###
 class SplashScreen(tk.Frame):
     def __init__(self, parent):
@@ -94,11 +133,19 @@ class SplashScreen(tk.Frame):
 
         scoreboard_text = ['']
 
+        # Wins and losses since the scores were last reset, from the game history
+        scores = manager.history.scoreboard(DIFFICULTIES)
+
         # Appends all the scores for different difficulties into scoreboard_text
-        for mode in ('easy', 'normal', 'hard', 'master'):
-            scoreboard_text.append('{} Mode:\t{} wins – {} losses'.format(mode.upper(),
-                                                                          manager.stats[mode][0],
-                                                                          manager.stats[mode][1]))
+        for mode in DIFFICULTIES:
+            line = '{} Mode:\t{} wins – {} losses'.format(mode.upper(), scores[mode][0], scores[mode][1])
+
+            # Adds the fewest shots a game has been won in, if any have been won
+            best = manager.history.best_games(mode, limit=1)
+            if best:
+                line += ' (best {})'.format(best[0][0])
+
+            scoreboard_text.append(line)
 
         # Creates a frame with labels for every element in info_text
         info_labels = CustomLongText(info_canvas, text=info_text, height=270, width=400,
@@ -138,6 +185,15 @@ class SplashScreen(tk.Frame):
                                    colour=theme.TURQUOISE, fg=theme.WHITE, active=theme.TURQUOISE_DARK)
         load_button.place(x=0, y=84, anchor='nw')
 
+        # Creates a button to watch the last finished game back, if there is one
+        last_game = manager.history.last_game()
+
+        if last_game:
+            replay_button = CustomButton(buttons_container, text="Replay Last", width=250, height=80,
+                                         colour=theme.GREEN, fg=theme.WHITE, active=theme.GREEN_DIM)
+            replay_button.place(x=0, y=168, anchor='nw')
+            replay_button.bind_to_click(lambda: switch_screen('replay', last_game))
+
         # Creates a button to destroy application window
         close_button = CustomButton(buttons_container, text="✘", width=80, height=60,
                                     colour=theme.RED, fg=theme.WHITE, active=theme.RED_DIM)
@@ -167,122 +223,163 @@ class SplashScreen(tk.Frame):
 
 
 ### Frame within splash saves, inside the splash screen ###
+#   – Shows a page of saves at a time, newest first, with buttons to change page
+#   – Only the rows on screen have widgets: the same PAGE_SIZE save frames are
+#     filled again for each page, from the headers of the saves shown
+#   – A game is only read from its file when it's opened
+#####
 class SavesFrame(tk.Frame):
+
+    # Number of saves shown on each page
+    PAGE_SIZE = 3
+
     def __init__(self, parent):
         theme = Colours(manager.theme)
         super().__init__(parent)
         self["bg"] = theme.GRAY_LIGHT
 
-        # Function to delete a save after 'delete' button is pressed #
-        def delete(save, index):
+        self.page = 0
 
-            # Destroys all elements within the individual save frame
-            for child in save.winfo_children():
-                child.destroy()
+        # Creates the individual save frames, reused for every page
+        self.rows = []
+        for i in range(self.PAGE_SIZE):
+            save_frame = tk.Frame(self, width=400, height=80, bg=theme.GRAY)
+            save_frame.grid(column=0, row=i, pady=(0, 5))
+            self.rows.append(save_frame)
+
+        # Bar beneath the saves, to go between pages
+        page_bar = tk.Frame(self, width=400, height=30, bg=theme.GRAY_LIGHT)
+        page_bar.grid(column=0, row=self.PAGE_SIZE)
+
+        previous_button = CustomButton(page_bar, text="◀", width=60, height=30, font=("Tw Cen MT", 9 if windows else 12),
+                                       colour=theme.GRAY, fg=theme.WHITE, active=theme.GRAY_DARK, bg_canvas=theme.GRAY_LIGHT)
+        previous_button.place(x=0, y=0, anchor='nw')
+        previous_button.bind_to_click(lambda: self.show_page(self.page - 1))
+
+        next_button = CustomButton(page_bar, text="▶", width=60, height=30, font=("Tw Cen MT", 9 if windows else 12),
+                                   colour=theme.GRAY, fg=theme.WHITE, active=theme.GRAY_DARK, bg_canvas=theme.GRAY_LIGHT)
+        next_button.place(x=400, y=0, anchor='ne')
+        next_button.bind_to_click(lambda: self.show_page(self.page + 1))
+
+        # Which page is showing (i.e "Page 1 of 4")
+        self.page_label = tk.Label(page_bar, font=("Tw Cen MT", 9 if windows else 12), fg=theme.GRAY_BLACK, bg=theme.GRAY_LIGHT)
+        self.page_label.place(x=200, y=15, anchor='center')
 
-            # Resets the ind. save frame into an empty save
-            save["bg"] = theme.GRAY
-            new_id = tk.Label(save, text="EMPTY SAVE", font=("Tw Cen MT", 12), fg=theme.WHITE, bg=theme.GRAY)
-            new_id.place(x=10, y=5, anchor='nw')
+        self.show_page(0)
 
-            # Deletes the saved game from manager's storage
-            del manager.saved_games[index]
+    ## Number of pages, there's always at least one ##
+    def page_count(self):
+        return max(1, -(-len(manager.saved_games) // self.PAGE_SIZE))
+
+    ## Fills the save frames with a page of saves ##
+    def show_page(self, page):
+        self.page = max(0, min(page, self.page_count() - 1))
+        self.page_label["text"] = "Page {} of {}".format(self.page + 1, self.page_count())
+
+        for i in range(self.PAGE_SIZE):
+
+            # Position of the save in manager's storage, newest first (negative once they run out)
+            position = len(manager.saved_games) - 1 - (self.page * self.PAGE_SIZE + i)
+            self.fill_row(self.rows[i], position if position >= 0 else None)
+
+    ## Fills an individual save frame with the save at a position, or as an empty save if None ##
+    def fill_row(self, save_frame, position):
+        theme = Colours(manager.theme)
 
-        # Function to open a save when 'open' button is pressed #
-        def open_save(save, index):
+        # Destroys all elements from the page before
+        for child in save_frame.winfo_children():
+            child.destroy()
 
-            # Makes a new game and imports the data from manager's storage
-            game = Game()
-            game.import_data(manager.saved_games[index])
-            switch_screen('game', game)
+        save = None
 
-            # Deletes the saved game from manager's storage
-            del manager.saved_games[index]
+        bg = theme.GRAY
 
-        # Creates 3 individual save frames with varying elements inside
-        for i in range(3):
-            save = None
+        # If there's a save, make the frame white and make its header the current save
+        # Note: Only the header is read here, the game is read when it's opened
+        if position is not None:
+            bg = theme.WHITE
+            save = manager.saved_games.header(position)
 
-            bg = theme.GRAY
+        save_frame["bg"] = bg
 
-            # If manager's storage has save, make the frame white and make it the current save
-            if len(manager.saved_games) > i:
-                bg = theme.WHITE
-                save = manager.saved_games[i]
+        # Array for laziness... Makes all similar labels have the same colour font
+        similar_labels = []
 
-            # Creates an individual save frame
-            save_frame = tk.Frame(self, width=400, height=80, bg=bg)
+        # ID label (i.e "SAVE #1")
+        id_label = tk.Label(save_frame, text="SAVE #{}".format(position + 1) if save else "EMPTY SAVE",
+                            font=("Tw Cen MT", 9 if windows else 12))
+        similar_labels.append(id_label)
+        id_label.place(x=10, y=5, anchor='nw')
 
-            # Array for laziness... Makes all similar labels have the same colour font
-            similar_labels = []
+        # If a save exists, add these elements to the save frame
+        if save:
 
-            # ID label (i.e "SAVE #1")
-            id_label = tk.Label(save_frame, text="{}SAVE #{}".format("" if save else "EMPTY ", i + 1),
-                                font=("Tw Cen MT", 9 if windows else 12))
-            similar_labels.append(id_label)
-            id_label.place(x=10, y=5, anchor='nw')
+            # The date
+            symbol_space = "#" if windows else "-"
+            date_label = tk.Label(save_frame, text=save.date.strftime('%A %' + symbol_space + 'I:%M%p, %d %b %Y'),
+                                  font=("Tw Cen MT", 9 if windows else 12))
+            similar_labels.append(date_label)
+            date_label.place(x=390, y=5, anchor='ne')
 
-            # If a save exists, add these elements to the save frame
-            if save:
+            # The difficulty mode label
+            mode_label = tk.Label(save_frame, text="Difficulty", font=("Tw Cen MT", 12 if windows else 16))
+            similar_labels.append(mode_label)
+            mode_label.place(x=30, y=45, anchor='w')
 
-                # The date
-                symbol_space = "#" if windows else "-"
-                date_label = tk.Label(save_frame, text=save["date"].strftime('%A %' + symbol_space + 'I:%M%p, %d %b %Y'),
+            # The difficulty mode
+            mode = tk.Label(save_frame, text=save.difficulty.upper(), font=("Tw Cen MT", 15 if windows else 20, "bold"))
+            similar_labels.append(mode)
+            mode.place(x=90, y=45, anchor='w')
+
+            # Most of either side's ships that have been hit, worked out when the game was saved,
+            # can be used as a crude measure of game's progress to completion
+            avg_game = round(save.progress * 100, 1)
+            avg_game_label = tk.Label(save_frame, text="{}% of game completed".format(avg_game),
                                       font=("Tw Cen MT", 9 if windows else 12))
-                similar_labels.append(date_label)
-                date_label.place(x=390, y=5, anchor='ne')
-
-                # The difficulty mode label
-                mode_label = tk.Label(save_frame, text="Difficulty", font=("Tw Cen MT", 12 if windows else 16))
-                similar_labels.append(mode_label)
-                mode_label.place(x=30, y=45, anchor='w')
-
-                # The difficulty mode
-                mode = tk.Label(save_frame, text=save["difficulty"].upper(), font=("Tw Cen MT", 15 if windows else 20, "bold"))
-                similar_labels.append(mode)
-                mode.place(x=90, y=45, anchor='w')
-
-                # Checks how many ships on player's board have been hit
-                player_count = 0
-                for ship in save["player_ships"]:
-                    for coord in save["player_hit"]:
-                        if coord in ship:
-                            player_count += 1
-
-                # Checks how many ships on computer's board have been hit
-                comp_count = 0
-                for ship in save["computer_ships"]:
-                    for coord in save["computer_hit"]:
-                        if coord in ship:
-                            comp_count += 1
-
-                # Finds the maximum of the two counts, can be used
-                # as a crude measure of game's progress to completion
-                avg_game = round(max(player_count * 100/ 17, comp_count * 100 / 17), 1)
-                avg_game_label = tk.Label(save_frame, text="{}% of game completed".format(avg_game),
-                                          font=("Tw Cen MT", 9 if windows else 12))
-                similar_labels.append(avg_game_label)
-                avg_game_label.place(x=30, y=62, anchor='w')
-
-                # Creates a delete button on each frame, to delete the save
-                delete_button = CustomButton(save_frame, text="Delete", width=60, height=30, font=("Tw Cen Mt", 9 if windows else 12),
-                                             fg=theme.WHITE, colour=theme.RED, active=theme.RED_DIM)
-                delete_button.place(x=390, y=65, anchor='se')
-                delete_button.bind_to_click(lambda arg=save_frame, arg2=i: delete(arg, arg2))
-
-                # Creates a button to open each save into a game window
-                open_button = CustomButton(save_frame, text="Open", width=60, height=30, font=("Tw Cen MT", 9 if windows else 12),
-                                           fg=theme.WHITE, colour=theme.GREEN, active=theme.GREEN_DIM)
-                open_button.place(x=325, y=65, anchor='se')
-                open_button.bind_to_click(lambda arg=save_frame, arg2=i: open_save(arg, arg2))
-
-            # Changes font fg and bg of all predefined 'similar' labels
-            for label in similar_labels:
-                label["fg"] = theme.GRAY_BLACK if save else theme.WHITE
-                label["bg"] = bg
-
-            # Places each individual save frame into the big save grid (self)
-            save_frame.grid(column=0, row=i, pady=(0, 5))
+            similar_labels.append(avg_game_label)
+            avg_game_label.place(x=30, y=62, anchor='w')
+
+            # Thumbnail of the computer's board, where the player has fired so far
+            thumbnail = BoardThumbnail(save_frame, hits=save.hits, misses=save.misses, scale=5, bg=bg)
+            thumbnail.place(x=255, y=70, anchor='se')
+
+            # Creates a delete button on each frame, to delete the save
+            delete_button = CustomButton(save_frame, text="Delete", width=60, height=30, font=("Tw Cen Mt", 9 if windows else 12),
+                                         fg=theme.WHITE, colour=theme.RED, active=theme.RED_DIM)
+            delete_button.place(x=390, y=65, anchor='se')
+            delete_button.bind_to_click(lambda: self.delete(position))
+
+            # Creates a button to open each save into a game window
+            open_button = CustomButton(save_frame, text="Open", width=60, height=30, font=("Tw Cen MT", 9 if windows else 12),
+                                       fg=theme.WHITE, colour=theme.GREEN, active=theme.GREEN_DIM)
+            open_button.place(x=325, y=65, anchor='se')
+            open_button.bind_to_click(lambda: self.open_save(position))
+
+        # Changes font fg and bg of all predefined 'similar' labels
+        for label in similar_labels:
+            label["fg"] = theme.GRAY_BLACK if save else theme.WHITE
+            label["bg"] = bg
+
+    ## Deletes the save at a position, the page is then filled again ##
+    def delete(self, position):
+        manager.delete_save(position)
+        self.show_page(self.page)
+
+    ## Opens the save at a position into a game window ##
+    def open_save(self, position):
+
+        # Makes a new game and imports the data from the save's file
+        try:
+            game = Game(manager, verbose=True)
+            game.import_data(manager.saved_games[position])
+        except storage.SaveFormatError as error:
+            print("Saved game can't be read ({}), it's been deleted".format(error))
+            self.delete(position)
+            return
+
+        # Deletes the saved game from manager's storage, the game carries on from it
+        manager.delete_save(position)
+        switch_screen('game', game)
 
 
 ### Board setup Window ###
@@ -300,12 +397,13 @@ class SetupWindow(tk.Frame):
 
 
         # Creates a new game object
-        self.game = Game()
+        self.game = Game(manager, verbose=True)
 
         # Left container for the progress bar and some info text #
         progress_container = tk.Frame(self, bg=theme.GRAY_LIGHT, height=570)
         progress_container.grid(column=0, row=0, sticky='n', pady=15)
         progress_container.pack_propagate(False)
+        self.progress_container = progress_container
 
         # Label for progress bar
         progress_label = tk.Label(progress_container, text="Battleships\nRemaining", font=("Tw Cen Mt", 18 if windows else 24, "bold"),
@@ -314,7 +412,8 @@ class SetupWindow(tk.Frame):
 
         # Actual progress bar
         self.progress_bar = ProgressBar(progress_container, direction="up",
-                                        colours=(theme.GRAY, theme.GRAY_BLACK), bg_canvas=theme.GRAY_LIGHT)
+                                        colours=(theme.GRAY, theme.GRAY_BLACK), bg_canvas=theme.GRAY_LIGHT,
+                                        scheduler=scheduler)
         self.progress_bar.pack(side='bottom')
 
         # Linking progress bar width to bounding countainer (progress_container)
@@ -327,12 +426,14 @@ class SetupWindow(tk.Frame):
 
         # The setup grid for player to place ships on
         self.main_grid = CustomGrid(main_container, multiplier=4,
-                                    progress_bar=self.progress_bar, bottom_hidden=True, is_game_board=False)
+                                    progress_bar=self.progress_bar, bottom_hidden=True, is_game_board=False,
+                                    scheduler=scheduler, show_origins=True)
         self.main_grid.pack()
 
         # The black bottom bar for player to select ships
         ships_container = tk.Canvas(main_container, width=int(self.main_grid["width"]), height=130,
                                     highlightthickness=0, bg=theme.GRAY_DARK)
+        self.bottom_panel = ships_container
 
         self.current_ship_selection = None
 
@@ -348,15 +449,18 @@ class SetupWindow(tk.Frame):
             self.main_grid.selection_length = ship.length
             self.main_grid.selection_dir = ship.dir
 
+            # Shows where the ship can go
+            self.main_grid.refresh_origins()
+
             # Sets currently selected ship as current selected ship
             self.current_ship_selection = ship
 
         # Defines all the ships (length and direction), and their positions in ship container
-        self.ships = [Ship(ships_container, 40, 15, length=2, dir='v'),
-                      Ship(ships_container, 90, 15, length=3, dir='v'),
-                      Ship(ships_container, 140, 15, length=3, dir='v'),
-                      Ship(ships_container, 220, 15, length=5),
-                      Ship(ships_container, 220, 65, length=4)]
+        self.ships = [Ship(ships_container, 40, 15, length=2, dir='v', scheduler=scheduler),
+                      Ship(ships_container, 90, 15, length=3, dir='v', scheduler=scheduler),
+                      Ship(ships_container, 140, 15, length=3, dir='v', scheduler=scheduler),
+                      Ship(ships_container, 220, 15, length=5, scheduler=scheduler),
+                      Ship(ships_container, 220, 65, length=4, scheduler=scheduler)]
 
         ships_container.pack(pady=(0, 10))
 
@@ -406,17 +510,17 @@ class SetupWindow(tk.Frame):
 
         # Changes the difficulty if the mode dial is clicked #
         def difficulty_change():
-            modes = ['easy', 'normal', 'hard', 'master']
+            modes = DIFFICULTIES
 
             # Checks to see what the current difficulty is
             current_index = modes.index(difficulty_button["text"].lower())
 
-            # If the current difficulty is 'master', set new difficulty to 'easy'
-            # If current difficulty isn't 'master', go to next difficulty in 'modes' array
+            # If the current difficulty is the last one ('master+'), set new difficulty to 'easy'
+            # If it isn't, go to next difficulty in 'modes' array
             if modes[-1] == difficulty_button["text"].lower():
-                self.game.difficulty = modes[0]
+                self.game.set_difficulty(modes[0])
             else:
-                self.game.difficulty = modes[current_index + 1]
+                self.game.set_difficulty(modes[current_index + 1])
 
             # Sets the new button text and look to match new difficulty
             self.difficulty_colour = theme.GRADIENT[modes.index(self.game.difficulty)]
@@ -436,14 +540,14 @@ class SetupWindow(tk.Frame):
         # Function to be called when board is reset #
         def reset_board():
 
-            # Wipes everything off the main grid
-            self.main_grid.update_canvas()
-
             # Sets current selection to none
             self.main_grid.selection = []
             self.main_grid.selection_length = 0
             self.main_grid.selection_dir = 'h'
 
+            # Wipes everything off the main grid
+            self.main_grid.update_canvas()
+
             # Resets states of all ships in ship container
             for ship in self.ships:
                 ship.selected = False
@@ -463,7 +567,7 @@ class SetupWindow(tk.Frame):
             # unselected ships in ships container), creates popup if not true
             for ship in self.ships:
                 if ship.selected == False:
-                    popup = Popup(parent, text="All ships must be placed!", bg=theme.RED, fg="white")
+                    popup = Popup(parent, text="All ships must be placed!", bg=theme.RED, fg="white", animator=animator)
                     break
 
             # Sets player ships to setup grid's current custom layout
@@ -501,6 +605,21 @@ class SetupWindow(tk.Frame):
         close_button.place(x=210, y=51, anchor="se")
         close_button.bind_to_click(lambda: root.destroy())
 
+    ## Scales the grid, progress bar and ships, the panels around them keep their size ##
+    def resize(self, scale):
+        self.main_grid.resize(4 * scale)
+        self.progress_bar.resize(2 * scale)
+
+        for ship in self.ships:
+            ship.resize(scale)
+
+        self.bottom_panel["width"] = int(self.main_grid["width"])
+        self.bottom_panel["height"] = round(130 * scale)
+        self.progress_container["width"] = int(self.progress_bar["width"]) + 20
+
+        # Progress bar's column is as tall as the grid and the ships panel beneath it
+        self.progress_container["height"] = 570 + int(self.main_grid["height"]) - 440 + int(self.bottom_panel["height"]) - 130
+
 
 ### The main Game Window ###
 class GameWindow(tk.Frame):
@@ -520,6 +639,7 @@ class GameWindow(tk.Frame):
         progress_container = tk.Frame(self, bg=theme.GRAY_LIGHT, height=570)
         progress_container.grid(column=0, row=0, sticky='n', pady=15)
         progress_container.pack_propagate(False)
+        self.progress_container = progress_container
 
         # Label for progress bar
         progress_label = tk.Label(progress_container, text="Opponent\nShips", font=("Tw Cen Mt", 18 if windows else 24, "bold"),
@@ -528,7 +648,8 @@ class GameWindow(tk.Frame):
 
         # Actual progress bar
         self.progress_bar = ProgressBar(progress_container, direction="up",
-                                        colours=(theme.RED, theme.RED_DARK), bg_canvas=theme.GRAY_LIGHT)
+                                        colours=(theme.RED, theme.RED_DARK), bg_canvas=theme.GRAY_LIGHT,
+                                        scheduler=scheduler, tween=250)
         self.progress_bar.pack(side='bottom')
 
         # Linking progress bar width to bounding countainer (progress_container)
@@ -542,8 +663,8 @@ class GameWindow(tk.Frame):
         # Computer's grid (the grid that the player tries to find ships on)
         self.main_grid = CustomGrid(main_container, multiplier=4,
                                     progress_bar=self.progress_bar, bottom_hidden=True,
-                                    is_game_board=True, game=self.game, owner='computer')
-        self.game.computer_board = self.main_grid
+                                    is_game_board=True, game=self.game, owner='computer', scheduler=scheduler,
+                                    animator=animator)
         self.main_grid.pack()
 
         # Filler space for aesthetic purpose, contains last hit coord
@@ -551,6 +672,7 @@ class GameWindow(tk.Frame):
                                  highlightthickness=0, bg=theme.GRAY_DARK)
         bottom_filler.pack_propagate(0)
         bottom_filler.pack(pady=(0, 10))
+        self.bottom_panel = bottom_filler
 
         # Last location that the player has hit
         last_location = tk.Label(bottom_filler, text="––",
@@ -576,8 +698,8 @@ class GameWindow(tk.Frame):
 
         # Player's grid
         self.small_grid = CustomGrid(small_grid_container, multiplier=2, progress_bar=None,
-                                     disabled=True, bottom_hidden=True, game=self.game, owner='player')
-        self.game.player_board = self.small_grid
+                                     disabled=True, bottom_hidden=True, game=self.game, owner='player',
+                                     scheduler=scheduler, animator=animator)
         self.small_grid.pack(side='top')
 
         # Shows all the ships on the board
@@ -638,7 +760,9 @@ class GameWindow(tk.Frame):
         turn_status.pack(side='top', pady=(20, 0), ipady=5)
 
         # Links the game's turn status to the label created above
-        self.game.status = turn_status
+        self.turn_status = turn_status
+        self.game.bind_to_turn(self.turn_change)
+        self.game.bind_to_result(self.game_result)
 
         # Generic text – static
         tk.Label(info_frame, text="TURN", fg=theme.GRAY_LIGHT,
@@ -647,6 +771,13 @@ class GameWindow(tk.Frame):
         # Control frame with options to resign and close game
         control_frame = tk.Frame(right_container, bg=theme.GRAY_LIGHT, width=220, height=60)
         control_frame.pack(pady=10)
+        control_frame.pack_propagate(False)
+
+        self.build_controls(control_frame)
+
+    ## Fills the control frame with the resign and close buttons ##
+    def build_controls(self, control_frame):
+        theme = Colours(manager.theme)
 
         # Button to resign from game (default loss)
         resign_button = CustomButton(control_frame, text="⚑", width=120, height=40,
@@ -663,8 +794,8 @@ class GameWindow(tk.Frame):
 
             # Creates popup
             popup = Popup(root, text="Do you wish to save this game?",
-                          subtext="Note: Oldest game will be deleted if memory is full.",
-                          bg=background, fg=theme.WHITE, stay=True)
+                          subtext="Note: Saved games can be opened from 'Load Saved'.",
+                          bg=background, fg=theme.WHITE, stay=True, animator=animator)
             popup["height"] = 140
 
             # Sets the coordinates of where the main and subtext of the popup appear
@@ -688,13 +819,14 @@ class GameWindow(tk.Frame):
             # Function called when any button is clicked, saves game (if applicable)
             # and returns back to startup splash
             def return_to_splash(save):
-                if save:
+
+                # A finished game's result is already in the stats, so it isn't saved as well
+                if save and not self.game.game_over:
 
                     # Gets a summary data packet of the current game, saves to manager
-                    # and exports save data to a file (saves.bts)
+                    # (which writes it to a file of its own in the saves folder)
                     data = self.game.get_data_summary()
                     manager.save_game(data)
-                    manager.export_to_file()
 
                 # Destroys the popup and the container, returns to splash
                 popup.destroy()
@@ -720,492 +852,274 @@ class GameWindow(tk.Frame):
         close_button.place(x=210, y=51, anchor="se")
         close_button.bind_to_click(lambda: close())
 
+    ## Scales the main grid and progress bar, the panels around them keep their size ##
+    # Note: The player's grid stays small, it's sized to the panel beneath it
+    def resize(self, scale):
+        self.main_grid.resize(4 * scale)
+        self.progress_bar.resize(2 * scale)
 
-### Game object with management on how the game runs ###
-class Game(object):
-    def __init__(self):
-
-        # Difficulty selection range: easy, normal, hard, master
-        self.difficulty = "normal"
-        self.date = datetime.datetime.today()
-        self.theme = Colours(manager.theme)
-
-        self.manager = manager
-        self.game_over = False
-
-        # The following (up to #####) links to different elements #
-        # in other classes for access to different information #
-
-        # Structured as individual ships (with alpha-num coords), links to the playing grids
-        self.player_ships = []
-        self.player_remaining_ships = []
-
-        self.computer_ships = []
-        self.computer_remaining_ships = []
-
-        # Structured as alpha-num coords, links to the playing grids
-        self.player_board_hit = []
-        self.computer_board_hit = []
-
-        # Boards are linked to the 'playing grids' in GameWindow
-        self.player_board = None
-        self.computer_board = None
-
-        # Status is linked to 'turn status' in GameWindow
-        self.status = None
+        self.bottom_panel["width"] = int(self.main_grid["width"])
+        self.progress_container["width"] = int(self.progress_bar["width"]) + 20
+        self.progress_container["height"] = 570 + int(self.main_grid["height"]) - 440
 
-        #####
-
-        # Defines the computer's brain for move/layout generation
-        self.computer_logic = ComputerLogic()
-
-    ## Sets the ships on player's board to the layout from setup ##
-    def add_player_ships(self, ships_array):
-        self.player_ships = copy.deepcopy(ships_array)
-        self.player_remaining_ships = copy.deepcopy(ships_array)
-
-    ## Sets out predefined ships for computer's board ##
-    def add_computer_ships(self, ships_array):
-        self.computer_ships = copy.deepcopy(ships_array)
-        self.computer_remaining_ships = copy.deepcopy(ships_array)
-
-    ## Sets the game grids (from the GameWindow class) for access to data ##
-    def set_boards(self, player_board, computer_board):
-        self.player_board = player_board
-        self.computer_board = computer_board
-
-    ## Exporting game data ##
-    def get_data_summary(self):
-        data = {"difficulty": self.difficulty, "date": self.date,
-                "player_ships": self.player_ships,
-                "player_hit": self.player_board_hit,
-
-                "computer_ships": self.computer_ships,
-                "computer_hit": self.computer_board_hit,
-                "computer_cache": self.computer_logic.cached_ship_coords}
-
-        return data
-
-    ## Imports all the game data ##
-    def import_data(self, data):
-        self.difficulty = data["difficulty"]
-
-        self.add_player_ships(data["player_ships"])
-        self.player_board_hit = data["player_hit"]
-
-        self.add_computer_ships(data["computer_ships"])
-        self.computer_board_hit = data["computer_hit"]
-        self.computer_logic.cached_ship_coords = data["computer_cache"]
-
-        self.computer_logic.set_hit_spaces(self.player_board_hit)
-
-    ## After any position is played (coord in alpha-num) ##
-    #   – Returns who's turn it is after the play
-    #   – Makes necessary changes to ship variables (if any are hit)
-    ##
-    def game_control(self, coord, board_name):
-
-        # If last move was played on the computer's board (the big grid)
-        if board_name == 'computer':
-            self.computer_board_hit.append(coord)
-
-            for ship in self.computer_remaining_ships:
-
-                # Checks if the last move hit a ship
-                if coord in ship:
+    ## Called by the game after every shot, with the board to be fired on next ##
+    def turn_change(self, board_name):
+        theme = Colours(manager.theme)
 
-                    # Finds the original ship
-                    current_ship = self.computer_ships[self.computer_remaining_ships.index(ship)]
-                    name = Ship.get_name(len(current_ship))
-                    ship_sunk = False
+        # Computer's turn, plays its coordinate after 1 second (to simulate 'thinking')
+        if board_name == 'player':
+            self.turn_status["text"] = "COMPUTER's"
+            self.turn_status["fg"] = theme.GOLD
 
-                    # If the length of the current ship (before hit) was 1 (i.e 1 more hit dead)
-                    if len(ship) == 1:
-                        ship_sunk = True
-                        print("Computer's {} is now sunk!".format(name))
+            hit_coord = CoordUtils.convert_type(self.game.next_computer_move)
 
-                    # Removes the hit square from remaining spaces
-                    ship.remove(coord)
+            root.after(1000, lambda: self.small_grid.hit(None, self.small_grid.coord_to_rect(hit_coord), override=True))
 
-                    return(board_name, ship_sunk, current_ship)
+        # Player's turn, makes the main grid enabled again
+        else:
+            self.turn_status["text"] = "PLAYER's"
+            self.turn_status["fg"] = theme.RED
 
-            # Did not hit a ship
-            else:
+            self.main_grid.disabled = False
 
-                # Sets the current turn to 'COMPUTERS'
-                self.status["text"] = "COMPUTER's"
-                self.status["fg"] = self.theme.GOLD
+    ## Updates the last location label after a shot, with the colour of what it did ##
+    def show_last_location(self, coord, colour):
+        self.main_grid.linked_coordinate["text"] = coord
+        self.main_grid.linked_coordinate["fg"] = colour
 
-                hit_coord = None
-                counter = 0
-                max = {'easy': 1,
-                       'normal': 2,
-                       'hard': 3,
-                       'master': 4}.get(self.difficulty, 1)
+    ## Called by the game once it's over, shows a result popup after 1.2s ##
+    def game_result(self, result):
+        theme = Colours(manager.theme)
+        difficulty = self.game.difficulty
 
-                # Gives the computer up to '4 virtual turns' on hard difficulty
-                while counter < max:
-                    hit_coord = CoordUtils.convert_type(self.computer_logic.make_move())
+        bg_colour = theme.GREEN_DIM if (result == "player") else theme.RED
 
-                    # Checks if 'hit_coord' hits a ship
-                    for ship in self.player_remaining_ships:
-                        if CoordUtils.convert_type(hit_coord) in ship:
-                            counter += 100
-                            break
-                    else:
-                        counter += 1
+        def popup_appear():
+            # Switches the screen to startup 'splash' window
+            switch_screen('splash')
 
-                # Plays the coordinate previously generated after 1 second (to simulate 'thinking')
-                def next():
-                    self.player_board.hit(None, self.player_board.coord_to_rect(hit_coord), override=True)
-                    print(CoordUtils.convert_type(hit_coord))
-                    self.computer_logic.grid.remove(CoordUtils.convert_type(hit_coord))
+            subtext = "Current score: {} wins and {} losses on {} difficulty".format(manager.stats[difficulty][0],
+                                                                                     manager.stats[difficulty][1],
+                                                                                     difficulty.upper())
+            result_popup = Popup(root, text="YOU {}!".format("WON" if (result == "player") else "LOST"),
+                                 bg=bg_colour, fg=theme.WHITE, fill=True,
+                                 subtext=subtext, animator=animator)
+        root.after(1200, popup_appear)
 
-                root.after(1000, next)
 
-                # Returns that the next move is on the player's board (i.e computer's turn)
-                return ('player',)
+### Game window that plays back a finished or saved game move by move ###
+#   – Steps forward and back a shot at a time, or scrubs to any move with the slider
+#   – Both boards show every ship, nothing can be fired at
+#   – Seeking is a snapshot and a few events (see ReplayLog.apply), then only
+#     squares that changed are redrawn
+#####
+class ReplayWindow(GameWindow):
+    def __init__(self, parent, record):
 
-        # If computer was the one who played the last move
-        elif board_name == 'player':
-            self.player_board_hit.append(coord)
+        # Game holding the ships and boards, nothing is recorded as it isn't given the manager
+        game = Game()
+        game.import_data(record)
 
-            for ship in self.player_remaining_ships:
+        self.log = ReplayLog.of(record)
+        self.position = None
 
-                # Checks if the last move hit a ship
-                if coord in ship:
+        super().__init__(parent, game)
 
-                    # Finds the original ship for aesthetic purposes
-                    current_ship = self.player_ships[self.player_remaining_ships.index(ship)]
-                    name = Ship.get_name(len(current_ship))
-                    ship_sunk = False
+        # Shots aren't played here, the boards are set by seek()
+        game.bind_to_turn(None)
+        game.bind_to_result(None)
+        self.main_grid.disabled = True
 
-                    # If the length of the current ship (before hit) was 1 (i.e 1 more hit dead)
-                    if len(ship) == 1:
-                        ship_sunk = True
-                        print("Player's {} is now sunk!".format(name))
+        self.seek(0)
 
-                    # Removes the hit square from remaining spaces
-                    ship.remove(coord)
+    ## Fills the control frame with the slider and step / close buttons ##
+    def build_controls(self, control_frame):
+        theme = Colours(manager.theme)
 
-                    # Generates a new hit coordinate based on previously hit coordinates
-                    hit_coord = CoordUtils.convert_type(self.computer_logic.square_hit(coord, sunk=ship_sunk, ship=current_ship))
+        control_frame["height"] = 110
 
-                    # Plays predefined coordinate after 1s (simulates 'thinking' time)
-                    def next():
-                        self.player_board.hit(None, self.player_board.coord_to_rect(hit_coord), override=True)
-                        self.computer_logic.grid.remove(CoordUtils.convert_type(hit_coord))
-                    root.after(1000, next)
+        # Slider for scrubbing to any move
+        self.scrubber = tk.Scale(control_frame, from_=0, to=len(self.log), orient='horizontal', length=200,
+                                 showvalue=False, bg=theme.GRAY_LIGHT, troughcolor=theme.GRAY,
+                                 highlightthickness=0, bd=0, command=lambda value: self.seek(int(value)))
+        self.scrubber.place(x=10, y=15, anchor='nw')
 
-                    return(board_name, ship_sunk, current_ship)
+        # Buttons to step a move back and forward
+        back_button = CustomButton(control_frame, text="◀", width=60, height=40,
+                                   colour=theme.GOLD, fg=theme.WHITE, active=theme.GOLD_DARK, bg_canvas=theme.GRAY_LIGHT)
+        back_button.place(x=10, y=101, anchor='sw')
+        back_button.bind_to_click(lambda: self.step(-1))
 
-            # Didn't hit a ship
-            else:
+        forward_button = CustomButton(control_frame, text="▶", width=60, height=40,
+                                      colour=theme.GOLD, fg=theme.WHITE, active=theme.GOLD_DARK, bg_canvas=theme.GRAY_LIGHT)
+        forward_button.place(x=75, y=101, anchor='sw')
+        forward_button.bind_to_click(lambda: self.step(1))
 
-                # Sets turn status
-                self.status["text"] = "PLAYER's"
-                self.status["fg"] = self.theme.RED
-                self.turn_counter = 0
+        # Leaves the replay, back to startup splash
+        close_button = CustomButton(control_frame, text="✘", width=70, height=40,
+                                    colour=theme.RED, fg=theme.WHITE, active=theme.RED_DIM, bg_canvas=theme.GRAY_LIGHT)
+        close_button.place(x=210, y=101, anchor="se")
+        close_button.bind_to_click(lambda: switch_screen('splash'))
 
-                # Makes the main grid disabled (as it's computer's turn)
-                self.computer_board.disabled = False
-                return ('computer',)
+    ## Moves forward (1) or back (-1) a shot ##
+    # Note: Setting the slider calls seek()
+    def step(self, change):
+        self.scrubber.set(max(0, min(self.position + change, len(self.log))))
 
-    ## Check if all remaining occupied squares are hit – backend ##
-    def check_win(self, override=False):
+    ## Shows the boards as they were after the first 'position' shots ##
+    def seek(self, position):
+        theme = Colours(manager.theme)
+        position = max(0, min(position, len(self.log)))
 
-        # If game is already over, no point in creating
-        # another popup so just returns nothing
-        if self.game_over:
+        if position == self.position:
             return
 
-        # Sets the current result to override
-        result = override
-        bg_colour = self.theme.GREEN_DIM
-
-        # If the length of player ships is 0, make computer the winner
-        for ship in self.player_remaining_ships:
-            if len(ship) > 0: break
-        else:
-
-            # Sets result outcome to computer
-            result = 'computer'
-            print(">>> Player lost!")
-
-            # Increment manager 'loss' stat of current difficulty by 1
-            self.manager.stats[self.difficulty][1] += 1
-            bg_colour = self.theme.RED
+        self.position = position
+        self.log.apply(position, self.game.boards)
 
-        # If the length of computer ships is 0, make player the winner
-        for ship in self.computer_remaining_ships:
-            if len(ship) > 0: break
-        else:
-            result = 'player'
-            print(">>> Player wins!")
-
-            # Increments win stat of current difficulty by 1
-            self.manager.stats[self.difficulty][0] += 1
+        for grid in (self.main_grid, self.small_grid):
+            grid.update_canvas(show_hidden_ships=True)
+            grid.update_progress()
 
+        if position == 0:
+            self.turn_status["text"] = "MOVE 0/{}".format(len(self.log))
+            self.turn_status["fg"] = theme.RED
+            self.show_last_location("––", theme.WHITE)
+            return
 
-        # If player resigns (i.e override = True)
-        if result and result not in ("player", "computer"):
-            print(">>> Player resigns.")
+        turn, shooter, index, result = self.log.event(position - 1)
 
-            # Increments loss stat of current difficulty by 1
-            self.manager.stats[self.difficulty][1] += 1
-            bg_colour = self.theme.RED
+        # Move number, in the colour of who fired it (like the turn label in a game)
+        self.turn_status["text"] = "MOVE {}/{}".format(position, len(self.log))
+        self.turn_status["fg"] = theme.RED if shooter == PLAYER else theme.GOLD
 
-        # If result isn't false (i.e game is over)
-        if result:
+        self.show_last_location(INDEX_TO_ALPHA[index],
+                                {SUNK: theme.RED, HIT: theme.GOLD}.get(result, theme.WHITE))
 
-            # Save information to file
-            manager.export_to_file()
 
-            # Sets game over variable to true
-            self.game_over = True
+### Manager for reading / writing to files for saving ###
+class Manager(object):
 
-            # Makes a result popup appear after 1.2s
-            def popup_appear():
-                # Switches the screen to startup 'splash' window
-                switch_screen('splash')
+    # Files the stats and saved games are kept in (see frameworks/storage.py)
+    STATS_PATH = 'bin/stats.bts'
+    SAVES_FOLDER = 'bin/saves'
 
-                subtext = "Current score: {} wins and {} losses on {} difficulty".format(manager.stats[self.difficulty][0],
-                                                                                         manager.stats[self.difficulty][1],
-                                                                                         self.difficulty.upper())
-                result_popup = Popup(root, text="YOU {}!".format("WON" if (result == "player") else "LOST"),
-                                     bg=bg_colour, fg=self.theme.WHITE, fill=True,
-                                     subtext=subtext)
-            root.after(1200, popup_appear)
+    # Saves file from before each game had a file of its own, moved into SAVES_FOLDER when found
+    SAVES_PATH = 'bin/saves.bts'
 
-        return result
+    # Journal that lets several files be written as one
+    JOURNAL_PATH = 'bin/journal.bts'
 
+    # Every finished game, for the scoreboard (see frameworks/history.py)
+    HISTORY_PATH = 'bin/history.db'
 
-### How the computer decides to play, best to its ability ###
-# Note: Computer gameplay difficulty is determined through the 'game' class
-#####
-class ComputerLogic(object):
     def __init__(self):
 
-        # Alpha-num list of coordinates on the board that have yet to be hit
-        self.grid = []
-
-        for x in range(10):
-            for y in range(10):
-                self.grid.append(CoordUtils.convert_type(x + 1) + str(y + 1))
+        # Any number of saved games, oldest first, read from file only when they're needed
+        self.saved_games = storage.SaveStore(self.SAVES_FOLDER)
 
-        # Alpha-num list of coordinates with ships
-        self.cached_ship_coords = []
-
-    ## Returns a coordinate that has yet to be hit, in alpha-num form ##
-    def make_move(self):
-
-        # If no ships were hit in previous turns, make random move
-        if len(self.cached_ship_coords) == 0:
-            coord = random.choice(self.grid)
-            surrounding = CoordUtils.get_surrounding_coords(coord)
-
-            for surrounding_coord in surrounding:
-
-                # Checks to see if there are any spaces around the coordinate,
-                # since there isn't a point in hitting into an enclosed area
-                if CoordUtils.convert_type(surrounding_coord) in self.grid:
-                    return coord
-            else:
-                return self.make_move()
-
-        # If a ship was recently hit (i.e cached), hit around
-        else:
-
-            # If two or more ship spaces have been hit
-            if len(self.cached_ship_coords) > 1:
-
-                # For every coordinate with a hit ship in it, check around
-                for i in range(0, len(self.cached_ship_coords)):
-                    sides = [CoordUtils.get_side_coord(self.cached_ship_coords[i], 'left'),
-                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'right'),
-                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'top'),
-                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'bottom')]
-
-                    linked_sides = []
-                    converted_sides = []
-
-                    # Checks to see if any sides are linked (i.e contains a previously hit ship)
-                    # and appends it to linked sides. Also creates a copy of sides (converted_sides)
-                    # in which the type has been converted to alpha-num form
-                    for side in sides:
-                        if side: converted_sides.append(CoordUtils.convert_type(side))
-                        else: converted_sides.append(None)
-
-                        if side and CoordUtils.convert_type(side) in self.cached_ship_coords:
-                            linked_sides.append(CoordUtils.convert_type(side))
-
-                    # If the two hit spaces aren't 'connected', choose random side
-                    #   – This shouldn't happen, but if it does... backup redundancy
-                    if len(linked_sides) == 0:
-                        while True:
+        # Note: [0] is wins, [1] is losses
+        self.stats = {mode: [0, 0] for mode in DIFFICULTIES}
 
-                            # Randomly choose a target based on a surrounding coordinate
-                            target = random.choice(converted_sides)
+        # Defines theme as 'default' theme
+        self.theme = "default"
 
-                            # If the target choosen is in the computer's grid
-                            if target and target in self.grid:
-                                return target
+        # Writes the files on its own thread, so the window doesn't wait for the disk
+        self.writer = storage.BackgroundWriter(self.JOURNAL_PATH)
 
-                    # If only one side of the hit square is hit
-                    if len(linked_sides) == 1:
-                        index = converted_sides.index(linked_sides[0])
+        self.history = History(self.HISTORY_PATH)
 
-                        # Checks which side the hit square is on, and hit on the opposite side
-                        if index == 0 and converted_sides[1] in self.grid:
-                            return converted_sides[1]
+    ## Export scores to file ##
+    #   – Files are encoded straight away and written in the background, see close()
+    #   – Saved games are written as they're saved or deleted (see save_game)
+    # Note: Stats and saved games never change together, so they're written separately. Only
+    # unfinished games are saved and stats only change once a game is over, and opening
+    # a save takes it out before the game carries on (its result is counted when it ends)
+    ##
+    def export_to_file(self):
+        self.writer.submit({self.STATS_PATH: storage.encode_stats(self.stats)})
+
+    ## Waits for the files to finish being written, once the window has closed ##
+    def close(self):
+        self.writer.close()
+        self.history.close()
+
+    ## Imports scores and the saved games index to memory ##
+    #   – Stats in the old text format are converted, the originals are kept as *.old
+    #   – Games in a saves file (any format) are moved into the saves folder, the file is kept as *.old
+    #   – Damaged files are moved aside as *.damaged, and start again empty (saved games
+    #     are moved aside one at a time, see storage.SaveStore)
+    ##
+    def import_to_memory(self):
 
-                        elif index == 1 and converted_sides[0] in self.grid:
-                            return converted_sides[0]
+        # Finishes writing the files together if the last write was cut off
+        storage.recover(self.JOURNAL_PATH, [self.STATS_PATH, self.saved_games.index_path])
 
-                        elif index == 2 and converted_sides[3] in self.grid:
-                            return converted_sides[3]
+        stats, legacy = self.load_file(self.STATS_PATH, storage.load_stats)
 
-                        elif index == 3 and converted_sides[2] in self.grid:
-                            return converted_sides[2]
+        if stats is not None:
 
-                        else:
-                            continue
+            # Older stats files won't have every difficulty, so they're kept at 0
+            self.stats.update(stats)
 
-                    # If both sides of the hit square are hit, continue to next hit coord
-                    if len(linked_sides) == 2:
-                        continue
+            if legacy:
+                shutil.copyfile(self.STATS_PATH, self.STATS_PATH + '.old')
+                self.export_to_file()
 
-            surrounding_coords = CoordUtils.get_surrounding_coords(self.cached_ship_coords[0])
+        # Saved games that can't be read are moved aside as they're found, the rest are kept
+        if self.saved_games.load():
+            print("Saved games index was missing or damaged, it's been made again")
+            self.writer.submit({self.saved_games.index_path: self.saved_games.encoded_index()})
 
-            potential_targets = []
+        saves, legacy = self.load_file(self.SAVES_PATH, storage.load_saves)
 
-            # Append to potential_targets if the surrounding coordinate has yet to be hit
-            for coord in surrounding_coords:
-                if CoordUtils.convert_type(coord) in self.grid:
-                    potential_targets.append(CoordUtils.convert_type(coord))
+        if saves is not None:
+            files = {}
+            for save in saves:
+                files.update(self.saved_games.add(save))
 
-            # Hits the potential_target, else make a random choice
-            if len(potential_targets) != 0:
-                target = random.choice(potential_targets)
-                return target
+            # The games have to be in the folder before the old file is moved aside
+            self.writer.submit(files)
+            self.writer.flush()
 
+            # If they couldn't be written the old file stays, they're moved over again next time
+            if self.writer.error:
+                print("Saved games couldn't be moved into {}, {} is kept".format(self.SAVES_FOLDER, self.SAVES_PATH))
             else:
-                self.cached_ship_coords = []
-                return self.make_move()
-
-    ## Note: "square" argument is for a coord in alpha-num form (i.e D4) ##
-    def square_hit(self, coord, sunk=False, ship=None):
-
-        # If the ship was sunk, removes sunk_ship_coordinates from the cache
-        if sunk: self.cached_ship_coords = [coord for coord in self.cached_ship_coords if coord not in ship]
-
-        # If ship wasn't sunk, add the hit coordinate to the cache
-        else: self.cached_ship_coords.append(coord)
-
-        next_move = self.make_move()
-        return next_move
-
-    ## Automatically generates the computer's layout ##
-    def generate_layout(self):
-
-        # Potential ship types
-        ship_lengths = [2, 3, 3, 4, 5]
-        direction = ['right', 'bottom']
-
-        computer_ships = []
-        coords = []
-
-        # As long as there are still ships to make
-        while len(ship_lengths) > 0:
-
-            # Generates random coordinates
-            x = random.randint(1, 10)
-            y = random.randint(1, 10)
-
-            length = random.choice(ship_lengths)
-
-            # Gets the coordinates of the ship that will be created
-            ship_coords = CoordUtils.get_coords_along_side((x, y), random.choice(direction), length)
-
-            # If the new coordinates for the to-be-created ship exist, make it a thing
-            # If they don't exist (i.e obstruct another ship or non-exist grid squares),
-            # restart the loop. Process continues until all ships have been placed.
-            if ship_coords:
-                for coord in ship_coords:
-                    if coord in coords:
-                        break
-                else:
-                    # Adds new ship to temp 'computer_ships' variable
-                    computer_ships.append(ship_coords)
-                    [coords.append(coord) for coord in ship_coords]
-
-                    # Removes the current ship length from the list of possible lengths
-                    ship_lengths.remove(length)
-
-        return computer_ships
-
-    ## Updates the computer's grid memory by removing previously hit spces ##
-    # Note: Coordinates to be in alpha-num form, for setup purposes
-    def set_hit_spaces(self, hit_spaces):
-        for coord in hit_spaces:
-            if coord in self.grid:
-                self.grid.remove(coord)
-
-### Manager for reading / writing to files for saving ###
-class Manager(object):
-    def __init__(self):
-        self.saved_games = []
-
-        # Note: [0] is wins, [1] is losses
-        self.stats = {'easy': [0, 0],
-                      'normal': [0, 0],
-                      'hard': [0, 0],
-                      'master': [0, 0]}
-
-        # Defines theme as 'default' theme
-        self.theme = "default"
-
-    ## Export all saved games (3) and scores to file ##
-    def export_to_file(self):
-
-        # Writes/overwrites stats.bts file with new stats
-        with open('bin/stats.bts', 'w') as file:
-            file.write(str(self.stats))
-
-        # Writes/overwrites saves.bts file with new stats
-        with open('bin/saves.bts', 'w') as file:
-            file.write(str(self.saved_games))
-
-    ## Imports all saved games (3) and scores to memory ##
-    def import_to_memory(self):
-
-        # If stats.bts is a file, import everything from stats
-        if os.path.isfile('bin/stats.bts'):
-            with open('bin/stats.bts', 'r') as file:
-                self.stats = eval(file.read())
-
-        # If saves.bts is a file, import everything from saves
-        if os.path.isfile('bin/saves.bts'):
-            with open('bin/saves.bts', 'r') as file:
-                self.saved_games = eval(file.read())
+                os.replace(self.SAVES_PATH, self.SAVES_PATH + '.old')
+
+        # Scores from before there was a history carry on until they're reset
+        if self.history.is_empty():
+            self.history.import_totals(self.stats)
+
+    ## Loads a file with one of storage's loaders, moving it aside if it's damaged ##
+    # Note: Returns (None, False) if there's no file, or it was damaged
+    def load_file(self, path, load):
+        try:
+            return load(path)
+        except storage.SaveFormatError as error:
+            print("{} can't be read ({}), starting again".format(path, error))
+            os.replace(path, path + '.damaged')
+            return None, False
 
     ## Resets the scores to 0 ##
     def reset_scores(self):
-        self.stats = {'easy': [0, 0],
-                      'normal': [0, 0],
-                      'hard': [0, 0],
-                      'master': [0, 0]}
+        self.stats = {mode: [0, 0] for mode in DIFFICULTIES}
+        self.history.reset()
         self.export_to_file()
 
-    ## Replaces old games if all saves are full ##
-    def save_game(self, game_data):
+    ## Adds a finished game to the history ##
+    def record_game(self, game, result):
+        self.history.record(game, result)
 
-        # If current length of saves is greater than 2 (3 or more), delete oldest
-        if len(self.saved_games) > 2:
-            del self.saved_games[0]
+    ## Adds a saved game, there's no limit on how many ##
+    # Note: The game is encoded now along with its header for the saves screen
+    def save_game(self, game_data):
+        self.writer.submit(self.saved_games.add(game_data))
 
-        # Add new save
-        self.saved_games.append(game_data)
+    ## Deletes the saved game at a position (0 is the oldest) ##
+    def delete_save(self, position):
+        self.writer.submit(self.saved_games.remove(position))
 
 
 if __name__ == "__main__":
@@ -1218,14 +1132,24 @@ if __name__ == "__main__":
 
     # Defines starting layout
     root.wm_geometry("850x600")
-    root.wm_resizable(0, 0)
+    root.wm_minsize(850, 600)
     root.wm_title("Battleships V{:.2f} beta".format(version))
 
     root["bg"] = 'white'
 
+    # Draws the grids, progress bars and ships once per frame, however many events come in
+    scheduler = FrameScheduler(root)
+
+    # Plays the hit flashes, sink ripples and popup fades, all on one timer
+    animator = Animator(root)
+
     # The 'frame' that's displayed on the application window
     current_screen = None
 
+    # Boards grow with the window, rescaled once it stops being resized
+    scale = 1
+    resize_watcher = ResizeWatcher(root, resize_window)
+
     # Makes main window appear as startup splash
     switch_screen('splash')
 
@@ -1233,3 +1157,4 @@ if __name__ == "__main__":
 
     # Exports manager stats and saves to file if application is closed.
     manager.export_to_file()
+    manager.close()
@@ -0,0 +1,186 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Micro-benchmark of the coordinate lookup tables
+# – Cost per computer move (ComputerLogic.make_move)
+# – Cost per full grid redraw (CustomGrid.update_canvas)
+#
+# Compares CoordUtils before (conversions worked out on every call) and
+# after (frameworks/coords.py lookup tables).
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python benchmarks/coords_benchmark.py [--repeat N]
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks import coords, engine
+from frameworks.coords import CoordUtils
+
+
+### CoordUtils as it was before the lookup tables, for comparison ###
+class LegacyCoordUtils(object):
+
+    @classmethod
+    def get_surrounding_coords(cls, coord):
+        surrounding_coords = []
+
+        for side in ['left', 'right', 'top', 'bottom']:
+            side_coord = LegacyCoordUtils.get_side_coord(coord, side)
+
+            if side_coord: surrounding_coords.append(side_coord)
+
+        return surrounding_coords
+
+    @classmethod
+    def get_side_coord(cls, coord, side):
+        if type(coord) is not tuple:
+            coord = LegacyCoordUtils.convert_type(coord)
+
+        x, y = coord[0], coord[1]
+
+        if side == 'left' and x != 1:
+            return (x - 1, y)
+        elif side == 'right' and x != 10:
+            return (x + 1, y)
+        elif side == 'top' and y != 1:
+            return (x, y - 1)
+        elif side == 'bottom' and y != 10:
+            return (x, y + 1)
+        else:
+            return None
+
+    @classmethod
+    def convert_type(cls, letter):
+        CHAR = list("ABCDEFGHIJ")
+        NUM = list("123456789") + ["10"]
+
+        if str(letter)[0].isalpha() and letter[-1].isdigit():
+            coord_x = LegacyCoordUtils.convert_type(letter[0])
+            coord_y = "".join(letter[1:])
+            return (int(coord_x), int(coord_y))
+        elif type(letter) is tuple:
+            return (LegacyCoordUtils.convert_type(letter[0]) + str(letter[1]))
+        elif str(letter).isalpha():
+            return NUM[CHAR.index(letter.upper())]
+        else:
+            return CHAR[letter - 1]
+
+    @classmethod
+    def get_coords_along_side(cls, coord, direction, length):
+        coords = [LegacyCoordUtils.convert_type(coord)]
+        for i in range(length - 1):
+            side_coord = LegacyCoordUtils.get_side_coord(coords[-1], direction)
+
+            if side_coord:
+                coords.append(LegacyCoordUtils.convert_type(side_coord))
+            else:
+                break
+        else:
+            return coords
+
+        return None
+
+
+### Makes a computer logic part way through a game (some misses, a ship being chased) ###
+def midgame_logic(seed):
+    rng = random.Random(seed)
+    logic = engine.ComputerLogic()
+
+    logic.set_hit_spaces(rng.sample(logic.grid, 30))
+    target = rng.choice(logic.grid)
+    logic.square_hit(target)
+
+    return logic
+
+
+### Seconds per make_move call with the given CoordUtils ###
+def time_move(utils, repeat):
+    engine.CoordUtils = utils
+    logics = [midgame_logic(seed) for seed in range(20)]
+
+    try:
+        total = timeit.timeit(lambda: [logic.make_move() for logic in logics], number=repeat)
+    finally:
+        engine.CoordUtils = CoordUtils
+
+    return total / (repeat * len(logics))
+
+
+### The CoordUtils calls CustomGrid.update_canvas makes for one redraw ###
+#   – a letter label for each column, the (x, y) of every square and the
+#     rect lookup for every hit that's replayed onto the board
+#####
+def redraw_coord_work(utils, hits):
+    for y in range(0, 10):
+        for x in range(0, 10):
+            if y == 0:
+                utils.convert_type(x + 1)
+
+            utils.convert_type((x + 1, y + 1))
+
+    for hit_coord in hits:
+        xy = utils.convert_type(hit_coord)
+        utils.convert_type(xy)
+
+
+### Seconds per full redraw with the given CoordUtils ###
+# Note: Uses a real CustomGrid when there's a display, else just the coordinate work
+def time_redraw(utils, repeat):
+    hits = [coords.INDEX_TO_ALPHA[i] for i in range(0, 100, 3)]
+
+    try:
+        import tkinter as tk
+        from frameworks import custom_widgets
+
+        root = tk.Tk()
+    except Exception:
+        total = timeit.timeit(lambda: redraw_coord_work(utils, hits), number=repeat)
+        return total / repeat, "coordinate work only (no display)"
+
+    game = engine.Game()
+    game.add_player_ships(game.computer_logic.generate_layout())
+    game.add_computer_ships(game.computer_logic.generate_layout())
+    for coord in hits:
+        game.game_control(coord, 'computer')
+
+    custom_widgets.CoordUtils = utils
+
+    try:
+        grid = custom_widgets.CustomGrid(root, game=game, owner='computer')
+        total = timeit.timeit(grid.update_canvas, number=repeat)
+    finally:
+        custom_widgets.CoordUtils = CoordUtils
+        root.destroy()
+
+    return total / repeat, "CustomGrid.update_canvas"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks CoordUtils before and after the lookup tables.")
+    parser.add_argument("--repeat", type=int, default=200, help="times each measurement is repeated")
+    args = parser.parse_args()
+
+    move_before = time_move(LegacyCoordUtils, args.repeat)
+    move_after = time_move(CoordUtils, args.repeat)
+
+    redraw_before, what = time_redraw(LegacyCoordUtils, args.repeat)
+    redraw_after, what = time_redraw(CoordUtils, args.repeat)
+
+    print("{:<30}{:>14}{:>14}{:>10}".format("", "before", "after", "speedup"))
+    print("{:<30}{:>11.1f} us{:>11.1f} us{:>9.1f}x".format("per move", move_before * 1e6, move_after * 1e6,
+                                                           move_before / move_after))
+    print("{:<30}{:>11.1f} us{:>11.1f} us{:>9.1f}x".format("per redraw", redraw_before * 1e6, redraw_after * 1e6,
+                                                           redraw_before / redraw_after))
+    print("(redraw measured with {})".format(what))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Latency per mouse event on the setup grid
+# – Square lookups per event, before and after the square index
+# – Hover (hover_selection), unhover (unhover_selection) and click (place_ship)
+#   handlers as they are now, when there's a display
+#
+# Compares CustomGrid.coord_to_rect before (a scan of every square on each
+# call) and after (a direct lookup by square index).
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python benchmarks/grid_benchmark.py [--repeat N] [--length L]
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks.coords import INDEX_TO_XY, XY_TO_INDEX
+
+
+### coord_to_rect as it was before the index, for comparison ###
+def legacy_coord_to_rect(squares, coord):
+    for rect in squares:
+        if rect[1] == coord:
+            return rect
+
+
+### coord_to_rect with the index ###
+def indexed_coord_to_rect(squares, coord):
+    index = XY_TO_INDEX.get(coord)
+
+    return squares[index] if index is not None else None
+
+
+### The coord_to_rect calls one mouse event makes, for a selection starting on a square ###
+#   – one per square under the selection, and one more per square that gets
+#     recoloured (colour_square looked its square up the same way)
+#####
+def event_lookups(lookup, squares, start, length):
+    x, y = start
+    coords = [(x + i, y) for i in range(length)]
+    rects = [lookup(squares, coord) for coord in coords]
+
+    if None not in rects:
+        for coord in coords:
+            lookup(squares, coord)
+
+
+### Seconds per event spent looking squares up, with the given lookup, over every square ###
+def time_lookups(lookup, length, repeat):
+    squares = [(i + 1, INDEX_TO_XY[i]) for i in range(100)]
+    total = timeit.timeit(lambda: [event_lookups(lookup, squares, INDEX_TO_XY[i], length) for i in range(100)],
+                          number=repeat)
+
+    return total / (repeat * 100)
+
+
+### Seconds per event for each setup grid handler, None if there's no display ###
+# Note: Handlers work off the grid's cell states (see CustomGrid.cells), not canvas colours
+def time_handlers(length, repeat):
+    try:
+        import tkinter as tk
+        from frameworks.custom_widgets import CustomGrid
+
+        root = tk.Tk()
+    except Exception:
+        return None
+
+    try:
+        grid = CustomGrid(root, is_game_board=False)
+        grid.selection_length = length
+
+        def sweep(handler):
+            for rect in grid.squares:
+                handler(None, rect)
+
+        def click():
+            for rect in grid.squares:
+                grid.selection_length = length
+                grid.hover_selection(None, rect)
+                grid.place_ship(None, rect)
+
+            grid.selection = []
+            grid.update_canvas()
+
+        return {"hover": timeit.timeit(lambda: sweep(grid.hover_selection), number=repeat) / (repeat * 100),
+                "unhover": timeit.timeit(lambda: sweep(grid.unhover_selection), number=repeat) / (repeat * 100),
+                "hover + click": timeit.timeit(click, number=repeat) / (repeat * 100)}
+    finally:
+        root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks setup grid mouse events before and after the square index.")
+    parser.add_argument("--repeat", type=int, default=200, help="times each measurement is repeated")
+    parser.add_argument("--length", type=int, default=5, help="length of the ship being placed")
+    args = parser.parse_args()
+
+    before = time_lookups(legacy_coord_to_rect, args.length, args.repeat)
+    after = time_lookups(indexed_coord_to_rect, args.length, args.repeat)
+
+    print("{:<30}{:>14}{:>14}{:>10}".format("", "before", "after", "speedup"))
+    print("{:<30}{:>11.1f} us{:>11.1f} us{:>9.1f}x".format("lookups per event", before * 1e6, after * 1e6, before / after))
+
+    handlers = time_handlers(args.length, args.repeat)
+
+    if handlers is None:
+        print("(no display, handlers not measured)")
+        return
+
+    print()
+    for event, seconds in handlers.items():
+        print("{:<30}{:>11.1f} us".format(event + " handler", seconds * 1e6))
+
+
+if __name__ == "__main__":
+    main()
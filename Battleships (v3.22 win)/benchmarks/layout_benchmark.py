@@ -0,0 +1,195 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Throughput and uniformity checks for fleet layout generation
+# – Layouts per second
+# – Per-square occupancy heat maps (all ships, and each ship length)
+# – Chi-square deviation from 'every legal layout equally likely'
+#
+# The reference is an independent sampler that is uniform by construction:
+# each ship is drawn from all of its placements and the whole layout is
+# thrown away if any ships overlap. Occupancy of the generator under test is
+# compared to it square by square with a two-sample chi-square test.
+#
+# Exits with status 1 if throughput or uniformity falls below the limits.
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python benchmarks/layout_benchmark.py [--layouts N] [--generator current|legacy]
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks.bitboard import mask_of, popcount
+from frameworks.coords import CoordUtils
+from frameworks.placements import FLEET, PLACEMENTS, add_to_planes, random_layout_masks
+
+
+### ComputerLogic.generate_layout as it was before placement masks, for comparison ###
+def legacy_layout_masks(rng):
+    ship_lengths = [2, 3, 3, 4, 5]
+    computer_ships = []
+    coords = []
+
+    while len(ship_lengths) > 0:
+        x = rng.randint(1, 10)
+        y = rng.randint(1, 10)
+
+        length = rng.choice(ship_lengths)
+        ship_coords = CoordUtils.get_coords_along_side((x, y), rng.choice(['right', 'bottom']), length)
+
+        if ship_coords:
+            for coord in ship_coords:
+                if coord in coords:
+                    break
+            else:
+                computer_ships.append(ship_coords)
+                [coords.append(coord) for coord in ship_coords]
+                ship_lengths.remove(length)
+
+    return [mask_of(ship) for ship in computer_ships]
+
+
+### Uniform over legal layouts by construction (see top of file) ###
+def reference_layout_masks(rng):
+    while True:
+        occupied = 0
+        masks = []
+
+        for length in FLEET:
+            mask = rng.choice(PLACEMENTS[length])
+
+            if mask & occupied:
+                break
+
+            masks.append(mask)
+            occupied |= mask
+        else:
+            return masks
+
+
+GENERATORS = {'current': random_layout_masks,
+              'legacy': legacy_layout_masks}
+
+
+### Layouts generated per second ###
+def throughput(generator, count, seed):
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    for i in range(count):
+        generator(rng)
+
+    return count / (time.perf_counter() - start)
+
+
+### Occupancy counts per square, for all ships (key 0) and for each length ###
+def occupancy(generator, count, seed):
+    rng = random.Random(seed)
+    planes = {length: [] for length in [0] + sorted(set(FLEET))}
+
+    for i in range(count):
+        occupied = 0
+
+        for mask in generator(rng):
+            add_to_planes(planes[popcount(mask)], mask)
+            occupied |= mask
+
+        add_to_planes(planes[0], occupied)
+
+    # Turns the bit planes back into a count for each square
+    return {length: [sum(((plane >> i) & 1) << bit for bit, plane in enumerate(length_planes)) for i in range(100)]
+            for length, length_planes in planes.items()}
+
+
+### Two-sample chi-square statistic and degrees of freedom for two sets of counts ###
+def chi_square(counts, reference):
+    total, reference_total = sum(counts), sum(reference)
+    k1, k2 = math.sqrt(reference_total / total), math.sqrt(total / reference_total)
+
+    statistic = 0
+    bins = 0
+
+    for a, b in zip(counts, reference):
+        if a + b:
+            statistic += (k1 * a - k2 * b) ** 2 / (a + b)
+            bins += 1
+
+    return statistic, bins - 1
+
+
+### Probability of a chi-square at least this large if both were the same (Wilson–Hilferty) ###
+def p_value(statistic, df):
+    z = ((statistic / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+### Prints a 10 x 10 map of per-square values ###
+def print_map(title, values, fmt):
+    print(title)
+    print("     " + "".join("{:>7}".format(letter) for letter in "ABCDEFGHIJ"))
+
+    for y in range(10):
+        print("{:>4} ".format(y + 1) + "".join(fmt.format(values[y * 10 + x]) for x in range(10)))
+
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checks fleet layout generation for speed and uniformity.")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="current")
+    parser.add_argument("--layouts", type=int, default=100000, help="layouts sampled from each generator")
+    parser.add_argument("--seed", type=int, default=2018)
+    parser.add_argument("--min-rate", type=float, default=2000, help="fail below this many layouts per second")
+    parser.add_argument("--alpha", type=float, default=0.001, help="fail if any test's p-value is below this")
+    args = parser.parse_args()
+
+    generator = GENERATORS[args.generator]
+
+    rate = throughput(generator, args.layouts, args.seed)
+    print("{} generator: {:,.0f} layouts/sec ({:,.1f} million per minute)\n".format(args.generator, rate, rate * 60 / 1e6))
+
+    counts = occupancy(generator, args.layouts, args.seed)
+    reference = occupancy(reference_layout_masks, args.layouts, args.seed + 1)
+
+    print_map("Occupancy, % of layouts with a ship on each square:",
+              [count * 100 / args.layouts for count in counts[0]], "{:>7.1f}")
+    print_map("Difference from uniform reference, percentage points:",
+              [(a - b) * 100 / args.layouts for a, b in zip(counts[0], reference[0])], "{:>+7.2f}")
+
+    # Bonferroni correction, one test for all ships plus one per length
+    alpha = args.alpha / len(counts)
+    failed = []
+
+    print("{:<14}{:>12}{:>6}{:>12}".format("ships", "chi-square", "df", "p-value"))
+    for length in sorted(counts):
+        statistic, df = chi_square(counts[length], reference[length])
+        p = p_value(statistic, df)
+
+        print("{:<14}{:>12.1f}{:>6}{:>12.2g}".format("all" if length == 0 else "length {}".format(length), statistic, df, p))
+        if p < alpha:
+            failed.append("occupancy of {} differs from uniform (p = {:.2g})".format("all ships" if length == 0 else "length {}".format(length), p))
+
+    if rate < args.min_rate:
+        failed.append("throughput {:,.0f} layouts/sec is below {:,.0f}".format(rate, args.min_rate))
+
+    print()
+    for reason in failed:
+        print("FAIL: " + reason)
+
+    if failed:
+        sys.exit(1)
+
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
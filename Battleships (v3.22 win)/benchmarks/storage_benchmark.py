@@ -0,0 +1,139 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Load and save costs for saved games (frameworks/storage.py)
+# – SaveStore: an index of headers (index.bts) plus a file for each save.
+#   Loading reads only the index, games are decoded when they're opened
+# – Single saves.bts file, which every save and delete rewrote whole
+#   (only read now, to move old saves into the folder)
+#
+# Loading is what happens at startup (Manager.import_to_memory). 'write'
+# is the bytes handed to the writer for one add() or remove(), 'file size'
+# is what every save or delete used to rewrite.
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python benchmarks/storage_benchmark.py [--counts 3 100 1000] [--repeat N]
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks import storage
+from frameworks.engine import DIFFICULTIES, Game, play_headless
+
+
+### Saved games from seeded headless games, stopped part way through ###
+def sample_saves(count):
+    saves = []
+
+    for seed in range(count):
+        game = Game(seed=seed)
+        game.set_difficulty(DIFFICULTIES[seed % len(DIFFICULTIES)])
+        play_headless(game)
+
+        data = game.get_data_summary()
+        data["date"] = datetime.datetime(2018, 7, 26, 12, 0, 0, seed)
+
+        # Cuts the shots back to about half way, like a game that was saved mid way
+        data["player_hit"] = data["player_hit"][:len(data["player_hit"]) // 2]
+        data["computer_hit"] = data["computer_hit"][:len(data["computer_hit"]) // 2]
+        saves.append(data)
+
+    return saves
+
+
+### Saves folder with every save in it, written like the game does ###
+def make_store(folder, saves, journal_path):
+    store = storage.SaveStore(folder)
+    os.makedirs(folder, exist_ok=True)
+
+    files = {}
+    for save in saves:
+        files.update(store.add(save))
+
+    storage.write_files(files, journal_path)
+    return store
+
+
+### Loads a saves folder, only the index is read ###
+def store_load(folder):
+    store = storage.SaveStore(folder)
+    store.load()
+    return store
+
+
+### Loads a saves folder and reads every header, like paging through the saves screen ###
+def store_load_headers(folder):
+    store = store_load(folder)
+    return [store.header(position) for position in range(len(store))]
+
+
+### Adds a save and writes its files, then takes it off again (so the store is the same each time) ###
+def store_add(store, save, journal_path):
+    storage.write_files(store.add(save), journal_path)
+    storage.write_files(store.remove(len(store) - 1), journal_path)
+
+
+def folder_size(folder):
+    return sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
+
+
+### Seconds per call of func, best of 3 ###
+def best(func, repeat):
+    return min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks loading and saving games in the saves folder "
+                                                 "against the old single saves file.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[3, 100, 1000], help="numbers of saved games")
+    parser.add_argument("--repeat", type=int, default=20, help="times each measurement is repeated")
+    args = parser.parse_args()
+
+    print("{:>7}{:>11}{:>11}{:>12}{:>14}{:>12}{:>12}{:>13}{:>12}{:>12}".format(
+        "games", "index", "folder", "load", "load headers", "add write", "del write", "add+del", "file load",
+        "file size"))
+
+    with tempfile.TemporaryDirectory() as root:
+        journal_path = os.path.join(root, "journal.bts")
+
+        for count in args.counts:
+            saves = sample_saves(count + 1)
+            extra = saves.pop()
+
+            folder = os.path.join(root, "saves{}".format(count))
+            store = make_store(folder, saves, journal_path)
+
+            file_path = os.path.join(root, "saves{}.bts".format(count))
+            storage.save_saves(file_path, saves)
+
+            loaded = store_load(folder)
+            assert [dict(loaded[position]) for position in range(len(loaded))] == saves
+
+            # Bytes one add() and one remove() hand over, against rewriting the whole file
+            add_bytes = sum(len(data) for data in store.add(extra).values())
+            remove_bytes = sum(len(data) for data in store.remove(len(store) - 1).values())
+
+            # Sizes before adding and removing is timed, removed saves' files stay until the next load
+            sizes = [os.path.getsize(store.index_path), folder_size(folder), os.path.getsize(file_path)]
+
+            times = [best(lambda: store_load(folder), args.repeat),
+                     best(lambda: store_load_headers(folder), args.repeat),
+                     best(lambda: store_add(store, extra, journal_path), args.repeat),
+                     best(lambda: storage.load_saves(file_path), args.repeat)]
+
+            print("{:>7}{:>9.1f}kB{:>9.1f}kB{:>10.2f}ms{:>12.2f}ms{:>10.1f}kB{:>10.1f}kB{:>11.2f}ms{:>10.2f}ms{:>10.1f}kB".format(
+                count, sizes[0] / 1000, sizes[1] / 1000,
+                times[0] * 1000, times[1] * 1000, add_bytes / 1000, remove_bytes / 1000, times[2] * 1000,
+                times[3] * 1000, sizes[2] / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Compact board representation for the engine and widgets
+# – Bitboard (occupied / hit / miss / sunk layers)
+#
+# Each layer is a 100-bit integer, square (x, y) is bit (y - 1) * 10 + (x - 1),
+# so squares are numbered left to right then top to bottom like the grids.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+from .coords import INDEX_TO_ALPHA, SURROUNDING, index_of
+
+
+# Every square on the board set
+FULL = (1 << 100) - 1
+
+# Names of the layers a Bitboard holds
+LAYERS = ('occupied', 'hit', 'miss', 'sunk')
+
+
+### Number of set bits (i.e squares) in a mask ###
+def popcount(bits):
+    return bin(bits).count("1")
+
+
+### Single bit mask of a coordinate given in (x, y) or alpha-num form ###
+def bit(coord):
+    return 1 << index_of(coord)
+
+
+### Mask of all coordinates in an iterable (i.e a ship) ###
+def mask_of(coords):
+    mask = 0
+    for coord in coords:
+        mask |= 1 << index_of(coord)
+
+    return mask
+
+
+### Alpha-num coordinates of every set bit in a mask, in index order ###
+def coords_of(mask):
+    coords = []
+
+    while mask:
+        low = mask & -mask
+        index = low.bit_length() - 1
+        coords.append(INDEX_TO_ALPHA[index])
+        mask ^= low
+
+    return coords
+
+
+# Mask of the squares left, right, above and below each square
+NEIGHBOURS = tuple(sum(1 << side for side in SURROUNDING[i]) for i in range(100))
+
+
+### A single 10 x 10 board, with one bit mask per layer ###
+#   – ships are kept as masks too (same order as the ships they were made from)
+#   – coordinates can be given in (x, y) or alpha-num form
+#####
+class Bitboard(object):
+    def __init__(self, ships=(), hits=()):
+        self.occupied = 0
+        self.hit = 0
+        self.miss = 0
+        self.sunk = 0
+
+        # One mask for each ship on the board
+        self.ships = []
+
+        for ship in ships:
+            self.add_ship(ship)
+
+        for coord in hits:
+            self.fire(coord)
+
+    ## Places a ship (list of coordinates) on the board ##
+    def add_ship(self, coords):
+        mask = mask_of(coords)
+
+        self.ships.append(mask)
+        self.occupied |= mask
+
+    ## Sets a coordinate on one of the layers ##
+    def set(self, layer, coord):
+        setattr(self, layer, getattr(self, layer) | bit(coord))
+
+    ## Checks whether a coordinate is set on one of the layers ##
+    def test(self, layer, coord):
+        return getattr(self, layer) >> index_of(coord) & 1 == 1
+
+    ## Squares that have been fired at, hit or miss ##
+    @property
+    def fired(self):
+        return self.hit | self.miss
+
+    def is_fired(self, coord):
+        return self.fired >> index_of(coord) & 1 == 1
+
+    ## Checks whether all the squares around a coordinate have been fired at ##
+    def is_enclosed(self, coord):
+        return NEIGHBOURS[index_of(coord)] & ~(self.hit | self.miss) == 0
+
+    ## Index of the ship on a coordinate, None if the square is empty ##
+    def ship_at(self, coord):
+        mask = bit(coord)
+
+        if self.occupied & mask:
+            for i in range(len(self.ships)):
+                if self.ships[i] & mask:
+                    return i
+
+        return None
+
+    ## Fires at a coordinate, returns (ship index or None, whether ship was sunk) ##
+    def fire(self, coord):
+        mask = bit(coord)
+
+        if not self.occupied & mask:
+            self.miss |= mask
+            return (None, False)
+
+        self.hit |= mask
+        ship_index = self.ship_at(coord)
+        ship = self.ships[ship_index]
+
+        # Every square of the ship has been hit
+        if ship & ~self.hit == 0:
+            self.sunk |= ship
+            return (ship_index, True)
+
+        return (ship_index, False)
+
+    ## Copies what's known from firing at another board (i.e not the ships) ##
+    def load_shots(self, board):
+        self.hit = board.hit
+        self.miss = board.miss
+        self.sunk = board.sunk
+
+    ## Sets the hit, miss and sunk layers from a mask of every square fired at ##
+    def set_fired(self, fired):
+        self.hit = fired & self.occupied
+        self.miss = fired & ~self.occupied
+        self.sunk = 0
+
+        for ship in self.ships:
+            if ship & ~self.hit == 0:
+                self.sunk |= ship
+
+    ## Number of ship squares that have yet to be hit ##
+    def remaining(self):
+        return popcount(self.occupied & ~self.hit)
+
+    ## Checks if every ship on the board is sunk ##
+    def all_sunk(self):
+        return self.occupied & ~self.hit == 0
+
+    ## Fraction (0 – 1) of ship squares that have been hit ##
+    def progress(self):
+        total = popcount(self.occupied)
+
+        if total == 0:
+            return 0
+
+        return popcount(self.occupied & self.hit) / total
@@ -0,0 +1,193 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Created 11th June 2018, Raymond Feng
+#
+# Purpose: Coordinate helpers shared by the game engine and the widgets
+# – Lookup tables (index, (x, y) and alpha-num forms, neighbours)
+# – CoordUtils
+#
+# Note: Must not import tkinter, so the engine can run headless
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+from types import MappingProxyType
+
+
+# Letters used for the x coordinate, A is 1 and J is 10
+LETTERS = "ABCDEFGHIJ"
+
+# Sides of a square, in the order get_surrounding_coords returns them
+SIDES = ('left', 'right', 'top', 'bottom')
+
+
+### Lookup tables, built once at import and read-only afterwards ###
+#   – Squares are indexed 0 – 99, left to right then top to bottom
+#   – (x, y) and alpha-num coordinates are 1-based, i.e (4, 1) is D1
+#####
+
+# Index -> (x, y) and index -> alpha-num (i.e 3 -> (4, 1) -> "D1")
+INDEX_TO_XY = tuple((i % 10 + 1, i // 10 + 1) for i in range(100))
+INDEX_TO_ALPHA = tuple(LETTERS[x - 1] + str(y) for x, y in INDEX_TO_XY)
+
+# (x, y) -> index and alpha-num -> index
+XY_TO_INDEX = MappingProxyType({INDEX_TO_XY[i]: i for i in range(100)})
+ALPHA_TO_INDEX = MappingProxyType({INDEX_TO_ALPHA[i]: i for i in range(100)})
+
+# (x, y) <-> alpha-num
+XY_TO_ALPHA = MappingProxyType({INDEX_TO_XY[i]: INDEX_TO_ALPHA[i] for i in range(100)})
+ALPHA_TO_XY = MappingProxyType({INDEX_TO_ALPHA[i]: INDEX_TO_XY[i] for i in range(100)})
+
+# Index of the square on each side of a square, None if it's off the board
+NEIGHBOURS = MappingProxyType({
+    'left': tuple(i - 1 if i % 10 != 0 else None for i in range(100)),
+    'right': tuple(i + 1 if i % 10 != 9 else None for i in range(100)),
+    'top': tuple(i - 10 if i >= 10 else None for i in range(100)),
+    'bottom': tuple(i + 10 if i < 90 else None for i in range(100))})
+
+# Indexes of all the squares around a square, in SIDES order
+SURROUNDING = tuple(tuple(NEIGHBOURS[side][i] for side in SIDES if NEIGHBOURS[side][i] is not None)
+                    for i in range(100))
+
+# Single letter <-> number, in the forms convert_type returns (i.e "A" -> "1", 1 -> "A")
+LETTER_TO_NUM = MappingProxyType({LETTERS[i]: str(i + 1) for i in range(10)})
+NUM_TO_LETTER = MappingProxyType({i + 1: LETTERS[i] for i in range(10)})
+
+
+### Index (0 – 99) of a coordinate given in (x, y) or alpha-num form ###
+def index_of(coord):
+    if type(coord) is tuple:
+        return XY_TO_INDEX[coord]
+
+    return ALPHA_TO_INDEX[coord]
+
+
+### Collection of useful functions to perform on coordinates in any form ###
+# Note: Kept for compatibility, the lookup tables above are used wherever possible
+#####
+class CoordUtils(object):
+
+    # Coordinate given in (x, y) or alpha-num form, returned in (x, y) form
+    @classmethod
+    def get_surrounding_coords(cls, coord):
+        index = XY_TO_INDEX.get(coord) if type(coord) is tuple else ALPHA_TO_INDEX.get(coord)
+
+        if index is not None:
+            return [INDEX_TO_XY[side_index] for side_index in SURROUNDING[index]]
+
+        surrounding_coords = []
+
+        sides = ['left', 'right', 'top', 'bottom']
+
+        for side in sides:
+            side_coord = CoordUtils.get_side_coord(coord, side)
+
+            if side_coord: surrounding_coords.append(side_coord)
+
+        return surrounding_coords
+
+    # Get the coordinate in each position, returned in (x, y) form
+    @classmethod
+    def get_side_coord(cls, coord, side):
+        index = XY_TO_INDEX.get(coord) if type(coord) is tuple else ALPHA_TO_INDEX.get(coord)
+
+        if index is not None and side in NEIGHBOURS:
+            side_index = NEIGHBOURS[side][index]
+            return INDEX_TO_XY[side_index] if side_index is not None else None
+
+        if type(coord) is not tuple:
+            coord = CoordUtils.convert_type(coord)
+
+        x, y = coord[0], coord[1]
+
+        if side == 'left' and x != 1:
+            return (x - 1, y)
+
+        elif side == 'right' and x != 10:
+            return (x + 1, y)
+
+        elif side == 'top' and y != 1:
+            return (x, y - 1)
+
+        elif side == 'bottom' and y != 10:
+            return (x, y + 1)
+
+        # Conditions for else... either side is not defined, OR no coordinate
+        else:
+            return None
+
+    # Converts input coordinate into a different form.
+    # A -> 1    1 -> A      A1 -> (1, 1)    (1, 1) –> A1
+    @classmethod
+    def convert_type(cls, letter):
+
+        # Every coordinate on the board is in a lookup table
+        if type(letter) is tuple:
+            if letter in XY_TO_ALPHA:
+                return XY_TO_ALPHA[letter]
+
+        elif type(letter) is int:
+            if letter in NUM_TO_LETTER:
+                return NUM_TO_LETTER[letter]
+
+        elif letter in ALPHA_TO_XY:
+            return ALPHA_TO_XY[letter]
+
+        elif letter in LETTER_TO_NUM:
+            return LETTER_TO_NUM[letter]
+
+        # Anything else (i.e lowercase letters) is converted the long way
+        CHAR = list("ABCDEFGHIJ")
+
+        NUM = list("123456789") + ["10"]
+
+
+        # If coord in alpha-num form (i.e D1)
+        if str(letter)[0].isalpha() and letter[-1].isdigit():
+            coord_x = CoordUtils.convert_type(letter[0])
+            coord_y = "".join(letter[1:])
+
+            return (int(coord_x), int(coord_y))
+
+        # If coord in (x, y) form
+        elif type(letter) is tuple:
+            return (CoordUtils.convert_type(letter[0]) + str(letter[1]))
+
+        # If given single letter (i.e A)
+        elif str(letter).isalpha():
+            return NUM[CHAR.index(letter.upper())]
+
+        # If letter is number
+        else:
+            return CHAR[letter - 1]
+
+    # Coordinates of a ship starting at coord, None if it doesn't fit on the board
+    @classmethod
+    def get_coords_along_side(cls, coord, direction, length):
+        index = XY_TO_INDEX.get(coord) if type(coord) is tuple else None
+
+        if index is not None and direction in NEIGHBOURS:
+            coords = [INDEX_TO_ALPHA[index]]
+
+            for i in range(length - 1):
+                index = NEIGHBOURS[direction][index]
+
+                if index is None:
+                    return None
+
+                coords.append(INDEX_TO_ALPHA[index])
+
+            return coords
+
+        coords = [CoordUtils.convert_type(coord)]
+        for i in range(length - 1):
+            side_coord = CoordUtils.get_side_coord(coords[-1], direction)
+
+            if side_coord:
+                coords.append(CoordUtils.convert_type(side_coord))
+            else:
+                break
+        else:
+            return coords
+
+        return None
@@ -9,7 +9,12 @@
 # - Grid (10 x 10)
 # - Buttons
 # - Progress Bar (vertical)
+# – FrameScheduler (batches canvas changes per frame)
+# – Animator, Tween (hit flashes, sink ripples and popup fades on one shared timer)
+# – ResizeWatcher (debounced window resizes)
+# – GridGeometry (where a grid's squares and labels go, for each size)
 # – CustomLongText
+# – BoardThumbnail
 # – CoordUtils
 # – Popup
 # – Ship
@@ -19,147 +24,84 @@
 
 import tkinter as tk
 import copy
+import functools
 import platform
+import time
+
+from .coords import INDEX_TO_XY, XY_TO_INDEX, CoordUtils, index_of
+from .bitboard import FULL, coords_of, mask_of
+from .placements import PLACEMENT_MASKS, valid_starts
 
 
 # Set to true if operating system is windows
 windows = True if (platform.system() == "Windows") else False
 
+# States a square on a CustomGrid can be in (see CustomGrid.cells)
+EMPTY = 'empty'
+HOVER = 'hover'
+PLACED = 'placed'
+ORIGIN = 'origin'
+HIT = 'hit'
+MISS = 'miss'
+SUNK = 'sunk'
 
-### Creates a rounded rectangle, with corner dimensions format ###
-#   - canvas defines parent body
-#   -  x1, y1 (first corner), x2, y2 (second corner), r defines corner radius
-#   - colour is for the shape's colour
-#   - tag is for any special tags
-#   - bottom_hidden=True makes no rounding on bottom border
-#####
-def rounded_rect(canvas, x1, y1, x2, y2, r, colour, tag=None, bottom_hidden=False):
-
-    # All the elements of
-    elements = []
 
-    if str(r).isdigit():
-        rad = (r, r, r, r)
-    elif len(r) == 2:
-        rad = (r[0], r[0], r[1], r[1])
-    elif len(r) == 4:
-        rad = (r[0], r[1], r[2], r[3])
+# Number of rounded rectangle shapes kept, see rounded_rect_shape
+# Note: A tweening progress bar is a new height every frame, so the oldest shapes are let go
+SHAPE_CACHE_SIZE = 256
 
-    # Top Left
-    elements.append(canvas.create_arc(x1, y1, x1+r, y1+r,
-                                      start=90, extent=90, style=tk.PIESLICE,
-                                      fill=colour, outline=colour))
 
-    # Top Right
-    elements.append(canvas.create_arc(x2-r, y1, x2, y1+r,
-                                      start=0, extent=90, style=tk.PIESLICE,
-                                      fill=colour, outline=colour))
-
-    # Bottom Left
-    elements.append(canvas.create_arc(x1, y2-r, x1+r, y2,
-                                      start=180, extent=90, style=tk.PIESLICE,
-                                      fill=colour, outline=colour))
-
-    # Bottom Right
-    elements.append(canvas.create_arc(x2-r, y2-r, x2, y2,
-                                      start=270, extent=90, style=tk.PIESLICE,
-                                      fill=colour, outline=colour))
+### Points of a rounded rectangle at (0, 0), for a smoothed polygon (see rounded_rect_coords) ###
+#   - each corner is its point once between two doubled points r/2 along the sides,
+#     so the spline curves round the corner and the sides stay straight (r=0 gives a square corner)
+#   - r is a number or a tuple (not a list, it's part of the cache key)
+#####
+@functools.lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def rounded_rect_shape(width, height, r, bottom_hidden):
 
-    elements.append(canvas.create_rectangle(x1+r/2, y1, x2-r/2+1, y2+1, fill=colour, width=0))
-    elements.append(canvas.create_rectangle(x1, y1+r/2, x2+1, y2-r/2+1, fill=colour, width=0))
+    # Corner diameters: top left, top right, bottom right, bottom left
+    if isinstance(r, (int, float)):
+        rad = [r, r, r, r]
+    elif len(r) == 2:
+        rad = [r[0], r[0], r[1], r[1]]
+    else:
+        rad = list(r)
 
     if bottom_hidden:
-        bottom_edge = canvas.create_rectangle(x1, y2 - r/2,
-                                              x2, y2 + r/2,
-                                              fill=colour, width=0)
-        elements.append(bottom_edge)
+        rad[2] = rad[3] = 0
 
-    return elements
+    corners = ((0, 0, 1, 0, 0, 1), (width, 0, 0, 1, -1, 0),
+               (width, height, -1, 0, 0, -1), (0, height, 0, -1, 1, 0))
 
+    # Each corner goes (point on the way in x2, corner, point on the way out x2), clockwise from the top left
+    points = []
+    for (x, y, out_x, out_y, in_x, in_y), d in zip(corners, rad):
+        half = d / 2
+        points += [x + in_x * half, y + in_y * half] * 2 + [x, y] + [x + out_x * half, y + out_y * half] * 2
 
-### Collection of useful functions to perform on coordinates in any form ###
-class CoordUtils(object):
+    return tuple(points)
 
-    # Coordinate given in (x, y) or alpha-num form, returned in (x, y) form
-    @classmethod
-    def get_surrounding_coords(cls, coord):
-        surrounding_coords = []
 
-        sides = ['left', 'right', 'top', 'bottom']
+### Points of a rounded rectangle, for a smoothed polygon (same arguments as rounded_rect) ###
+# Note: Sizes are rounded to whole pixels, so shapes are only worked out once for each size
+def rounded_rect_coords(x1, y1, x2, y2, r, bottom_hidden=False):
+    shape = rounded_rect_shape(round(x2 - x1), round(y2 - y1), r if isinstance(r, (int, float)) else tuple(r),
+                               bottom_hidden)
 
-        for side in sides:
-            side_coord = CoordUtils.get_side_coord(coord, side)
-
-            if side_coord: surrounding_coords.append(side_coord)
-
-        return surrounding_coords
-
-    # Get the coordinate in each position, returned in (x, y) form
-    @classmethod
-    def get_side_coord(cls, coord, side):
-        if type(coord) is not tuple:
-            coord = CoordUtils.convert_type(coord)
+    return [point + (x1 if i % 2 == 0 else y1) for i, point in enumerate(shape)]
 
-        x, y = coord[0], coord[1]
 
-        if side == 'left' and x != 1:
-            return (x - 1, y)
-
-        elif side == 'right' and x != 10:
-            return (x + 1, y)
-
-        elif side == 'top' and y != 1:
-            return (x, y - 1)
-
-        elif side == 'bottom' and y != 10:
-            return (x, y + 1)
-
-        # Conditions for else... either side is not defined, OR no coordinate
-        else:
-            return None
-
-    # Converts input coordinate into a different form.
-    # A -> 1    1 -> A      A1 -> (1, 1)    (1, 1) –> A1
-    @classmethod
-    def convert_type(cls, letter):
-        CHAR = list("ABCDEFGHIJ")
-
-        NUM = list("123456789") + ["10"]
-
-
-        # If coord in alpha-num form (i.e D1)
-        if str(letter)[0].isalpha() and letter[-1].isdigit():
-            coord_x = CoordUtils.convert_type(letter[0])
-            coord_y = "".join(letter[1:])
-
-            return (int(coord_x), int(coord_y))
-
-        # If coord in (x, y) form
-        elif type(letter) is tuple:
-            return (CoordUtils.convert_type(letter[0]) + str(letter[1]))
-
-        # If given single letter (i.e A)
-        elif str(letter).isalpha():
-            return NUM[CHAR.index(letter.upper())]
-
-        # If letter is number
-        else:
-            return CHAR[letter - 1]
-
-    @classmethod
-    def get_coords_along_side(cls, coord, direction, length):
-        coords = [CoordUtils.convert_type(coord)]
-        for i in range(length - 1):
-            side_coord = CoordUtils.get_side_coord(coords[-1], direction)
-
-            if side_coord:
-                coords.append(CoordUtils.convert_type(side_coord))
-            else:
-                break
-        else:
-            return coords
-
-        return None
+### Creates a rounded rectangle, with corner dimensions format ###
+#   - canvas defines parent body
+#   -  x1, y1 (first corner), x2, y2 (second corner), r defines corner diameter
+#   - colour is for the shape's colour
+#   - tag is for any special tags
+#   - bottom_hidden=True makes no rounding on bottom border
+#   - returns the one canvas item (a smoothed polygon), recolour or move it with itemconfigure / coords
+#####
+def rounded_rect(canvas, x1, y1, x2, y2, r, colour, tag=None, bottom_hidden=False):
+    return canvas.create_polygon(rounded_rect_coords(x1, y1, x2, y2, r, bottom_hidden),
+                                 smooth=True, fill=colour, outline=colour, tags=tag)
 
 
 ### Class of all the colours used with colour themes ###
@@ -173,6 +115,7 @@ class Colours(object):
             self.BLACK = "#303030"
 
             self.GRAY_BRIGHT = "#EEE"
+            self.GRAY_PALE = "#E0E0E0"
             self.GRAY_LIGHT = "#D0D0D0"
             self.GRAY = "#9E9E9E"
             self.GRAY_DARK = "#707070"
@@ -204,7 +147,294 @@ class Colours(object):
             self.BLUE = "#20B8CC"
 
             self.GRADIENT = [self.GREEN, self.GOLD,
-                             self.RED, "purple"]
+                             self.RED, "purple", self.BLACK]
+
+
+### Collects canvas changes and draws them once per frame ###
+#   – widget is any widget, its after/after_idle calls are used for timing
+#   – interval=None draws once Tk is next idle, else at most every interval ms (16 is about 60 Hz)
+#   – configure() queues options for a canvas item, later options for the
+#     same item replace earlier ones
+#   – call() queues a function (i.e a widget's redraw) under a key, only the
+#     last function queued under each key is called
+#   – Widgets opt in by being given a scheduler, without one they draw straight away
+#####
+class FrameScheduler(object):
+    def __init__(self, widget, interval=None):
+        self.widget = widget
+        self.interval = interval
+
+        # Options waiting to be set, keyed (canvas, item)
+        self.pending_items = {}
+
+        # Functions waiting to be called, keyed by what they were queued with
+        self.pending_calls = {}
+
+        # Id of the after call for the next frame, None if nothing is waiting
+        self.scheduled = None
+
+    ## Queues options to be set on a canvas item ##
+    def configure(self, canvas, item, **options):
+        self.pending_items.setdefault((canvas, item), {}).update(options)
+        self.schedule()
+
+    ## Queues a function to be called, replacing any queued under the same key ##
+    def call(self, key, func):
+        self.pending_calls[key] = func
+        self.schedule()
+
+    ## Makes sure the next frame is coming ##
+    def schedule(self):
+        if self.scheduled is not None:
+            return
+
+        if self.interval is None:
+            self.scheduled = self.widget.after_idle(self.flush)
+        else:
+            self.scheduled = self.widget.after(self.interval, self.flush)
+
+    ## Draws everything that's been queued ##
+    # Note: Widgets destroyed since their changes were queued are skipped
+    def flush(self):
+        self.scheduled = None
+
+        calls, self.pending_calls = self.pending_calls, {}
+        items, self.pending_items = self.pending_items, {}
+
+        for func in calls.values():
+            try:
+                func()
+            except tk.TclError:
+                pass
+
+        for (canvas, item), options in items.items():
+            try:
+                canvas.itemconfigure(item, **options)
+            except tk.TclError:
+                pass
+
+
+# RGB (0 – 65535 each) of colours already looked up, see blend
+rgb_cache = {}
+
+
+### Eases a tween's progress (0 – 1) out, quick at first then slowing into place ###
+def ease_out(t):
+    return 1 - (1 - t) ** 2
+
+
+### Colour part way (t, 0 – 1) from one colour to another, as '#rrggbb' ###
+#   – colours can be anything tkinter takes (names or hex), widget is used to look them up
+#####
+def blend(widget, start, end, t):
+    # The ends are given back as they are, so a finished tween leaves the exact colour it was heading for
+    if t <= 0:
+        return start
+    if t >= 1:
+        return end
+
+    for colour in (start, end):
+        if colour not in rgb_cache:
+            rgb_cache[colour] = widget.winfo_rgb(colour)
+
+    return "#" + "".join("{:02x}".format(round(a + (b - a) * t) >> 8)
+                         for a, b in zip(rgb_cache[start], rgb_cache[end]))
+
+
+### One thing being animated, played by an Animator ###
+#   – func(t) draws it t (0 – 1) of the way through, easing is up to func
+#   – starts 'delay' ms after it's added, and lasts 'duration' ms
+#   – on_done() is called once it's been drawn at 1, or its widget was destroyed
+#####
+class Tween(object):
+    def __init__(self, func, duration, delay=0, on_done=None):
+        self.func = func
+        self.duration = duration
+        self.delay = delay
+        self.on_done = on_done
+
+        # When it starts (perf_counter seconds) and the key it was added with, set by Animator.add
+        self.start = None
+        self.key = None
+
+    ## Draws the tween where it should be at 'now', returns whether it's finished ##
+    def step(self, now):
+        t = min(1, (now - self.start) * 1000 / self.duration) if self.duration else 1
+
+        try:
+            self.func(t)
+        except tk.TclError:
+            return True
+
+        return t >= 1
+
+
+### Plays Tweens, every one of them on a single shared timer ###
+#   – each frame draws the running tweens where they should be by now, so a frame
+#     that comes late jumps straight there (the frames in between are dropped)
+#   – a frame stops once it's taken 'budget' ms, the tweens it didn't get to go first
+#     next frame, so events (i.e clicks on a grid) never wait long behind an effect
+#   – the timer only runs while there are tweens, and sleeps until a delayed one starts
+#   – a tween added with a key replaces any still running under the same key
+#####
+class Animator(object):
+    def __init__(self, widget, interval=16, budget=8):
+        self.widget = widget
+        self.interval = interval
+        self.budget = budget
+
+        # Tweens in the order they're drawn, and the tween running under each key
+        self.tweens = []
+        self.keys = {}
+
+        # Id of the after call for the next frame and when it's due, None if nothing is waiting
+        self.scheduled = None
+        self.due = None
+
+    ## Starts a tween, returns it ##
+    def add(self, tween, key=None):
+        if key is not None:
+            self.cancel(key)
+            self.keys[key] = tween
+            tween.key = key
+
+        tween.start = time.perf_counter() + tween.delay / 1000
+        self.tweens.append(tween)
+        self.schedule(tween.delay)
+
+        return tween
+
+    ## Stops the tween running under a key (if there is one), it's left as it was last drawn ##
+    def cancel(self, key):
+        tween = self.keys.pop(key, None)
+
+        if tween in self.tweens:
+            self.tweens.remove(tween)
+
+    ## Makes sure a frame is coming within 'delay' ms ##
+    def schedule(self, delay):
+        due = time.perf_counter() + delay / 1000
+
+        if self.scheduled is not None:
+            if self.due <= due:
+                return
+
+            self.widget.after_cancel(self.scheduled)
+
+        self.due = due
+        self.scheduled = self.widget.after(max(1, round(delay)), self.tick)
+
+    ## Draws a frame ##
+    def tick(self):
+        self.scheduled = None
+
+        now = time.perf_counter()
+        deadline = now + self.budget / 1000
+
+        for tween in list(self.tweens):
+            if time.perf_counter() > deadline:
+                break
+
+            if tween.start > now:
+                continue
+
+            # Drawn tweens go to the back, behind any this frame didn't get to
+            self.tweens.remove(tween)
+
+            if tween.step(now):
+                self.finish(tween)
+            else:
+                self.tweens.append(tween)
+
+        if self.tweens:
+            next_start = min(tween.start for tween in self.tweens)
+            self.schedule(max(self.interval, (next_start - time.perf_counter()) * 1000))
+
+    # Forgets a finished tween and calls its on_done
+    def finish(self, tween):
+        if tween.key is not None and self.keys.get(tween.key) is tween:
+            del self.keys[tween.key]
+
+        if tween.on_done:
+            try:
+                tween.on_done()
+            except tk.TclError:
+                pass
+
+
+### Calls a function with a widget's new size once it stops changing ###
+#   – widget is usually the root window, only its own <Configure> events count
+#     (the root also gets one for every widget inside it)
+#   – func(width, height) is called 'delay' ms after the last change, once however
+#     many events come in while the window is being dragged, and only if the size changed
+#####
+class ResizeWatcher(object):
+    def __init__(self, widget, func, delay=100):
+        self.widget = widget
+        self.func = func
+        self.delay = delay
+
+        # Size func was last called with, and id of the after call waiting to call it
+        self.size = None
+        self.pending = None
+
+        self.widget.bind("<Configure>", self.configure, add='+')
+
+    def configure(self, event):
+        if event.widget is not self.widget:
+            return
+
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+
+        self.pending = self.widget.after(self.delay, lambda: self.settle(event.width, event.height))
+
+    def settle(self, width, height):
+        self.pending = None
+
+        if (width, height) != self.size:
+            self.size = (width, height)
+            self.func(width, height)
+
+
+### Where everything on a CustomGrid goes for a multiplier, worked out once per multiplier ###
+#   – size is the canvas width and height, cell is the distance between squares
+#   – squares are (x1, y1, x2, y2) in index order, labels are (x, y) for the
+#     letters along the first row and the numbers down the first column
+#   – Use GridGeometry.of(multiplier), which keeps every geometry it has made
+#####
+class GridGeometry(object):
+
+    # Geometries made so far, keyed by multiplier
+    cache = {}
+
+    def __init__(self, multiplier):
+        self.multiplier = multiplier
+        self.size = 110 * multiplier
+        self.cell = 10 * multiplier
+
+        # Shifts every square in grid to center grid, and spacing between grid squares
+        self.shift = 10 if multiplier <= 2 else 20
+        spacing = 1
+
+        self.squares = tuple((self.cell * (i % 10) + spacing + self.shift,
+                              self.cell * (i // 10) + spacing + self.shift,
+                              self.cell * (i % 10 + 1) + self.shift,
+                              self.cell * (i // 10 + 1) + self.shift) for i in range(100))
+
+        self.row_labels = tuple((self.cell * x + multiplier * 13, self.shift + (7 if multiplier == 2 else 12))
+                                for x in range(10))
+        self.column_labels = tuple((multiplier * 7 + 2, self.cell * y + multiplier * 13) for y in range(10))
+
+        self.font = ("Tw Cen Mt", round(multiplier * (2 if windows else 3) + 1))
+        self.radius = 10 * multiplier
+
+    @classmethod
+    def of(cls, multiplier):
+        if multiplier not in cls.cache:
+            cls.cache[multiplier] = cls(multiplier)
+
+        return cls.cache[multiplier]
 
 
 ### Custom long label widget for multiline texts with formatting ###
@@ -265,14 +495,55 @@ class CustomLongText(tk.Frame):
             line_label.grid(row=i, column=0, sticky=sticky, padx=padding)
 
 
+### Small picture of a board, from masks of the squares hit and missed ###
+#   – Drawn as one 10 x 10 image scaled up by 'scale', rather than 100 canvas squares
+#   – Colours match the grid's (see CustomGrid.state_colours)
+#####
+class BoardThumbnail(tk.Label):
+    def __init__(self, parent, hits=0, misses=0, scale=4, bg="white"):
+        super().__init__(parent, bd=0, highlightthickness=0, bg=bg)
+
+        theme = Colours("default")
+
+        rows = []
+        for y in range(10):
+            row = []
+
+            for x in range(10):
+                square = 1 << (y * 10 + x)
+                row.append(theme.GOLD if hits & square else theme.BLUE if misses & square else theme.GRAY_LIGHT)
+
+            rows.append("{" + " ".join(row) + "}")
+
+        image = tk.PhotoImage(width=10, height=10)
+        image.put(" ".join(rows))
+
+        # Label doesn't keep the image alive by itself
+        self.image = image.zoom(scale)
+        self["image"] = self.image
+
+
 ### A progress bar ###
+#   – the bar and its text are made once, changes move the bar with coords() and set the text
+#   – tween (ms) slides the bar to each new percentage over that time, on one after loop
+#     that's only running while the bar is moving. Each frame draws where the bar should be
+#     by then, so frames that come late are skipped, and a new percentage while it's moving
+#     just changes where it's heading
+#####
 class ProgressBar(tk.Canvas):
+
+    # Time between frames of a tween (ms)
+    FRAME = 16
+
     def __init__(self, parent, direction="up", colours=("#FF4F4F", "#A42F2F"),
-                 bg_canvas="white", multiplier=2):
+                 bg_canvas="white", multiplier=2, scheduler=None, tween=None):
         super().__init__(parent)
 
         self.theme = Colours("default")
 
+        # Optional FrameScheduler, percentage changes are then drawn once per frame
+        self.scheduler = scheduler
+
         self.direction = direction
         self.multiplier = multiplier
 
@@ -281,6 +552,14 @@ class ProgressBar(tk.Canvas):
 
         self.percentage = 0
 
+        # Percentage the bar is drawn at, behind self.percentage while it's tweening
+        self.shown = 0
+
+        # Tween length, and (start percentage, start time) and after id of the one running
+        self.tween = tween
+        self.tween_from = None
+        self.tween_job = None
+
         self.bar_height = round(self.multiplier * 205)
 
         self["highlightthickness"] = 0
@@ -288,38 +567,103 @@ class ProgressBar(tk.Canvas):
         self["width"] = self.multiplier * 60
         self["height"] = self.bar_height + 50
 
+        self.bar = rounded_rect(self, *self.bar_coords(), 40, self.background)
+        self.text = self.create_text(0, 0, fill=self.foreground,
+                                     font=("TW Cen MT", 15 if windows else 20, "bold"), anchor="s")
+
         self.update_canvas()
 
+    # Corners of the bar when it's drawn at the shown percentage
+    def bar_coords(self):
+        filled = self.shown if self.direction == "up" else 100 - self.shown
+
+        return (0, self.bar_height - (self.bar_height/100 * filled),
+                int(self["width"]) - 2, int(self["height"]))
+
+    # Moves the bar and sets the text to the shown percentage
     def update_canvas(self):
-        self.delete('all')
+        self.coords(self.bar, *rounded_rect_coords(*self.bar_coords(), 40))
+        self.coords(self.text, int(self["width"])/2, int(self["height"]) - 10)
 
-        if self.direction == "down":
-            self.bar = rounded_rect(self, 0, self.bar_height - (self.bar_height/100 * (100 - self.percentage)),
-                                    int(self["width"]) - 2,
-                                    int(self["height"]), 40,
-                                    self.background)
-        else:
-            self.bar = rounded_rect(self, 0, self.bar_height - (self.bar_height/100 * self.percentage),
-                                    int(self["width"]) - 2,
-                                    int(self["height"]), 40,
-                                    self.background)
+        self.itemconfigure(self.text, text="{}%".format(round(self.shown if self.direction == "up"
+                                                              else (100 - self.shown))))
+
+    # Scales the bar to a new multiplier, it's redrawn at the new size
+    def resize(self, multiplier):
+        if multiplier == self.multiplier:
+            return
+
+        self.multiplier = multiplier
+        self.bar_height = round(self.multiplier * 205)
+
+        self["width"] = self.multiplier * 60
+        self["height"] = self.bar_height + 50
 
-        self.create_text(int(self["width"])/2, int(self["height"]) - 10,
-                         text="{}%".format((self.percentage if self.direction == "up" else (100 - self.percentage))),
-                         fill=self.foreground, font=("TW Cen MT", 15 if windows else 20, "bold"), anchor="s")
+        self.request_update()
 
     def set_percentage(self, new_percentage):
+        if new_percentage == self.percentage:
+            return
+
         self.percentage = new_percentage
 
-        self.update_canvas()
+        if not self.tween:
+            self.shown = new_percentage
+            self.request_update()
+            return
+
+        # Heads for the new percentage from wherever the bar is now
+        self.tween_from = (self.shown, time.perf_counter())
+
+        if self.tween_job is None:
+            self.tween_step()
+
+    # Draws the next frame of the tween, and asks for another until it's finished
+    def tween_step(self):
+        start, started = self.tween_from
+        done = min(1, (time.perf_counter() - started) * 1000 / self.tween)
+
+        self.shown = start + (self.percentage - start) * ease_out(done)
+        self.request_update()
+
+        if done < 1:
+            self.tween_job = self.after(self.FRAME, self.tween_step)
+        else:
+            self.tween_job = None
+
+    # Redraws the bar, on the next frame if there's a scheduler
+    def request_update(self):
+        if self.scheduler:
+            self.scheduler.call((self, 'update'), self.update_canvas)
+        else:
+            self.update_canvas()
+
+    # Stops a running tween first, its next frame would be drawn on a destroyed canvas
+    def destroy(self):
+        if self.tween_job is not None:
+            self.after_cancel(self.tween_job)
+            self.tween_job = None
+
+        super().destroy()
 
 
 ### A popup that disappears in time ###
+#   – with an Animator it fades (from the parent's colour) and slides in, then fades out before it goes
+#####
 class Popup(tk.Canvas):
-    def __init__(self, parent, text, bg, fg, fill=False, subtext=None, stay=False):
+
+    # Time a popup takes to fade in or out (ms), and how far it slides in from below (px)
+    FADE = 200
+    SLIDE = 20
+
+    def __init__(self, parent, text, bg, fg, fill=False, subtext=None, stay=False, animator=None):
         theme = Colours("default")
         super().__init__(parent)
 
+        self.parent = parent
+        self.colours = (bg, fg)
+        self.fill = fill
+
         self.place(x=parent.winfo_width()/2, y=parent.winfo_height()/2, anchor='center')
 
         self["width"] = parent.winfo_width()
@@ -343,7 +687,27 @@ class Popup(tk.Canvas):
             self.bind("<Button-1>", lambda event: self.destroy())
         if stay: delay = 10000
 
-        parent.after(delay, self.destroy)
+        if animator:
+            self.draw_fade(0)
+            animator.add(Tween(self.draw_fade, self.FADE))
+            animator.add(Tween(lambda t: self.draw_fade(1 - t), self.FADE, delay=delay - self.FADE,
+                               on_done=self.destroy))
+        else:
+            parent.after(delay, self.destroy)
+
+    # Draws the popup t (0 – 1) of the way from hidden (the parent's colour) to shown
+    def draw_fade(self, t):
+        hidden = self.parent["bg"]
+        bg, fg = self.colours
+        t = ease_out(t)
+
+        self["bg"] = blend(self, hidden, bg, t)
+        self.itemconfigure(self.main, fill=blend(self, hidden, fg, t))
+        self.itemconfigure(self.sub, fill=blend(self, hidden, fg, t))
+
+        # Full window popups only fade
+        if not self.fill:
+            self.place(y=self.parent.winfo_height()/2 + self.SLIDE * (1 - t))
 
 
 ### A ship to be placed on a canvas ###
@@ -357,9 +721,11 @@ class Ship(object):
                  4: 'Battleship',
                  5: 'Carrier'}.get(ship_length, "Yellow Submarine")
 
-    def __init__(self, parent_canvas, x1, y1, length=4, colour=Colours("default").WHITE, dir='h'):
+    def __init__(self, parent_canvas, x1, y1, length=4, colour=Colours("default").WHITE, dir='h', scheduler=None,
+                 multiplier=1):
 
         self.parent = parent_canvas
+        self.scheduler = scheduler
         self.theme = Colours("default")
         self.colour = colour
 
@@ -371,26 +737,56 @@ class Ship(object):
         self.length = length
         self.width = 35
 
+        # Top left corner at multiplier 1 (the original size), everything is scaled from it
+        self.x1, self.y1 = x1, y1
+        self.multiplier = multiplier
+
         self.binded_func = None
         self.selected = False
 
-        # 2 Boat: 60px    3 Boat: 100px     4 Boat: 140px       5 Boat: 180px
-        x_dimension = (60 + 40 * (length - 2)) if self.dir == 'h' else self.width
-        y_dimension = (60 + 40 * (length - 2)) if self.dir == 'v' else self.width
+        x1, y1, x2, y2 = self.bounds()
 
-        self.elements = rounded_rect(parent_canvas, x1, y1,
-                                     x1 + x_dimension,
-                                     y1 + y_dimension,
-                                     55, colour=colour)
+        self.shape = rounded_rect(parent_canvas, x1, y1, x2, y2, 55 * multiplier, colour=colour)
 
-        self.text = parent_canvas.create_text(x1 + int(x_dimension/2), y1 + int(y_dimension/2), anchor='center',
-                                              text=self.length, fill=self.colour, font=('Tw Cen MT', 9 if windows else 12))
+        self.text = parent_canvas.create_text(*self.centre(), anchor='center',
+                                              text=self.length, fill=self.colour, font=self.font())
 
-        for canvas_obj in self.elements + [self.text]:
+        for canvas_obj in (self.shape, self.text):
             self.parent.tag_bind(canvas_obj, "<Button-1>", lambda event: self.click(event))
             self.parent.tag_bind(canvas_obj, "<Enter>", lambda event: self.hover(event))
             self.parent.tag_bind(canvas_obj, "<Leave>", lambda event: self.unhover(event))
 
+    # Corners of the ship (x1, y1, x2, y2) at its multiplier
+    # Note: 2 Boat: 60px    3 Boat: 100px     4 Boat: 140px       5 Boat: 180px (at multiplier 1)
+    def bounds(self):
+        x_dimension = (60 + 40 * (self.length - 2)) if self.dir == 'h' else self.width
+        y_dimension = (60 + 40 * (self.length - 2)) if self.dir == 'v' else self.width
+
+        x1, y1 = self.x1 * self.multiplier, self.y1 * self.multiplier
+
+        return x1, y1, x1 + x_dimension * self.multiplier, y1 + y_dimension * self.multiplier
+
+    # Middle of the ship, where its text goes
+    def centre(self):
+        x1, y1, x2, y2 = self.bounds()
+
+        return x1 + int((x2 - x1) / 2), y1 + int((y2 - y1) / 2)
+
+    # Font of the ship's text at its multiplier
+    def font(self):
+        return ('Tw Cen MT', round((9 if windows else 12) * self.multiplier))
+
+    # Scales the ship to a new multiplier, the shape and text are moved with coords()
+    def resize(self, multiplier):
+        if multiplier == self.multiplier:
+            return
+
+        self.multiplier = multiplier
+
+        self.parent.coords(self.shape, *rounded_rect_coords(*self.bounds(), 55 * multiplier))
+        self.parent.coords(self.text, *self.centre())
+        self.parent.itemconfigure(self.text, font=self.font())
+
     # Custom function passed to be called when ship is called. Functional purpose.
     def bind_to_click(self, function):
         self.binded_func = function
@@ -400,9 +796,7 @@ class Ship(object):
         if self.selected == True:
             return
 
-        for canvas_obj in self.elements:
-            self.parent.itemconfigure(canvas_obj, fill=self.theme.GRAY)
-            self.parent.itemconfigure(canvas_obj, outline=self.theme.GRAY)
+        self.paint(self.theme.GRAY)
 
         self.selected = True
         self.binded_func(self)
@@ -412,47 +806,77 @@ class Ship(object):
         if self.selected == True:
             return
 
-        self.parent.itemconfigure(self.text, fill=self.theme.GRAY_BLACK)
-
-        for canvas_obj in self.elements:
-            self.parent.itemconfigure(canvas_obj, fill=self.theme.GRAY_LIGHT)
-            self.parent.itemconfigure(canvas_obj, outline=self.theme.GRAY_LIGHT)
+        self.paint(self.theme.GRAY_LIGHT, text_colour=self.theme.GRAY_BLACK)
 
     # Function called when mouse leaves ship
     def unhover(self, event):
         if self.selected == True:
             return
 
-        self.parent.itemconfigure(self.text, fill=self.colour)
+        self.paint(self.colour, text_colour=self.colour)
 
-        for canvas_obj in self.elements:
-            self.parent.itemconfigure(canvas_obj, fill=self.colour)
-            self.parent.itemconfigure(canvas_obj, outline=self.colour)
+    # Colours the ship's shape, and its text if a text colour is given
+    def paint(self, colour, text_colour=None):
+        self.configure_item(self.shape, fill=colour, outline=colour)
+
+        if text_colour:
+            self.configure_item(self.text, fill=text_colour)
+
+    # Sets options on one of the ship's canvas items, on the next frame if there's a scheduler
+    def configure_item(self, item, **options):
+        if self.scheduler:
+            self.scheduler.configure(self.parent, item, **options)
+        else:
+            self.parent.itemconfigure(item, **options)
 
 
 ### Battleship grids for setup and game ###
 class CustomGrid(tk.Canvas):
+
+    # Time a square takes to flash from white into its colour (ms), and the gap
+    # between squares as the flash ripples out along a sunk ship (ms per square)
+    FLASH = 300
+    RIPPLE = 70
+
     def __init__(self, parent, progress_bar=None, multiplier=3, disabled=False,
                  colours="grey", bg_canvas="white", bottom_hidden=False,
-                 is_game_board=True, game=None, owner=None):
+                 is_game_board=True, game=None, owner=None, scheduler=None, show_origins=False,
+                 animator=None):
         super().__init__(parent)
 
-        # Multiplier for scaling grid
+        # Multiplier for scaling grid, and where everything goes for it
         self.multiplier = multiplier
+        self.geometry = GridGeometry.of(multiplier)
+
+        # Optional FrameScheduler, dirty squares are then redrawn once per frame
+        self.scheduler = scheduler
+
+        # Optional Animator, squares fired at then flash (see flash)
+        self.animator = animator
         self.theme = Colours("default")
 
         self.background = self.theme.GRAY
         self.foreground = self.theme.GRAY_LIGHT
         self["highlightthickness"] = 0
 
+        # Colour each square state is drawn with
+        self.state_colours = {EMPTY: self.foreground,
+                              HOVER: self.theme.GRAY_BRIGHT,
+                              PLACED: self.theme.GREEN,
+                              ORIGIN: self.theme.GRAY_PALE,
+                              HIT: self.theme.GOLD,
+                              MISS: self.theme.BLUE,
+                              SUNK: self.theme.RED}
+
         self["bg"] = bg_canvas
 
         # Defines the dimensions of the grid
-        self["width"], self["height"] = 110 * self.multiplier, 110 * self.multiplier
+        self["width"], self["height"] = self.geometry.size, self.geometry.size
 
         # Grey rounded container, aesthetic purposes
-        self.container = rounded_rect(self, 0, 0, int(self["width"]), int(self["height"]),
-                                      10 * self.multiplier, colour=self.background, bottom_hidden=bottom_hidden)
+        self.bottom_hidden = bottom_hidden
+        self.container = rounded_rect(self, 0, 0, self.geometry.size, self.geometry.size,
+                                      self.geometry.radius, colour=self.background, bottom_hidden=bottom_hidden)
 
 
         # Defining a linked progress bar, setting original position to full
@@ -471,9 +895,26 @@ class CustomGrid(tk.Canvas):
         # Determines whether user interaction is enabled
         self.disabled = disabled
 
-        # List of all squares (with coordinates) on grid, appended to in update_canvas()
+        # List of all squares (canvas obj, (x, y)) on grid, in index order, made once in build_canvas()
         self.squares = []
 
+        # Letter labels along the first row and number labels down the first column
+        self.row_labels = []
+        self.column_labels = []
+
+        # Index of the square the mouse is over, None when it's off the squares
+        self.current = None
+
+        # State of each square by index, squares are drawn from these and nothing else
+        self.cells = [EMPTY] * 100
+
+        # Fill each square was last drawn with, and indexes of squares waiting to be redrawn
+        self.fills = [None] * 100
+        self.dirty = set()
+
+        # Whether ships that haven't been hit are shown (see show_hidden_ships)
+        self.show_ships = False
+
         # For setting up the board
         if is_game_board:
             self.game = game
@@ -489,6 +930,9 @@ class CustomGrid(tk.Canvas):
                 self.remaining_ships = self.game.computer_remaining_ships
                 self.hit_spaces = self.game.computer_board_hit
 
+            # Bit board of ships, hits and misses for this grid
+            self.board = self.game.boards[self.owner]
+
         else:
             self.selection_length = 0
             self.selection_dir = 'h'
@@ -496,213 +940,298 @@ class CustomGrid(tk.Canvas):
             # Structured as [ship1 ... shipn], for each ship [coord1 ... coordn], like self.ships
             self.selection = []
 
+            # Masks of the squares with placed ships, being hovered over, and shown as starts
+            self.placed = 0
+            self.hovered = 0
+            self.origins = 0
+
+            # Whether every square the selected ship could start on is shown (see refresh_origins)
+            self.show_origins = show_origins
+
+        self.build_canvas()
         self.update_canvas()
 
-    # Refreshes all the elements on the canvas, resets out all the board items etc.
-    def update_canvas(self, show_hidden_ships=False):
+        # Mouse events are handled for the whole canvas, the square is worked out from
+        # where the mouse is (see cell_at) rather than binding every square and label
+        self.bind("<Motion>", self.on_motion)
+        self.bind("<Leave>", self.on_leave)
+        self.bind("<Button-1>", self.on_click)
 
-        # Deletes existing squares
-        self.delete("square")
-        self.squares = []
+        if not is_game_board:
+            self.bind("<Button-2>", self.on_rotate)
+            self.bind("<Button-3>", self.on_rotate)
 
-        for y in range(0, 10):
-            for x in range(0, 10):
+    # Creates every square and label on the canvas, only ever called once
+    def build_canvas(self):
+        geometry = self.geometry
 
-                # shifts every square in grid to center grid
-                shift = 10 if self.multiplier == 2 else 20
+        for index in range(100):
 
-                # determines spacing of grid squares
-                spacing = 1
+            # Each object will contain the canvas obj and the coordinate (x, y)
+            self.squares.append((self.create_rectangle(*geometry.squares[index], fill=self.foreground,
+                                                       width=0, tags="square"), INDEX_TO_XY[index]))
 
-                # Each object will contain the canvas obj and the coordinate (x, y)
-                square_colour = self.foreground
-                tag = "square"
+            self.fills[index] = self.foreground
 
-                if self.is_game_board:
-                    # For every ship on the board, make that square have an "occupied" tag
-                    # for identification for mouse click event.
-                    for ship in self.ships:
-                        if (x + 1, y + 1) in [CoordUtils.convert_type(alpha_coord) for alpha_coord in ship]:
-                            tag = ("square", "occupied")
+        for i in range(10):
 
-                rect = (self.create_rectangle(self.multiplier * 10 * x + spacing + shift,
-                                              self.multiplier * 10 * y + spacing + shift,
-                                              self.multiplier * 10 * (x + 1) + shift,
-                                              self.multiplier * 10 * (y + 1) + shift,
-                                              fill=square_colour, width=0, tags=tag), (x + 1, y + 1))
+            # Adds the letter coord on the first row, and the integer coord on the first column
+            self.row_labels.append(self.create_text(*geometry.row_labels[i], text=CoordUtils.convert_type(i + 1),
+                                                    font=geometry.font, fill=self.theme.GRAY_DARK))
+            self.column_labels.append(self.create_text(*geometry.column_labels[i], text=str(i + 1),
+                                                       font=geometry.font, fill=self.theme.GRAY_DARK))
 
-                if show_hidden_ships and len(tag) == 2 and tag[1] == "occupied":
-                    self.itemconfigure(rect[0], fill=self.theme.GREEN)
+    # Scales the grid to a new multiplier
+    # Note: Everything is moved with coords(), no items are made again
+    def resize(self, multiplier):
+        if multiplier == self.multiplier:
+            return
 
+        self.multiplier = multiplier
+        self.geometry = geometry = GridGeometry.of(multiplier)
 
-                # Adds the letter coord on the first row
-                textrow = (self.create_text(self.multiplier * 10 * x + self.multiplier * 13,
-                                           shift + (7 if self.multiplier == 2 else 12),
-                                           text=CoordUtils.convert_type(x + 1), font=("Tw Cen Mt", self.multiplier * (2 if windows else 3) + 1),
-                                           fill=self.theme.GRAY_DARK)) if (rect[1][1] == 1) else None
+        self["width"], self["height"] = geometry.size, geometry.size
 
-                # Adds the integer coord on the first column
-                textcol = (self.create_text(self.multiplier * 7 + 2,
-                                           self.multiplier * 10 * y + self.multiplier * 13,
-                                           text=str(y + 1), font=("Tw Cen Mt", self.multiplier * (2 if windows else 3) + 1),
-                                           fill=self.theme.GRAY_DARK)) if (rect[1][0] == 1) else None
+        for index in range(100):
+            self.coords(self.squares[index][0], *geometry.squares[index])
 
-                # Adds each object (canvas object w/ coord) to self.squares
-                self.squares.append(rect)
+        for labels, positions in ((self.row_labels, geometry.row_labels), (self.column_labels, geometry.column_labels)):
+            for item, position in zip(labels, positions):
+                self.coords(item, *position)
+                self.itemconfigure(item, font=geometry.font)
 
-                if self.is_game_board:
-                    # Binds click, hover, unhover events
-                    element_arr = [rect[0]]
+        self.coords(self.container, *rounded_rect_coords(0, 0, geometry.size, geometry.size, geometry.radius,
+                                                         bottom_hidden=self.bottom_hidden))
 
-                    if textrow: element_arr.append(textrow)
-                    if textcol: element_arr.append(textcol)
+    # Index of the square under a point on the canvas, None if it's off the squares
+    # Note: Labels sit on the squares of the first row and column, and each square's
+    # spacing belongs to it, so moving between squares goes straight from one to the next
+    def cell_at(self, x, y):
+        geometry = self.geometry
+        column, row = int((x - geometry.shift) // geometry.cell), int((y - geometry.shift) // geometry.cell)
 
-                    for element in element_arr:
-                        self.tag_bind(element, "<Button-1>", lambda event, arg=rect: self.hit(event, arg))
-                        self.tag_bind(element, "<Enter>", lambda event, arg=rect: self.hover(event, arg))
-                        self.tag_bind(element, "<Leave>", lambda event, arg=rect: self.unhover(event, arg))
+        if 0 <= column < 10 and 0 <= row < 10:
+            return row * 10 + column
+
+        return None
 
+    ## FOLLOWING 4 FUNCTIONS TURN CANVAS MOUSE EVENTS INTO SQUARE EVENTS ##
+
+    # Mouse moved, leaves the square it was on and enters the new one (if it changed)
+    def on_motion(self, event):
+        index = self.cell_at(event.x, event.y)
+
+        if index != self.current:
+            self.on_leave(event)
+            self.current = index
+
+            if index is not None:
+                if self.is_game_board:
+                    self.hover(event, self.squares[index])
                 else:
-                    element_arr = [rect[0]]
+                    self.hover_selection(event, self.squares[index])
 
-                    if textrow: element_arr.append(textrow)
-                    if textcol: element_arr.append(textcol)
+    # Mouse left the square it was on (or the canvas)
+    def on_leave(self, event):
+        if self.current is not None:
+            if self.is_game_board:
+                self.unhover(event, self.squares[self.current])
+            else:
+                self.unhover_selection(event, self.squares[self.current])
+
+        self.current = None
+
+    # Left click on a square
+    def on_click(self, event):
+        index = self.cell_at(event.x, event.y)
+
+        if index is not None:
+            if self.is_game_board:
+                self.hit(event, self.squares[index])
+            else:
+                self.place_ship(event, self.squares[index])
+
+    # Middle or right click on a square (setup only)
+    def on_rotate(self, event):
+        index = self.cell_at(event.x, event.y)
+
+        if index is not None:
+            self.rotate_selection(event, self.squares[index])
+
+    # Redraws every square from the game's board (or the setup selection)
+    # Note: Only squares whose colour changed are touched, hovers are cleared
+    def update_canvas(self, show_hidden_ships=False):
+        self.show_ships = show_hidden_ships
 
-                    for element in element_arr:
-                        self.tag_bind(element, "<Button-1>", lambda event, rect=rect: self.place_ship(event, rect))
-                        self.tag_bind(element, "<Button-2>", lambda event, rect=rect: self.rotate_selection(event, rect))
-                        self.tag_bind(element, "<Button-3>", lambda event, rect=rect: self.rotate_selection(event, rect))
-                        self.tag_bind(element, "<Enter>", lambda event, rect=rect: self.hover_selection(event, rect))
-                        self.tag_bind(element, "<Leave>", lambda event, rect=rect: self.unhover_selection(event, rect))
+        selected = 0 if self.is_game_board else mask_of(coord for ship in self.selection for coord in ship)
 
+        for index in range(100):
+            self.cells[index] = self.model_state(index, selected)
+
+        self.mark_dirty(range(100))
+        self.request_redraw()
+
+        if not self.is_game_board:
+            self.placed = selected
+            self.hovered = 0
+            self.origins = 0
+            self.refresh_origins()
+
+        # Note: hits are already taken off remaining ships by the game
         if self.is_game_board and len(self.hit_spaces) != 0:
+            self.update_progress()
+            self.game.check_win()
+
+    # Queues squares (by index) to be redrawn on the next redraw()
+    def mark_dirty(self, indexes):
+        self.dirty.update(indexes)
+
+    # Recolours the dirty squares whose colour has changed
+    def redraw(self):
+        for index in self.dirty:
+            fill = self.state_colours[self.cells[index]]
+
+            if fill != self.fills[index]:
+                self.itemconfigure(self.squares[index][0], fill=fill)
+                self.fills[index] = fill
+
+        self.dirty.clear()
+
+    # Redraws the dirty squares now, or on the next frame if the grid has a scheduler
+    # Note: States change straight away either way, only the drawing waits
+    def request_redraw(self):
+        if self.scheduler:
+            self.scheduler.call((self, 'redraw'), self.redraw)
+        else:
+            self.redraw()
+
+    # State a square should be in going by the game's board, given by index
+    #   – selected is the mask of squares with placed ships (setup only)
+    ##
+    def model_state(self, index, selected=0):
+        if not self.is_game_board:
+            return PLACED if selected >> index & 1 else EMPTY
+
+        square = 1 << index
 
-            for hit_coord in self.hit_spaces:
-                for ship in self.remaining_ships:
-                    if hit_coord in ship:
-                        ship.remove(hit_coord)
+        if self.board.miss & square:
+            return MISS
+        if self.board.sunk & square:
+            return SUNK
+        if self.board.hit & square:
+            return HIT
+        if self.show_ships and self.board.occupied & square:
+            return PLACED
 
-                self.hit(None, self.coord_to_rect(CoordUtils.convert_type(hit_coord)), setup=True)
+        return EMPTY
 
     # Find the "rect" object (Canvas elements, (x, y)) based on a given (x, y) coord
+    # Note: self.squares is in index order, so it's a direct lookup, None if off the grid
     def coord_to_rect(self, coord):
-        for rect in self.squares:
-            if rect[1] == coord:
-                return rect
+        index = XY_TO_INDEX.get(coord)
 
-    # Colour each coordinate, coordinate given in (x, y) – frontend
-    def colour_square(self, coord, fill):
-        self.itemconfigure(self.coord_to_rect(coord)[0], fill=fill)
+        return self.squares[index] if index is not None else None
 
+    # State of a square, coordinate given in (x, y) or alpha-num
+    def get_state(self, coord):
+        return self.cells[index_of(coord)]
 
-    ## FOLLOWING 4 DEFINITIONS ARE EVENT HANDLERS FOR SETUP ##
+    # Sets the state of each coordinate, coordinates given in (x, y) or alpha-num – frontend
+    def set_state(self, coords, state):
+        for coord in coords:
+            index = index_of(coord)
 
-    # Places a ship based on the selection length
-    def place_ship(self, event, rect):
+            self.cells[index] = state
+            self.dirty.add(index)
+
+        self.request_redraw()
+
+    # Sets the state of every square in a mask
+    def set_cells(self, mask, state):
+        while mask:
+            low = mask & -mask
+            index = low.bit_length() - 1
+
+            self.cells[index] = state
+            self.dirty.add(index)
+            mask ^= low
+
+        self.request_redraw()
+
+    # Mask of the squares a selection starting on a square would cover, None if it goes off the grid
+    def selection_mask(self, rect):
         if self.selection_length == 0:
-            return
+            return None
 
-        selection_coords = []
+        return PLACEMENT_MASKS[(self.selection_length, self.selection_dir, index_of(rect[1]))]
 
-        for i in range(self.selection_length):
-            if self.selection_dir == 'h':
-                selection_coords.append((rect[1][0] + i, rect[1][1]))
-            else:
-                selection_coords.append((rect[1][0], rect[1][1] + i))
+    # Checks whether the selected ship can start on a square, a single AND against the placed ships
+    def can_place(self, rect):
+        mask = self.selection_mask(rect)
 
-        selection_rect = [self.coord_to_rect(coord) for coord in selection_coords]
+        return mask is not None and not mask & self.placed
 
-        for rect in selection_rect:
-            if rect == None:
-                break
+    # Updates which squares are shown as starts for the selected ship (if show_origins is on)
+    # Note: Hovered and placed squares keep their state
+    def refresh_origins(self):
+        origins = 0
 
-            if self.itemcget(rect[0], "fill") != self.theme.GRAY_BRIGHT:
-                break
+        if self.show_origins and self.selection_length != 0:
+            origins = valid_starts(FULL & ~self.placed, self.selection_length, self.selection_dir)
 
-        else:
-            for coord in selection_coords:
-                self.colour_square(coord, self.theme.GREEN)
+        busy = self.placed | self.hovered
 
-            selection = []
-            for x, y in selection_coords:
-                selection.append("{}{}".format(CoordUtils.convert_type(x), y))
+        self.set_cells(self.origins & ~origins & ~busy, EMPTY)
+        self.set_cells(origins & ~busy, ORIGIN)
+        self.origins = origins
 
-            self.selection.append(selection)
 
-            self.selection_length = 0
-            self.selection_dir = 'h'
+    ## FOLLOWING 4 DEFINITIONS ARE EVENT HANDLERS FOR SETUP ##
+
+    # Places a ship based on the selection length
+    def place_ship(self, event, rect):
+        if not self.can_place(rect):
+            return
+
+        mask = self.selection_mask(rect)
+
+        self.set_cells(mask, PLACED)
+        self.placed |= mask
+        self.hovered &= ~mask
+
+        # Alpha-num coords of the ship, in index order (i.e left to right, top to bottom)
+        self.selection.append(coords_of(mask))
+
+        self.selection_length = 0
+        self.selection_dir = 'h'
+        self.refresh_origins()
 
     # Changes ship placement to be horizontal/vertical
     def rotate_selection(self, event, rect):
         self.unhover_selection(None, rect)
         self.selection_dir = ('v' if self.selection_dir == 'h' else 'h')
+        self.refresh_origins()
         self.hover_selection(None, rect)
 
     # Lightens squares where ship will be placed
     def hover_selection(self, event, rect):
-
-        selection_coords = []
-
-        for i in range(self.selection_length):
-            if self.selection_dir == 'h':
-                selection_coords.append((rect[1][0] + i, rect[1][1]))
-            else:
-                selection_coords.append((rect[1][0], rect[1][1] + i))
-
-        selection_rect = [self.coord_to_rect(coord) for coord in selection_coords]
-
-        for rect in selection_rect:
-            if rect == None:
-                break
-            if self.itemcget(rect[0], "fill") != self.foreground:
-                break
-        else:
-            for coord in selection_coords:
-                self.colour_square(coord, self.theme.GRAY_BRIGHT)
+        if self.can_place(rect):
+            self.hovered = self.selection_mask(rect)
+            self.set_cells(self.hovered, HOVER)
 
     # Opposite of hover_selection
     def unhover_selection(self, event, rect):
-        selection_coords = []
-
-        for i in range(self.selection_length):
-            if self.selection_dir == 'h':
-                selection_coords.append((rect[1][0] + i, rect[1][1]))
-            else:
-                selection_coords.append((rect[1][0], rect[1][1] + i))
-
-        selection_rect = [self.coord_to_rect(coord) for coord in selection_coords]
-
-        for rect in selection_rect:
-            if rect == None:
-                continue
-
-            if self.itemcget(rect[0], "fill") == self.theme.GRAY_BRIGHT:
-                self.colour_square(rect[1], self.foreground)
+        self.set_cells(self.hovered & ~self.origins, EMPTY)
+        self.set_cells(self.hovered & self.origins, ORIGIN)
+        self.hovered = 0
 
     ## FOLLOWING 3 FUNCITONS ARE EVENT HANDLERS FOR GAMEPLAY ##
 
     # Event handler when square is clicked
-    def hit(self, event, rect, override=False, setup=False):
-        if setup:
-            # For all ships on the board
-            for ship in self.ships:
-
-                # Check if the hit coordinate was occupied
-                if CoordUtils.convert_type(rect[1]) in ship:
-                    remaining_ship = self.remaining_ships[self.ships.index(ship)]
-
-                    if len(remaining_ship) == 0:
-                        for coord in ship:
-                            self.colour_square(CoordUtils.convert_type(coord), fill=self.theme.RED)
-                    else:
-                        self.colour_square(rect[1], fill=self.theme.GOLD)
-                    break
-            else:
-                self.colour_square(rect[1], fill=self.theme.BLUE)
-
-            self.game.check_win()
-
-        if not setup and (self.itemcget(rect[0], "fill") in [self.theme.GRAY_BRIGHT, self.theme.GREEN] or override):
+    # Note: Clicks only fire at a hovered square (i.e one that hasn't been fired at) while the grid
+    # isn't disabled, override fires regardless (i.e the computer's shots on the player's grid)
+    def hit(self, event, rect, override=False):
+        if override or (not self.disabled and self.get_state(rect[1]) == HOVER):
             if self.game.game_over:
                 return
 
@@ -726,37 +1255,50 @@ class CustomGrid(tk.Canvas):
 
             # Nothing was hit
             if len(game_control) == 1:
-                self.colour_square(rect[1], self.theme.BLUE)
                 self.disabled = True
 
-            # A ship square was hit
-            elif len(game_control) == 3:
+            # Square that was fired at (every square of a sunk ship) takes its state from the board
+            changed = game_control[2] if len(game_control) == 3 and game_control[1] else [rect[1]]
 
-                name = Ship.get_name(len(game_control[2]))
+            for coord in changed:
+                index = index_of(coord)
 
-                # Ship was sunk
-                if game_control[1]:
-                    [self.colour_square(CoordUtils.convert_type(coord), self.theme.RED) for coord in game_control[2]]
+                self.cells[index] = self.model_state(index)
+                self.dirty.add(index)
 
-                # Ship wasn't sunk
-                else:
-                    self.colour_square(rect[1], self.theme.GOLD)
+            self.request_redraw()
+
+            if self.animator:
+                self.flash([index_of(coord) for coord in changed], index_of(rect[1]))
 
             self.game.check_win()
 
-        # Total number of ship squares
-        total_spaces = sum([len(ship) for ship in self.ships])
+        self.update_progress()
+
+    # Flashes squares (by index) from white into their colour, rippling out from the origin square
+    # Note: A square's flash replaces any still running on it, and ends on the colour of its state
+    def flash(self, indexes, origin):
+        for index in indexes:
+            distance = abs(index % 10 - origin % 10) + abs(index // 10 - origin // 10)
+
+            self.animator.add(Tween(lambda t, index=index: self.draw_flash(index, t), self.FLASH,
+                                    delay=distance * self.RIPPLE), key=(self, index))
 
-        # Number of ship squares remaining (unhit)
-        remaining_spaces = sum([len(ship) for ship in self.remaining_ships])
+    # Draws a square t (0 – 1) of the way through its flash
+    def draw_flash(self, index, t):
+        fill = blend(self, self.theme.WHITE, self.state_colours[self.cells[index]], ease_out(t))
 
-        # Increments the progress bar, note: percentage is the percentage of ships sunk
+        self.itemconfigure(self.squares[index][0], fill=fill)
+        self.fills[index] = fill
+
+    # Increments the progress bar, note: percentage is the percentage of ships sunk
+    def update_progress(self):
         if self.linked_progress_bar:
-            new_percent = round((1 - remaining_spaces/total_spaces) * 100)
+            new_percent = round(self.board.progress() * 100)
             self.linked_progress_bar.set_percentage(new_percent)
 
         if self.linked_percentage:
-            new_percent = (1 - remaining_spaces/total_spaces) * 100
+            new_percent = self.board.progress() * 100
 
             if new_percent < 10: self.linked_percentage["text"] = "{:.2f}%".format(round(new_percent))
             elif new_percent < 100: self.linked_percentage["text"] = "{:.1f}%".format(round(new_percent))
@@ -764,25 +1306,37 @@ class CustomGrid(tk.Canvas):
 
     # When a square is hovered
     def hover(self, event, rect):
-        if self.disabled == False and self.itemcget(rect[0], "fill") == self.theme.GRAY_LIGHT:
-            self.colour_square(rect[1], self.theme.GRAY_BRIGHT)
+        if self.disabled == False and self.get_state(rect[1]) == EMPTY:
+            self.set_state([rect[1]], HOVER)
 
     # When a square is unhovered
     def unhover(self, event, rect):
-        if self.itemcget(rect[0], "fill") == self.theme.GRAY_BRIGHT:
-            self.colour_square(rect[1], self.theme.GRAY_LIGHT)
+        if self.get_state(rect[1]) == HOVER:
+            self.set_state([rect[1]], EMPTY)
 
     # Show all hidden ships on board, 'mainly' for debugging purposes
+    # Note: Only the squares with ships on them are redrawn
     def show_hidden_ships(self):
-        self.update_canvas(show_hidden_ships=True)
+        self.show_ships = True
+
+        for index in range(100):
+            if self.board.occupied >> index & 1:
+                self.cells[index] = self.model_state(index)
+                self.dirty.add(index)
+
+        self.request_redraw()
 
 
 ### Blueprint for rounded buttons with built in event handlers ###
 class CustomButton(tk.Frame):
     def __init__(self, parent, text, fg=None, colour=None, active=None,
-                 width=200, height=60, bg_canvas='white', font=("Tw Cen MT", 15 if windows else 20), align="center"):
+                 width=200, height=60, bg_canvas='white', font=("Tw Cen MT", 15 if windows else 20), align="center",
+                 scheduler=None):
         super().__init__(parent)
 
+        # Optional FrameScheduler, colour changes are then drawn once per frame
+        self.scheduler = scheduler
+
         if None in [fg, colour, active]:
             self.fg = "red4"
             self.colour = "yellow"
@@ -800,51 +1354,40 @@ class CustomButton(tk.Frame):
         self.canvas = tk.Canvas(self, width=self.width + 2, height=self.height + 2,
                                 bg=bg_canvas, highlightthickness=0)
 
-        self.vert_button = [tk.Frame(self, width=self.width-20, height=8, bg=colour),
-                                tk.Frame(self, width=self.width-20, height=8, bg=colour)]
+        # The button is two canvas items, its shape (the only thing recoloured) and its text on top
+        self.shape = rounded_rect(self.canvas, 1, 1, self.width, self.height, 20, colour)
 
-        self.hori_button = tk.Frame(self, width=self.width-4, height=self.height-20, bg=colour)
-
-        self.label = tk.Label(self.hori_button, text=self.text,
-                              bg=self.colour, font=font, fg=self.fg)
-
-        self.hori_button.pack_propagate(0)
-
-        if align == "center":
-            self.label.place(x=self.width / 2 - 5, y=self.height/2 - 11, anchor="center")
-        elif align == "left":
-            self.label.place(x=20, y=(self.height-20)/2, anchor="w")
-
-        self.elements = rounded_rect(self.canvas, 1, 1, self.width, self.height, 20, colour)
+        if align == "left":
+            self.label = self.canvas.create_text(25, self.height / 2 + 1, text=self.text, font=font,
+                                                 fill=self.fg, anchor="w")
+        else:
+            self.label = self.canvas.create_text(self.width / 2 + 1, self.height / 2 + 1, text=self.text, font=font,
+                                                 fill=self.fg, anchor="center")
 
-        for btn in [self.hori_button, self.label]:
-            btn.bind("<Enter>", self.hover)
-            btn.bind("<Leave>", self.unhover)
-            btn.bind("<Button-1>", self.click)
+        self.canvas.bind("<Enter>", self.hover)
+        self.canvas.bind("<Leave>", self.unhover)
+        self.canvas.bind("<Button-1>", self.click)
 
         self.canvas.pack(side='left')
 
-        self.canvas.create_window(12, 5, window=self.vert_button[0], anchor="nw")
-        self.canvas.create_window(12, 52, window=self.vert_button[1], anchor="nw")
-        self.canvas.create_window(5, 12, window=self.hori_button, anchor="nw")
-
     # Function called when the custom button is hovered over
     def hover(self, event):
-        for btn in self.vert_button + [self.hori_button, self.label]:
-            btn["bg"] = self.active_colour
-
-        for el in self.elements:
-            self.canvas.itemconfig(el, fill=self.active_colour)
-            self.canvas.itemconfig(el, outline=self.active_colour)
+        self.request_colour(self.active_colour)
 
     # Function called when unhovering
     def unhover(self, event):
-        for btn in self.vert_button + [self.hori_button, self.label]:
-            btn["bg"] = self.colour
+        self.request_colour(self.colour)
+
+    # Colours the button now, or on the next frame if there's a scheduler (last colour wins)
+    def request_colour(self, colour):
+        if self.scheduler:
+            self.scheduler.call((self, 'colour'), lambda: self.set_colour(colour))
+        else:
+            self.set_colour(colour)
 
-        for el in self.elements:
-            self.canvas.itemconfig(el, fill=self.colour)
-            self.canvas.itemconfig(el, outline=self.colour)
+    # Colours the button's shape (the text sits on top of it, so only the one item changes)
+    def set_colour(self, colour):
+        self.canvas.itemconfigure(self.shape, fill=colour, outline=colour)
 
     # Custom function passed when button is clicked. Functional purpose
     def bind_to_click(self, func):
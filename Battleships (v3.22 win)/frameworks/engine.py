@@ -0,0 +1,761 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Headless battleships engine (no tkinter)
+# – Game (turns, ship bookkeeping, win checks)
+# – ComputerLogic (computer's moves and layouts)
+# – DensityLogic, MonteCarloLogic (stronger computers)
+# – choose_shot (a computer's shot, with virtual turns)
+# – play_headless (AI-vs-AI games without a window)
+#
+# Note: The tkinter windows in 'battleships v3.22.py' are views over
+# this module. Nothing in here may import tkinter or touch a widget.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import copy
+import datetime
+import random
+import time
+
+from .coords import INDEX_TO_ALPHA, CoordUtils, index_of
+from .bitboard import FULL, Bitboard, coords_of, popcount
+from .placements import FLEET, PLACEMENTS, THROUGH, add_to_planes, counts_of, heat_map, hottest, random_layout
+from .replay import COMPUTER, PLAYER, ReplayLog, result_of
+
+
+# Difficulties, in the order the setup toggle goes through them
+DIFFICULTIES = ['easy', 'normal', 'hard', 'master', 'master+']
+
+# Seeds are saved as an unsigned 64-bit number (storage.py) and kept in a signed 64-bit
+# sqlite column (history.py), every game's seed is made to fit both
+SEED_RANGE = 1 << 63
+
+# Number of 'virtual turns' the computer gets per shot on each difficulty
+# Note: Virtual turns look at where the ships really are, master+ doesn't get
+# any, it only goes on what it has fired at (see DensityLogic)
+RETRIES = {'easy': 1,
+           'normal': 2,
+           'hard': 3,
+           'master': 4,
+           'master+': 1}
+
+
+### Picks a computer's shot at a board, with up to 'retries' virtual turns ###
+#   – Gives the computer up to '4 virtual turns' on master difficulty, the
+#     first move that would hit a ship (or the last move tried) is played
+#   – The first virtual turn is the logic's own move (make_move), each one
+#     after that is its next move leaving out the squares already tried
+#     (see ComputerLogic.next_move)
+#####
+def choose_shot(logic, board, retries):
+    hit_coord = None
+    tried = 0
+    counter = 0
+
+    while counter < retries:
+        hit_coord = logic.next_move(tried) if tried else logic.make_move()
+        tried |= 1 << index_of(hit_coord)
+
+        # Checks if 'hit_coord' hits a ship
+        if board.test('occupied', hit_coord):
+            counter += 100
+        else:
+            counter += 1
+
+    return hit_coord
+
+
+### Utility function that gets the name of the ship based on the length ###
+def ship_name(ship_length):
+    return {2: 'Destroyer',
+            3: 'Cruiser',
+            4: 'Battleship',
+            5: 'Carrier'}.get(ship_length, "Yellow Submarine")
+
+
+### Game object with management on how the game runs ###
+#   – Boards are named after their owner: 'computer' is the board the player
+#     fires on, 'player' is the board the computer fires on
+#   – Views hook in with bind_to_turn / bind_to_result
+#   – Everything random comes from the game's own generator (self.rng), so a
+#     game with the same seed and the same player moves plays out the same
+#     (MonteCarloLogic aside, its samples depend on how much time it gets)
+#####
+class Game(object):
+    def __init__(self, manager=None, verbose=False, seed=None):
+
+        # Difficulty selection range: see DIFFICULTIES
+        self.difficulty = "normal"
+        self.date = datetime.datetime.today()
+
+        # Manager is optional, headless games don't record stats
+        self.manager = manager
+        self.verbose = verbose
+
+        # Seed of the game's random number generator, a random one if not given
+        # Note: Anything random.Random takes is accepted, other ints are wrapped into
+        # SEED_RANGE and anything else (i.e strings) is turned into an int in it
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        elif isinstance(seed, int):
+            seed %= SEED_RANGE
+        else:
+            seed = random.Random(seed).randrange(SEED_RANGE)
+
+        self.seed = seed
+        self.rng = random.Random(self.seed)
+
+        self.game_over = False
+        self.winner = None
+
+        # Name of the board that will be fired on next
+        self.turn = 'computer'
+
+        # Alpha-num coord the computer will fire next (when it's the computer's turn)
+        self.next_computer_move = None
+
+        # Structured as individual ships (with alpha-num coords)
+        self.player_ships = []
+        self.player_remaining_ships = []
+
+        self.computer_ships = []
+        self.computer_remaining_ships = []
+
+        # Structured as alpha-num coords
+        self.player_board_hit = []
+        self.computer_board_hit = []
+
+        # Bit boards of ships, hits and misses, keyed by board name
+        self.boards = {'player': Bitboard(),
+                       'computer': Bitboard()}
+
+        # Every shot in the order it was fired, for replays
+        self.replay = ReplayLog()
+
+        # Defines the computer's brain for move/layout generation
+        self.computer_logic = ComputerLogic(rng=self.rng)
+
+        # Functions called after each shot and at the end of the game
+        self.turn_func = None
+        self.result_func = None
+
+    ## Custom function called with the name of the next board to be fired on ##
+    def bind_to_turn(self, func):
+        self.turn_func = func
+
+    ## Custom function called with the result once the game is over ##
+    def bind_to_result(self, func):
+        self.result_func = func
+
+    ## Prints game events when verbose (the window version prints, simulations don't) ##
+    def log(self, text):
+        if self.verbose:
+            print(text)
+
+    ## Changes the difficulty, along with the computer's brain for it ##
+    def set_difficulty(self, difficulty):
+        self.difficulty = difficulty
+        self.computer_logic = STRATEGIES.get(difficulty, ComputerLogic)(rng=self.rng)
+
+    ## Sets the ships on player's board to the layout from setup ##
+    def add_player_ships(self, ships_array):
+        self.player_ships = copy.deepcopy(ships_array)
+        self.player_remaining_ships = copy.deepcopy(ships_array)
+        self.boards['player'] = Bitboard(ships_array)
+
+    ## Sets out predefined ships for computer's board ##
+    def add_computer_ships(self, ships_array):
+        self.computer_ships = copy.deepcopy(ships_array)
+        self.computer_remaining_ships = copy.deepcopy(ships_array)
+        self.boards['computer'] = Bitboard(ships_array)
+
+    ## Exporting game data ##
+    def get_data_summary(self):
+        data = {"difficulty": self.difficulty, "date": self.date, "seed": self.seed,
+                "player_ships": self.player_ships,
+                "player_hit": self.player_board_hit,
+
+                "computer_ships": self.computer_ships,
+                "computer_hit": self.computer_board_hit,
+                "computer_cache": self.computer_logic.cached_ship_coords,
+                "replay": self.replay.encoded()}
+
+        return data
+
+    ## Imports all the game data ##
+    def import_data(self, data):
+
+        # Saves from before seeds were recorded keep the seed the game was made with
+        self.seed = data.get("seed", self.seed)
+        self.rng.seed(self.seed)
+
+        self.set_difficulty(data["difficulty"])
+
+        self.add_player_ships(data["player_ships"])
+        self.player_board_hit = data["player_hit"]
+
+        self.add_computer_ships(data["computer_ships"])
+        self.computer_board_hit = data["computer_hit"]
+
+        # Replays the saved hits onto the boards and remaining ships
+        self.boards['player'] = Bitboard(self.player_ships, self.player_board_hit)
+        self.boards['computer'] = Bitboard(self.computer_ships, self.computer_board_hit)
+
+        for remaining_ships, board in ((self.player_remaining_ships, self.boards['player']),
+                                       (self.computer_remaining_ships, self.boards['computer'])):
+            for ship in remaining_ships:
+                ship[:] = [coord for coord in ship if not board.test('hit', coord)]
+
+        self.replay = ReplayLog.of(data)
+
+        # Computer only gets to know what it has fired at
+        self.computer_logic.set_board(self.boards['player'])
+        self.computer_logic.cached_ship_coords = data["computer_cache"]
+
+    ## Picks the computer's next shot, using up to RETRIES 'virtual turns' ##
+    def computer_shot(self):
+        return choose_shot(self.computer_logic, self.boards['player'], RETRIES.get(self.difficulty, 1))
+
+    ## After any position is played (coord in alpha-num) ##
+    #   – Returns who's turn it is after the play
+    #   – Makes necessary changes to ship variables (if any are hit)
+    ##
+    def game_control(self, coord, board_name):
+        result = self.apply_shot(coord, board_name)
+
+        # The first item is always the board that's up next, tells the view about it
+        self.turn = result[0]
+        if self.turn_func:
+            self.turn_func(self.turn)
+
+        return result
+
+    ## Bookkeeping for a single shot, see game_control ##
+    def apply_shot(self, coord, board_name):
+        board = self.boards[board_name]
+
+        if board_name == 'computer':
+            hits, ships, remaining_ships, owner = self.computer_board_hit, self.computer_ships, self.computer_remaining_ships, "Computer's"
+        else:
+            hits, ships, remaining_ships, owner = self.player_board_hit, self.player_ships, self.player_remaining_ships, "Player's"
+
+        hits.append(coord)
+        ship_index, ship_sunk = board.fire(coord)
+
+        self.replay.append(PLAYER if board_name == 'computer' else COMPUTER, index_of(coord),
+                           result_of(ship_index, ship_sunk))
+
+        # Checks if the last move hit a ship
+        if ship_index is not None:
+
+            # Finds the original ship, removes the hit square from remaining spaces
+            current_ship = ships[ship_index]
+            remaining_ships[ship_index].remove(coord)
+
+            if ship_sunk:
+                self.log("{} {} is now sunk!".format(owner, ship_name(len(current_ship))))
+
+            # Computer generates a new hit coordinate based on previously hit coordinates
+            if board_name == 'player':
+                self.next_computer_move = self.computer_logic.square_hit(coord, sunk=ship_sunk, ship=current_ship)
+
+            return (board_name, ship_sunk, current_ship)
+
+        # Did not hit a ship on the computer's board, the computer picks its next shot
+        # and the next move is on the player's board (i.e computer's turn)
+        if board_name == 'computer':
+            self.next_computer_move = self.computer_shot()
+            return ('player',)
+
+        # Computer didn't hit a ship, back to the player
+        self.computer_logic.set_hit_spaces([coord])
+        self.next_computer_move = None
+        return ('computer',)
+
+    ## Check if all remaining occupied squares are hit ##
+    #   – override=True means the player resigned
+    #   – Returns 'player', 'computer', True (resigned) or False (game not over)
+    ##
+    def check_win(self, override=False):
+
+        # If game is already over, there's no new result
+        if self.game_over:
+            return
+
+        # Sets the current result to override
+        result = override
+
+        # If all of the player's ships are sunk, make computer the winner
+        if self.boards['player'].all_sunk():
+            result = 'computer'
+            self.log(">>> Player lost!")
+
+        # If all of the computer's ships are sunk, make player the winner
+        if self.boards['computer'].all_sunk():
+            result = 'player'
+            self.log(">>> Player wins!")
+
+        # If player resigns (i.e override = True)
+        if result and result not in ("player", "computer"):
+            self.log(">>> Player resigns.")
+
+        # If result isn't false (i.e game is over)
+        if result:
+            self.game_over = True
+            self.winner = 'player' if result == 'player' else 'computer'
+
+            # Records the result, [0] is wins and [1] is losses
+            if self.manager:
+                self.manager.stats[self.difficulty][0 if self.winner == 'player' else 1] += 1
+                self.manager.record_game(self, result)
+                self.manager.export_to_file()
+
+            if self.result_func:
+                self.result_func(result)
+
+        return result
+
+
+### How the computer decides to play, best to its ability ###
+# Note: Computer gameplay difficulty is determined through the 'game' class
+#   – rng is the random number generator to use (random.Random), games pass
+#     their own in, a freshly seeded one is made if not given
+#####
+class ComputerLogic(object):
+    def __init__(self, rng=None):
+
+        # Random number generator used for every move and layout
+        self.rng = rng if rng is not None else random.Random()
+
+        # Alpha-num list of coordinates on the board that have yet to be hit
+        self.grid = []
+
+        for x in range(10):
+            for y in range(10):
+                self.grid.append(CoordUtils.convert_type(x + 1) + str(y + 1))
+
+        # Alpha-num list of coordinates with ships
+        self.cached_ship_coords = []
+
+        # What the computer knows about the board it's firing on (hits, misses, sunk)
+        self.board = Bitboard()
+
+    ## Returns a coordinate that has yet to be hit, in alpha-num form ##
+    def make_move(self):
+
+        # If no ships were hit in previous turns, make random move
+        if len(self.cached_ship_coords) == 0:
+
+            # Checks to see if there are any spaces around the coordinate,
+            # since there isn't a point in hitting into an enclosed area
+            for i in range(len(self.grid)):
+                coord = self.rng.choice(self.grid)
+
+                if not self.board.is_enclosed(coord):
+                    return coord
+
+            # Late in the game every space left might be enclosed, picks from what's open (if any)
+            open_coords = [coord for coord in self.grid if not self.board.is_enclosed(coord)]
+
+            return self.rng.choice(open_coords if open_coords else self.grid)
+
+        # If a ship was recently hit (i.e cached), hit around
+        else:
+
+            # If two or more ship spaces have been hit
+            if len(self.cached_ship_coords) > 1:
+
+                # For every coordinate with a hit ship in it, check around
+                for i in range(0, len(self.cached_ship_coords)):
+                    sides = [CoordUtils.get_side_coord(self.cached_ship_coords[i], 'left'),
+                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'right'),
+                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'top'),
+                             CoordUtils.get_side_coord(self.cached_ship_coords[i], 'bottom')]
+
+                    linked_sides = []
+                    converted_sides = []
+
+                    # Checks to see if any sides are linked (i.e contains a previously hit ship)
+                    # and appends it to linked sides. Also creates a copy of sides (converted_sides)
+                    # in which the type has been converted to alpha-num form
+                    for side in sides:
+                        if side: converted_sides.append(CoordUtils.convert_type(side))
+                        else: converted_sides.append(None)
+
+                        if side and CoordUtils.convert_type(side) in self.cached_ship_coords:
+                            linked_sides.append(CoordUtils.convert_type(side))
+
+                    # If the two hit spaces aren't 'connected', choose random side
+                    #   – This shouldn't happen, but if it does... backup redundancy
+                    if len(linked_sides) == 0:
+                        targets = [target for target in converted_sides if self.is_unhit(target)]
+
+                        if targets:
+                            return self.rng.choice(targets)
+
+                        continue
+
+                    # If only one side of the hit square is hit
+                    if len(linked_sides) == 1:
+                        index = converted_sides.index(linked_sides[0])
+
+                        # Checks which side the hit square is on, and hit on the opposite side
+                        if index == 0 and self.is_unhit(converted_sides[1]):
+                            return converted_sides[1]
+
+                        elif index == 1 and self.is_unhit(converted_sides[0]):
+                            return converted_sides[0]
+
+                        elif index == 2 and self.is_unhit(converted_sides[3]):
+                            return converted_sides[3]
+
+                        elif index == 3 and self.is_unhit(converted_sides[2]):
+                            return converted_sides[2]
+
+                        else:
+                            continue
+
+                    # If both sides of the hit square are hit, continue to next hit coord
+                    if len(linked_sides) == 2:
+                        continue
+
+            surrounding_coords = CoordUtils.get_surrounding_coords(self.cached_ship_coords[0])
+
+            potential_targets = []
+
+            # Append to potential_targets if the surrounding coordinate has yet to be hit
+            for coord in surrounding_coords:
+                if self.is_unhit(coord):
+                    potential_targets.append(CoordUtils.convert_type(coord))
+
+            # Hits the potential_target, else make a random choice
+            if len(potential_targets) != 0:
+                target = self.rng.choice(potential_targets)
+                return target
+
+            else:
+                self.cached_ship_coords = []
+                return self.make_move()
+
+    ## Move for a virtual turn, tried is the mask of squares already tried this shot ##
+    # Note: Random moves are picked again each time, so they're left to chance like always
+    def next_move(self, tried):
+        return self.make_move()
+
+    ## Checks whether a coordinate (if any) has yet to be hit ##
+    def is_unhit(self, coord):
+        return coord is not None and not self.board.is_fired(coord)
+
+    ## Note: "square" argument is for a coord in alpha-num form (i.e D4) ##
+    def square_hit(self, coord, sunk=False, ship=None):
+        if not self.board.is_fired(coord):
+            self.grid.remove(coord)
+
+        self.board.set('hit', coord)
+
+        # If the ship was sunk, removes sunk_ship_coordinates from the cache
+        if sunk:
+            self.cached_ship_coords = [coord for coord in self.cached_ship_coords if coord not in ship]
+
+            for ship_coord in ship:
+                self.board.set('sunk', ship_coord)
+
+        # If ship wasn't sunk, add the hit coordinate to the cache
+        else: self.cached_ship_coords.append(coord)
+
+        next_move = self.make_move()
+        return next_move
+
+    ## Automatically generates the computer's layout ##
+    # Note: See placements.random_layout, every ship is placed in a bounded number of picks
+    def generate_layout(self):
+        return random_layout(self.rng)
+
+    ## Updates the computer's grid memory by removing previously missed spaces ##
+    # Note: Coordinates to be in alpha-num form, hits go through square_hit
+    def set_hit_spaces(self, hit_spaces):
+        for coord in hit_spaces:
+            if not self.board.is_fired(coord):
+                self.grid.remove(coord)
+                self.board.set('miss', coord)
+
+    ## Updates the computer's grid memory from the board it's firing on ##
+    # Note: Only hits, misses and sunk ships are copied, not where the ships are
+    def set_board(self, board):
+        self.board.load_shots(board)
+        self.grid = [coord for coord in self.grid if not self.board.is_fired(coord)]
+
+
+### Computer that fires where the remaining ships are most likely to be ###
+#   – Every legal placement of every ship still afloat is counted (avoiding
+#     misses and sunk ships), the square covered most often is fired at
+#   – While there are hits on ships that aren't sunk, only placements
+#     through those hits count (once for each hit they go through)
+#####
+class DensityLogic(ComputerLogic):
+    def __init__(self, rng=None):
+        super().__init__(rng=rng)
+
+        # Lengths of the ships that have yet to be sunk
+        self.remaining_lengths = list(FLEET)
+
+    ## Returns the unhit coordinate with the most placements over it, in alpha-num form ##
+    def make_move(self):
+        unhit = FULL & ~self.board.fired
+        free = FULL & ~(self.board.miss | self.board.sunk)
+        targets = self.board.hit & ~self.board.sunk
+
+        if targets:
+            planes = heat_map(free, self.remaining_lengths, targets)
+            best = hottest(planes, unhit)
+
+            # No placement goes through the hits (i.e a save from an older game)
+            if not any(plane & best for plane in planes):
+                targets = 0
+
+        if not targets:
+            best = hottest(heat_map(free, self.remaining_lengths), unhit)
+
+        # Ties are broken randomly, no squares left means anything that's unhit
+        return self.rng.choice(coords_of(best or unhit))
+
+    ## Move for a virtual turn, picked at random weighted by the placements over each square ##
+    #   – squares already tried count as misses, so are left out along with the placements over them
+    #   – squares no remaining ship fits in have no placements, so enclosed squares are never tried
+    # Note: A virtual turn that missed isn't fired at, so always trying the hottest squares
+    # would try the same empty ones shot after shot
+    ##
+    def next_move(self, tried):
+        unhit = FULL & ~self.board.fired & ~tried
+        free = FULL & ~(self.board.miss | self.board.sunk | tried)
+        targets = self.board.hit & ~self.board.sunk
+
+        # Placements through the hits first, any placement if none go through them (i.e a save from an older game)
+        for covering in ((targets, 0) if targets else (0,)):
+            counts = counts_of(heat_map(free, self.remaining_lengths, covering))
+            squares = [index for index in range(100) if unhit >> index & 1 and counts[index]]
+
+            if squares:
+                return INDEX_TO_ALPHA[self.rng.choices(squares, [counts[index] for index in squares])[0]]
+
+        return self.make_move()
+
+    ## Keeps track of which ships are left, see ComputerLogic.square_hit ##
+    def square_hit(self, coord, sunk=False, ship=None):
+        if sunk and ship and len(ship) in self.remaining_lengths:
+            self.remaining_lengths.remove(len(ship))
+
+        return super().square_hit(coord, sunk=sunk, ship=ship)
+
+    ## Sunk ships are announced in game, so their lengths come across too ##
+    def set_board(self, board):
+        super().set_board(board)
+
+        self.remaining_lengths = list(FLEET)
+        for ship in board.ships:
+            if ship & ~board.sunk == 0 and popcount(ship) in self.remaining_lengths:
+                self.remaining_lengths.remove(popcount(ship))
+
+
+### Computer that fires where sampled fleet layouts put ships most often ###
+#   – Keeps a pool of full layouts of the remaining ships that agree with
+#     every hit, miss and sunk ship so far
+#   – After each shot, layouts are repaired (ships that no longer fit are
+#     moved) rather than generated again from scratch
+#   – budget caps the time spent per move (in seconds), samples caps the pool
+#   – Falls back to DensityLogic if no layout could be sampled in time
+#####
+class MonteCarloLogic(DensityLogic):
+    def __init__(self, rng=None, budget=0.005, samples=200):
+        super().__init__(rng=rng)
+
+        self.budget = budget
+        self.sample_count = samples
+
+        # Each layout is a list of (length, mask), one for each ship still afloat
+        self.samples = []
+
+        # Hits, misses and sunk squares the pool was last repaired for
+        self.observed = None
+
+    ## Returns the unhit coordinate most often covered by a layout, in alpha-num form ##
+    def make_move(self):
+        self.refresh()
+
+        if not self.samples:
+            return super().make_move()
+
+        unhit = FULL & ~self.board.fired
+        best = hottest(self.coverage(), unhit)
+
+        return self.rng.choice(coords_of(best or unhit))
+
+    ## Move for a virtual turn, picked at random weighted by the layouts over each square ##
+    # Note: Squares already tried count as misses, so layouts with a ship on one are left out
+    # (see DensityLogic.next_move, which is used if every layout is)
+    def next_move(self, tried):
+        self.refresh()
+
+        unhit = FULL & ~self.board.fired & ~tried
+        counts = counts_of(self.coverage(tried))
+        squares = [index for index in range(100) if unhit >> index & 1 and counts[index]]
+
+        if squares:
+            return INDEX_TO_ALPHA[self.rng.choices(squares, [counts[index] for index in squares])[0]]
+
+        return super().next_move(tried)
+
+    ## Counts how many layouts have a ship on each square, as planes (see placements.heat_map) ##
+    # Note: Layouts with a ship on any square in 'excluded' aren't counted
+    def coverage(self, excluded=0):
+        planes = []
+
+        for sample in self.samples:
+            occupied = 0
+            for length, mask in sample:
+                occupied |= mask
+
+            if not occupied & excluded:
+                add_to_planes(planes, occupied)
+
+        return planes
+
+    ## Repairs the pool if anything happened since it was last used, then tops it up ##
+    # Note: Both stop once the time budget for the move is used up
+    def refresh(self):
+        deadline = time.perf_counter() + self.budget
+        observed = (self.board.hit, self.board.miss, self.board.sunk)
+
+        # Repairs the pool if anything happened since the last move
+        if observed != self.observed:
+            repaired = []
+
+            for sample in self.samples:
+                if time.perf_counter() > deadline:
+                    break
+
+                sample = self.repair(sample)
+                if sample is not None:
+                    repaired.append(sample)
+
+            self.samples = repaired
+            self.observed = observed
+
+        # Tops up the pool with new layouts while there's time left
+        while len(self.samples) < self.sample_count and time.perf_counter() < deadline:
+            sample = self.fill([], list(self.remaining_lengths))
+            if sample is not None:
+                self.samples.append(sample)
+
+    ## Places ships of the given lengths around the ones already in a layout ##
+    #   – Hits that aren't sunk are covered first, then the rest go anywhere free
+    #   – Returns the layout, or None if the ships couldn't be placed
+    ##
+    def fill(self, ships, lengths):
+        blocked = self.board.miss | self.board.sunk
+        targets = self.board.hit & ~self.board.sunk
+
+        ships = list(ships)
+        lengths = list(lengths)
+
+        occupied = 0
+        for length, mask in ships:
+            occupied |= mask
+
+        # Covers every hit with a ship
+        while targets & ~occupied:
+            uncovered = targets & ~occupied
+            square = (uncovered & -uncovered).bit_length() - 1
+
+            options = [(length, mask) for length in set(lengths) for mask in THROUGH[(length, square)]
+                       if not mask & (blocked | occupied)]
+
+            if not options:
+                return None
+
+            length, mask = self.rng.choice(options)
+            ships.append((length, mask))
+            lengths.remove(length)
+            occupied |= mask
+
+        # Places the rest of the ships anywhere they fit
+        for length in lengths:
+            options = [mask for mask in PLACEMENTS[length] if not mask & (blocked | occupied)]
+
+            if not options:
+                return None
+
+            mask = self.rng.choice(options)
+            ships.append((length, mask))
+            occupied |= mask
+
+        return ships
+
+    ## Makes a layout agree with the board again, None if it couldn't be ##
+    def repair(self, sample):
+        blocked = self.board.miss | self.board.sunk
+        lengths = list(self.remaining_lengths)
+
+        # Keeps the ships that still fit (and are still afloat)
+        kept = []
+        for length, mask in sample:
+            if length in lengths and not mask & blocked:
+                lengths.remove(length)
+                kept.append((length, mask))
+
+        sample = self.fill(kept, lengths)
+
+        # A hit no ship covers, moves a few ships out of the way to make room
+        for i in range(3):
+            if sample is not None or not kept:
+                break
+
+            length, mask = kept.pop(self.rng.randrange(len(kept)))
+            lengths.append(length)
+            sample = self.fill(kept, lengths)
+
+        return sample
+
+
+# Computer's brain for each difficulty, ComputerLogic for any not listed
+STRATEGIES = {'master+': DensityLogic}
+
+
+### Plays a whole game without a window ###
+#   – player_logic makes the player's moves (a ComputerLogic on the game's rng by default)
+#   – Both layouts are generated if the game doesn't have any ships yet
+#   – Returns the finished game
+#####
+def play_headless(game, player_logic=None):
+    if player_logic is None:
+        player_logic = ComputerLogic(rng=game.rng)
+
+    if not game.player_ships:
+        game.add_player_ships(player_logic.generate_layout())
+    if not game.computer_ships:
+        game.add_computer_ships(game.computer_logic.generate_layout())
+
+    while not game.game_over:
+
+        # Player fires until they miss
+        coord = player_logic.make_move()
+
+        while True:
+            result = game.game_control(coord, 'computer')
+
+            if len(result) == 1:
+                player_logic.set_hit_spaces([coord])
+                break
+
+            if game.check_win():
+                break
+
+            coord = player_logic.square_hit(coord, sunk=result[1], ship=result[2])
+
+        # Computer fires until it misses
+        while game.turn == 'player' and not game.game_over:
+            game.game_control(game.next_computer_move, 'player')
+            game.check_win()
+
+    return game
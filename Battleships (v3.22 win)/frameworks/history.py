@@ -0,0 +1,262 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Append-only history of every finished game (sqlite3, no tkinter)
+# – One row per game: difficulty, seed, result, shots, duration, moves
+# – Scoreboard queries: wins and losses, best games, rolling win rate,
+#   shots-to-win percentiles (each difficulty)
+#
+# Rows are only ever added, triggers stop them being changed or deleted.
+# Resetting the scores adds a row to 'resets', the scoreboard only counts
+# games after the latest one. Totals from before the history existed (the
+# old stats file) are kept in 'imported' and count until the first reset.
+#
+# Adding games, resets and imported totals happens on a thread of its own,
+# so the window never waits for the database. Queries wait for anything
+# still being added first, so they always count it.
+#
+# Moves are stored as one byte per shot, the square's index (see coords.py).
+# Games since replays were added also keep the whole saved game record
+# (see storage.py), replay log included, so any of them can be watched back.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import datetime
+import os
+import sqlite3
+import threading
+
+from . import storage
+from .coords import index_of
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id              INTEGER PRIMARY KEY,
+    finished        TEXT NOT NULL,
+    difficulty      TEXT NOT NULL,
+    seed            INTEGER,
+    result          TEXT NOT NULL CHECK (result IN ('win', 'loss', 'resign')),
+    shots           INTEGER NOT NULL,
+    computer_shots  INTEGER NOT NULL,
+    duration        REAL NOT NULL,
+    player_moves    BLOB NOT NULL,
+    computer_moves  BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS games_by_difficulty ON games (difficulty, id);
+CREATE INDEX IF NOT EXISTS games_by_shots ON games (difficulty, result, shots);
+
+CREATE TABLE IF NOT EXISTS resets (
+    id          INTEGER PRIMARY KEY,
+    after_game  INTEGER NOT NULL,
+    at          TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS imported (
+    difficulty  TEXT PRIMARY KEY,
+    wins        INTEGER NOT NULL,
+    losses      INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS games_no_update BEFORE UPDATE ON games
+BEGIN SELECT RAISE(ABORT, 'game history is append-only'); END;
+
+CREATE TRIGGER IF NOT EXISTS games_no_delete BEFORE DELETE ON games
+BEGIN SELECT RAISE(ABORT, 'game history is append-only'); END;
+"""
+
+# Columns added to 'games' since it was first made, (name, type)
+ADDED_COLUMNS = (("record", "BLOB"),
+                 ("record_version", "INTEGER"))
+
+
+### History of finished games, kept in an sqlite database file ###
+#   – path=':memory:' keeps it in memory only (i.e for simulations)
+#   – record(), reset() and import_totals() queue their writes, which are made on the
+#     history's own thread (see run), the other methods wait for them (see flush)
+#####
+class History(object):
+    def __init__(self, path):
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One connection for both threads, only used while holding the lock
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+
+        # Write-ahead logging, so adding a game doesn't wait on a full sync
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+        # Histories made before a column was added get it now, earlier games leave it empty
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(games)")]
+
+        for name, kind in ADDED_COLUMNS:
+            if name not in columns:
+                self.connection.execute("ALTER TABLE games ADD COLUMN {} {}".format(name, kind))
+
+        # Writes waiting to be made, each a function given the connection
+        self.pending = []
+        self.busy = False
+        self.closed = False
+
+        # Last error the thread ran into (it's also printed), None if there wasn't one
+        self.error = None
+
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="History", daemon=True)
+        self.thread.start()
+
+    ## Makes anything still queued, then stops the thread and closes the database ##
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        self.thread.join()
+        self.connection.close()
+
+    ## Queues a write, write(connection) is called on the history's thread in a transaction ##
+    def submit(self, write):
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("history is closed")
+
+            self.pending.append(write)
+            self.condition.notify_all()
+
+    ## Waits until everything queued so far has been written ##
+    def flush(self):
+        with self.condition:
+            while self.pending or self.busy:
+                self.condition.wait()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+
+                if not self.pending:
+                    return
+
+                writes, self.pending = self.pending, []
+                self.busy = True
+
+            for write in writes:
+                try:
+                    with self.lock, self.connection:
+                        write(self.connection)
+                except sqlite3.Error as error:
+                    self.error = error
+                    print("Couldn't add to the game history: {}".format(error))
+
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+    ## Runs a query once everything queued has been written, returns every row ##
+    def query(self, sql, parameters=()):
+        self.flush()
+
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    ## Checks whether any games (or imported totals) have been recorded ##
+    def is_empty(self):
+        return self.query("SELECT NOT EXISTS (SELECT 1 FROM games) AND NOT EXISTS (SELECT 1 FROM imported)")[0][0]
+
+    ## Keeps win/loss totals from before there was a history, {difficulty: [wins, losses]} ##
+    def import_totals(self, stats):
+        rows = [(difficulty, wins, losses) for difficulty, (wins, losses) in stats.items()]
+
+        self.submit(lambda connection: connection.executemany("INSERT OR REPLACE INTO imported VALUES (?, ?, ?)", rows))
+
+    ## Adds a finished game ##
+    #   – result is what Game.check_win returned ('player', 'computer', or True if resigned)
+    #   – only what's needed is copied from the game now, it's encoded on the history's thread
+    ##
+    def record(self, game, result):
+        finished = datetime.datetime.today()
+
+        data = game.get_data_summary()
+        data["player_hit"] = list(data["player_hit"])
+        data["computer_hit"] = list(data["computer_hit"])
+
+        def write(connection):
+            connection.execute(
+                "INSERT INTO games (finished, difficulty, seed, result, shots, computer_shots, duration, "
+                "player_moves, computer_moves, record, record_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (finished.isoformat(), data["difficulty"], data["seed"],
+                 {'player': 'win', 'computer': 'loss'}.get(result, 'resign'),
+                 len(data["computer_hit"]), len(data["player_hit"]),
+                 (finished - data["date"]).total_seconds(),
+                 bytes(index_of(coord) for coord in data["computer_hit"]),
+                 bytes(index_of(coord) for coord in data["player_hit"]),
+                 storage.encode_record(data), storage.VERSION))
+
+        self.submit(write)
+
+    ## Saved game record (see storage.SaveRecord) of the latest game that has one, None if there isn't one ##
+    def last_game(self):
+        rows = self.query("SELECT record, record_version FROM games "
+                          "WHERE record IS NOT NULL ORDER BY id DESC LIMIT 1")
+
+        return storage.SaveRecord(rows[0][0], rows[0][1]) if rows else None
+
+    ## Starts the scoreboard again from 0, the games themselves are kept ##
+    def reset(self):
+        at = datetime.datetime.today().isoformat()
+
+        self.submit(lambda connection: connection.execute(
+            "INSERT INTO resets (after_game, at) VALUES ((SELECT coalesce(max(id), 0) FROM games), ?)", (at,)))
+
+    ## Id of the last game before the latest reset, -1 if never reset (0 is a reset before any games) ##
+    def reset_point(self):
+        return self.query("SELECT coalesce(max(after_game), -1) FROM resets")[0][0]
+
+    ## Wins and losses on each difficulty since the last reset, {difficulty: [wins, losses]} ##
+    # Note: Resigning counts as a loss, like in the stats file
+    def scoreboard(self, difficulties):
+        after = self.reset_point()
+        board = {difficulty: [0, 0] for difficulty in difficulties}
+
+        if after < 0:
+            for difficulty, wins, losses in self.query("SELECT * FROM imported"):
+                if difficulty in board:
+                    board[difficulty] = [wins, losses]
+
+        for difficulty, wins, losses in self.query(
+                "SELECT difficulty, sum(result = 'win'), sum(result != 'win') FROM games "
+                "WHERE id > ? GROUP BY difficulty", (max(after, 0),)):
+            if difficulty in board:
+                board[difficulty][0] += wins
+                board[difficulty][1] += losses
+
+        return board
+
+    ## Wins with the fewest shots on a difficulty since the last reset, as (shots, duration, finished) ##
+    def best_games(self, difficulty, limit=5):
+        return self.query("SELECT shots, duration, finished FROM games "
+                          "WHERE difficulty = ? AND result = 'win' AND id > ? ORDER BY shots LIMIT ?",
+                          (difficulty, max(self.reset_point(), 0), limit))
+
+    ## Fraction of the last 'window' games on a difficulty that were won, None if there are none ##
+    def rolling_win_rate(self, difficulty, window=20):
+        return self.query("SELECT avg(result = 'win') FROM (SELECT result FROM games "
+                          "WHERE difficulty = ? ORDER BY id DESC LIMIT ?)", (difficulty, window))[0][0]
+
+    ## Shots-to-win at each percentile (0 – 100) on a difficulty, {percentile: shots} ##
+    # Note: Nearest rank, each is a single seek along the (difficulty, result, shots) index
+    def shots_percentiles(self, difficulty, percentiles=(25, 50, 75)):
+        count = self.query("SELECT count(*) FROM games WHERE difficulty = ? AND result = 'win'", (difficulty,))[0][0]
+
+        if count == 0:
+            return {percentile: None for percentile in percentiles}
+
+        return {percentile: self.query(
+                    "SELECT shots FROM games WHERE difficulty = ? AND result = 'win' ORDER BY shots LIMIT 1 OFFSET ?",
+                    (difficulty, min(count - 1, max(0, -(-percentile * count // 100) - 1))))[0][0]
+                for percentile in percentiles}
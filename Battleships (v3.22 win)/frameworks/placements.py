@@ -0,0 +1,213 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Ship placements as bit masks (see frameworks/bitboard.py)
+# – Start masks (where a ship of each length fits on the board)
+# – Placement masks (every square a ship covers, for every placement and start)
+# – Heat maps (how many placements cover each square)
+# – Layout generation (random fleets, one at a time or in bulk)
+#
+# Heat maps are counted with one bit mask per binary digit ('planes'), so a
+# whole row or column of placements is added with a few integer operations
+# rather than square by square.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import random
+
+from .bitboard import coords_of
+
+
+# Lengths of the ships in the standard fleet
+FLEET = (2, 3, 3, 4, 5)
+
+# Order ships are placed in when generating a layout, longest first so they always fit
+PLACING_ORDER = tuple(sorted(FLEET, reverse=True))
+
+# Whole layouts tried before falling back to placing ships one at a time
+# Note: About 2.6 are needed on average, so the fallback practically never runs
+ATTEMPTS = 100
+
+# Index step for each direction, 'h' is along a row and 'v' is down a column
+STEPS = {'h': 1, 'v': 10}
+
+
+### Mask of every square a ship of a given length can start on, in a direction ###
+def start_mask(length, direction):
+    mask = 0
+
+    for i in range(100):
+        if (direction == 'h' and i % 10 <= 10 - length) or (direction == 'v' and i // 10 <= 10 - length):
+            mask |= 1 << i
+
+    return mask
+
+
+# Start masks for every length and direction, keyed (length, direction)
+START_MASKS = {(length, direction): start_mask(length, direction)
+               for length in range(1, 11) for direction in STEPS}
+
+
+### Masks of every placement of a ship of a given length, both directions ###
+def placements_of(length):
+    masks = []
+
+    for direction, step in STEPS.items():
+        starts = START_MASKS[(length, direction)]
+
+        while starts:
+            start = (starts & -starts).bit_length() - 1
+            starts &= starts - 1
+
+            masks.append(sum(1 << (start + k * step) for k in range(length)))
+
+    return tuple(masks)
+
+
+# Every placement for each ship length in the fleet, keyed by length
+PLACEMENTS = {length: placements_of(length) for length in set(FLEET)}
+
+
+### Mask of the squares a ship covers from a start square, None if it runs off the board ###
+def placement_at(length, direction, start):
+    if not START_MASKS[(length, direction)] >> start & 1:
+        return None
+
+    return sum(1 << (start + k * STEPS[direction]) for k in range(length))
+
+
+# Placement starting on each square, keyed (length, direction, square index)
+# Note: A ship fits if its mask is there (not None) and doesn't overlap anything placed
+PLACEMENT_MASKS = {(length, direction, start): placement_at(length, direction, start)
+                   for length in range(1, 11) for direction in STEPS for start in range(100)}
+
+# Placements going through each square, keyed (length, square index)
+THROUGH = {(length, i): tuple(mask for mask in PLACEMENTS[length] if mask >> i & 1)
+           for length in PLACEMENTS for i in range(100)}
+
+
+### Mask of the starts of every placement that only covers 'free' squares ###
+def valid_starts(free, length, direction):
+    step = STEPS[direction]
+    starts = free & START_MASKS[(length, direction)]
+
+    for k in range(1, length):
+        starts &= free >> (k * step)
+
+    return starts
+
+
+### Adds one to the count of every square in a mask ###
+def add_to_planes(planes, mask):
+    carry = mask
+
+    for i in range(len(planes)):
+        if not carry:
+            return
+
+        planes[i], carry = planes[i] ^ carry, planes[i] & carry
+
+    if carry:
+        planes.append(carry)
+
+
+### Counts, for every square, how many placements of the given ships cover it ###
+#   – free is the mask of squares a ship could be on (i.e not missed or sunk)
+#   – with targets, only placements covering them count, once for every target covered
+#   – returns the counts as planes, planes[i] holds bit i of every square's count
+#####
+def heat_map(free, lengths, targets=0):
+    planes = []
+
+    for length in lengths:
+        for direction, step in STEPS.items():
+            starts = valid_starts(free, length, direction)
+
+            if not targets:
+                for k in range(length):
+                    add_to_planes(planes, starts << (k * step))
+                continue
+
+            # Starts of placements with a target on their j'th square
+            for j in range(length):
+                covering = starts & (targets >> (j * step))
+
+                if covering:
+                    for k in range(length):
+                        add_to_planes(planes, covering << (k * step))
+
+    return planes
+
+
+### Squares out of the candidates with the highest count in a heat map ###
+def hottest(planes, candidates):
+    best = candidates
+
+    for plane in reversed(planes):
+        if best & plane:
+            best &= plane
+
+    return best
+
+
+### Count of every square in a heat map (see heat_map), in index order ###
+def counts_of(planes):
+    return [sum((plane >> index & 1) << i for i, plane in enumerate(planes)) for index in range(100)]
+
+
+### Random fleet layout, as one placement mask per ship (see PLACING_ORDER) ###
+#   – Every ship is picked uniformly from all its placements, and the whole
+#     layout is picked again if any two overlap. That makes every legal layout
+#     equally likely (see benchmarks/layout_benchmark.py), which picking each
+#     ship from what's left over doesn't (it crowds ships into the middle).
+#   – rng can be anything with random.Random's choice()
+#####
+def random_layout_masks(rng=random):
+    for attempt in range(ATTEMPTS):
+        occupied = 0
+        masks = []
+
+        for length in PLACING_ORDER:
+            mask = rng.choice(PLACEMENTS[length])
+
+            if mask & occupied:
+                break
+
+            masks.append(mask)
+            occupied |= mask
+        else:
+            return masks
+
+    return fitted_layout_masks(rng)
+
+
+### Random fleet layout, each ship picked from the placements that still fit ###
+# Note: Always succeeds, but isn't uniform, only used as a fallback
+def fitted_layout_masks(rng=random):
+    occupied = 0
+    masks = []
+
+    for length in PLACING_ORDER:
+        mask = rng.choice([mask for mask in PLACEMENTS[length] if not mask & occupied])
+
+        masks.append(mask)
+        occupied |= mask
+
+    return masks
+
+
+### Random fleet layout, as ships of alpha-num coords (see ComputerLogic.generate_layout) ###
+def random_layout(rng=random):
+    return [coords_of(mask) for mask in random_layout_masks(rng)]
+
+
+### Generates layouts in bulk, for AI training and fairness analysis ###
+#   – Yields count layouts (forever if count is None)
+#   – as_coords=True yields ships of alpha-num coords instead of masks
+#####
+def layouts(count=None, rng=random, as_coords=False):
+    generated = 0
+
+    while count is None or generated < count:
+        yield random_layout(rng) if as_coords else random_layout_masks(rng)
+        generated += 1
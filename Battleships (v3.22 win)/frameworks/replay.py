@@ -0,0 +1,140 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Move by move record of a game, for replaying it (no tkinter)
+# – ReplayLog (every shot as a 4 byte event, with snapshots for seeking)
+#
+# An event is the turn, who fired, the square (by index) and what it did:
+#
+#   event    H turn, B shooter << 4 | result, B square index
+#
+# Turns count up each time the shooter changes, so a turn is one player's
+# shots until they miss. Every SNAPSHOT_EVERY events the squares each side
+# has fired at are kept (two 100-bit masks), so the boards at any move are a
+# snapshot and fewer than SNAPSHOT_EVERY events, however long the game is.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import struct
+
+from .coords import index_of
+from .bitboard import Bitboard
+
+
+EVENT = struct.Struct('<HBB')
+
+# Who fired (shooter), and the board each one fires on
+PLAYER = 0
+COMPUTER = 1
+TARGETS = ('computer', 'player')
+
+# What a shot did (result)
+MISS = 0
+HIT = 1
+SUNK = 2
+
+# Events between snapshots, the most a seek has to replay
+SNAPSHOT_EVERY = 16
+
+
+### Result of a shot, from what Bitboard.fire returned ###
+def result_of(ship_index, ship_sunk):
+    if ship_index is None:
+        return MISS
+
+    return SUNK if ship_sunk else HIT
+
+
+### Every shot of a game in order ###
+#   – data is the encoded events (see encoded()), the log is empty without it
+#####
+class ReplayLog(object):
+    def __init__(self, data=b''):
+        self.events = bytearray()
+        self.turns = 0
+        self.last_shooter = None
+
+        # Squares each shooter has fired at so far, and at every SNAPSHOT_EVERY events
+        self.fired = [0, 0]
+        self.snapshots = [(0, 0)]
+
+        for turn, flags, index in EVENT.iter_unpack(data):
+            self.append(flags >> 4, index, flags & 0xF)
+
+    ## Log of a saved game (see Game.get_data_summary) ##
+    # Note: Saves from before there was a log are rebuilt from their shots, see from_shots()
+    @classmethod
+    def of(cls, data):
+        log = cls(data.get("replay", b''))
+
+        if len(log) != len(data["player_hit"]) + len(data["computer_hit"]):
+            log = cls.from_shots(data)
+
+        return log
+
+    ## Rebuilds the log of a saved game from its ships and shots ##
+    # Note: The player always starts, and each side fires until they miss, so the order is known
+    @classmethod
+    def from_shots(cls, data):
+        log = cls()
+        boards = (Bitboard(data["computer_ships"]), Bitboard(data["player_ships"]))
+        shots = (data["computer_hit"], data["player_hit"])
+        fired = [0, 0]
+
+        shooter = PLAYER
+        while fired[PLAYER] < len(shots[PLAYER]) or fired[COMPUTER] < len(shots[COMPUTER]):
+            if fired[shooter] == len(shots[shooter]):
+                shooter = 1 - shooter
+                continue
+
+            coord = shots[shooter][fired[shooter]]
+            fired[shooter] += 1
+
+            result = result_of(*boards[shooter].fire(coord))
+            log.append(shooter, index_of(coord), result)
+
+            if result == MISS:
+                shooter = 1 - shooter
+
+        return log
+
+    def __len__(self):
+        return len(self.events) // EVENT.size
+
+    ## Adds a shot, the square given by index ##
+    def append(self, shooter, index, result):
+        if shooter != self.last_shooter:
+            self.turns += 1
+            self.last_shooter = shooter
+
+        self.events += EVENT.pack(self.turns, shooter << 4 | result, index)
+        self.fired[shooter] |= 1 << index
+
+        if len(self) % SNAPSHOT_EVERY == 0:
+            self.snapshots.append(tuple(self.fired))
+
+    ## Event n (from 0), as (turn, shooter, square index, result) ##
+    def event(self, n):
+        turn, flags, index = EVENT.unpack_from(self.events, n * EVENT.size)
+
+        return turn, flags >> 4, index, flags & 0xF
+
+    ## Bytes of the events, what's saved ##
+    def encoded(self):
+        return bytes(self.events)
+
+    ## Squares each shooter had fired at after the first n events, [player, computer] ##
+    def fired_at(self, n):
+        n = max(0, min(n, len(self)))
+        fired = list(self.snapshots[n // SNAPSHOT_EVERY])
+
+        for i in range(n - n % SNAPSHOT_EVERY, n):
+            turn, shooter, index, result = self.event(i)
+            fired[shooter] |= 1 << index
+
+        return fired
+
+    ## Sets boards ({board name: Bitboard}, i.e Game.boards) to how they were after the first n events ##
+    def apply(self, n, boards):
+        for shooter, fired in enumerate(self.fired_at(n)):
+            boards[TARGETS[shooter]].set_fired(fired)
@@ -0,0 +1,773 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Versioned binary files for stats and saved games (no tkinter)
+# – Header (magic, version, kind, payload length, CRC-32 checksum)
+# – Stats (wins and losses for each difficulty)
+# – Saved games (boards as bit masks, shots in order, explicit dates)
+# – SaveStore (any number of saved games, a file each plus an index)
+# – Migration of the old text files (python reprs read back with eval)
+# – Crash-safe writing (atomic replace, a journal for writing several files
+#   together, and a background thread so the window never waits on the disk)
+#
+# Every number is little-endian. A file is the header followed by the payload:
+#
+#   header   4s magic 'BTS1', H version, B kind, I payload length, I crc32
+#   stats    B count, then per difficulty: B name length, name, I wins, I losses
+#   game     one saved game's record (a file in a SaveStore's folder)
+#   index    I next id, then per saved game (oldest first), INDEX_ENTRY:
+#            I id, date, 16s difficulty, H progress, 13s hit mask, 13s miss mask
+#   saves    H count, then a header per game, then the records in the same order
+#   header   date, difficulty (as in a record)
+#            progress   H hundredths of a percent of the game completed
+#            thumbnail  13 bytes hit mask, 13 bytes miss mask (the computer's board)
+#            I record length
+#   record   date       H year, B month, B day, B hour, B minute, B second, I microsecond
+#            difficulty B length, name
+#            seed       B 0 (none) or 1, Q seed
+#            then for the player, then the computer:
+#              ships    B count, 13 bytes (a 100-bit mask) per ship
+#              shots    B count, B square index per shot (in the order fired)
+#            cache      B count, B square index per coordinate
+#            replay     H length, the game's replay log (see replay.py)   – version 2 on
+#
+# Saved games are only decoded when they're first read (see SaveRecord), so
+# loading a file is a checksum and reading the headers, which have everything
+# the saves screen shows. Headers are worked out once, when a game is saved.
+#
+# Before version 3 saves files were 'H count, then per game: I record length,
+# record', without headers. Since version 4 games are kept by a SaveStore
+# instead, saves files are only read to move their games into one.
+#
+# Files are never written in place. New contents go to '<file>.tmp' and are
+# synced, then renamed over the old file. When several files change together
+# a journal listing them is written (the commit point) before any are renamed,
+# recover() finishes the renames after a crash, or throws away temp files that
+# were never committed.
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import ast
+import datetime
+import os
+import struct
+import threading
+import zlib
+
+from collections.abc import Mapping
+
+from .coords import INDEX_TO_ALPHA, index_of
+from .bitboard import Bitboard, coords_of, mask_of
+
+
+MAGIC = b'BTS1'
+
+# Version written by this module, files from older versions are read through DECODERS
+#   – 2: saved games have a replay log
+#   – 3: saves files have a header for each game ahead of the records
+#   – 4: saved games are a file each, with an index of their headers (SaveStore)
+VERSION = 4
+
+# Kind of file, stored in the header so stats and saves can't be mixed up
+STATS = 1
+SAVES = 2
+JOURNAL = 3
+GAME = 4
+INDEX = 5
+
+HEADER = struct.Struct('<4sHBII')
+DATE = struct.Struct('<HBBBBBI')
+SEED = struct.Struct('<BQ')
+RECORD_LENGTH = struct.Struct('<I')
+REPLAY_LENGTH = struct.Struct('<H')
+PROGRESS = struct.Struct('<H')
+STAT = struct.Struct('<II')
+NEXT_ID = struct.Struct('<I')
+INDEX_ENTRY = struct.Struct('<IHBBBBBI16sH13s13s')
+
+# Bytes in a 100-bit board mask
+MASK_BYTES = 13
+
+
+### Raised when a file is damaged or isn't one this module knows how to read ###
+class SaveFormatError(ValueError):
+    pass
+
+
+### Adds the header to a payload ###
+def pack(kind, payload):
+    return HEADER.pack(MAGIC, VERSION, kind, len(payload), zlib.crc32(payload)) + payload
+
+
+### Checks the header and checksum of a file's bytes, returns (version, payload) ###
+def unpack(kind, data):
+    if len(data) < HEADER.size:
+        raise SaveFormatError("file is too short for a header")
+
+    magic, version, file_kind, length, checksum = HEADER.unpack_from(data)
+    payload = data[HEADER.size:HEADER.size + length]
+
+    if magic != MAGIC:
+        raise SaveFormatError("not a battleships file")
+    if file_kind != kind:
+        raise SaveFormatError("expected file kind {}, found {}".format(kind, file_kind))
+    if version > VERSION:
+        raise SaveFormatError("file version {} is newer than this program ({})".format(version, VERSION))
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise SaveFormatError("checksum doesn't match, the file is damaged")
+
+    return version, payload
+
+
+### Checks whether a file's bytes are in this format (rather than the old text format) ###
+def is_binary(data):
+    return data[:len(MAGIC)] == MAGIC
+
+
+### Reads a length-prefixed utf-8 string, returns (text, new offset) ###
+def read_text(data, offset):
+    length = data[offset]
+    return data[offset + 1:offset + 1 + length].decode('utf-8'), offset + 1 + length
+
+
+def write_text(text):
+    encoded = text.encode('utf-8')
+    return bytes([len(encoded)]) + encoded
+
+
+### Stats, {difficulty: [wins, losses]} ###
+def encode_stats(stats):
+    payload = bytearray([len(stats)])
+
+    for difficulty, (wins, losses) in stats.items():
+        payload += write_text(difficulty) + STAT.pack(wins, losses)
+
+    return pack(STATS, bytes(payload))
+
+
+def decode_stats(data):
+    version, payload = unpack(STATS, data)
+    return STATS_DECODERS[version](payload)
+
+
+def decode_stats_v1(payload):
+    stats = {}
+    offset = 1
+
+    for i in range(payload[0]):
+        difficulty, offset = read_text(payload, offset)
+        stats[difficulty] = list(STAT.unpack_from(payload, offset))
+        offset += STAT.size
+
+    return stats
+
+
+### One saved game (see Game.get_data_summary), as a dict ###
+def encode_record(data):
+    date = data["date"]
+    record = bytearray(DATE.pack(date.year, date.month, date.day, date.hour, date.minute, date.second, date.microsecond))
+
+    record += write_text(data["difficulty"])
+
+    seed = data.get("seed")
+    record += SEED.pack(0, 0) if seed is None else SEED.pack(1, seed)
+
+    for owner in ("player", "computer"):
+        ships = data[owner + "_ships"]
+        shots = data[owner + "_hit"]
+
+        record.append(len(ships))
+        for ship in ships:
+            record += mask_of(ship).to_bytes(MASK_BYTES, 'little')
+
+        record.append(len(shots))
+        record += bytes(index_of(coord) for coord in shots)
+
+    cache = data["computer_cache"]
+    record.append(len(cache))
+    record += bytes(index_of(coord) for coord in cache)
+
+    # Saves from before there were replay logs have an empty one (it's rebuilt when loaded)
+    replay = data.get("replay", b'')
+    record += REPLAY_LENGTH.pack(len(replay)) + replay
+
+    return bytes(record)
+
+
+def decode_record_v1(record):
+    return decode_record_fields(record)[0]
+
+
+def decode_record_v2(record):
+    data, offset = decode_record_fields(record)
+
+    length, = REPLAY_LENGTH.unpack_from(record, offset)
+    offset += REPLAY_LENGTH.size
+    data["replay"] = bytes(record[offset:offset + length])
+
+    return data
+
+
+### Fields every version of a record has, returns (data, offset of what follows) ###
+def decode_record_fields(record):
+    date = datetime.datetime(*DATE.unpack_from(record))
+    offset = DATE.size
+
+    difficulty, offset = read_text(record, offset)
+
+    has_seed, seed = SEED.unpack_from(record, offset)
+    offset += SEED.size
+
+    data = {"difficulty": difficulty, "date": date, "seed": seed if has_seed else None}
+
+    for owner in ("player", "computer"):
+        ships = []
+        for i in range(record[offset]):
+            start = offset + 1 + i * MASK_BYTES
+            ships.append(coords_of(int.from_bytes(record[start:start + MASK_BYTES], 'little')))
+        offset += 1 + len(ships) * MASK_BYTES
+
+        count = record[offset]
+        data[owner + "_ships"] = ships
+        data[owner + "_hit"] = [INDEX_TO_ALPHA[i] for i in record[offset + 1:offset + 1 + count]]
+        offset += 1 + count
+
+    count = record[offset]
+    data["computer_cache"] = [INDEX_TO_ALPHA[i] for i in record[offset + 1:offset + 1 + count]]
+    offset += 1 + count
+
+    # Saves from before seeds were recorded
+    if data["seed"] is None:
+        del data["seed"]
+
+    return data, offset
+
+
+### What the saves screen shows of a saved game, without decoding the game ###
+#   – progress is the fraction (0 – 1) of the game completed, the most of
+#     either side's ships that have been hit
+#   – hits and misses are masks of the player's shots, for a thumbnail of the board
+#####
+class SaveHeader(object):
+    def __init__(self, date, difficulty, progress, hits, misses):
+        self.date = date
+        self.difficulty = difficulty
+        self.progress = progress
+        self.hits = hits
+        self.misses = misses
+
+    ## Header of a saved game (see Game.get_data_summary) ##
+    @classmethod
+    def of(cls, data):
+        player_board = Bitboard(data["player_ships"], data["player_hit"])
+        computer_board = Bitboard(data["computer_ships"], data["computer_hit"])
+
+        return cls(data["date"], data["difficulty"], max(player_board.progress(), computer_board.progress()),
+                   computer_board.hit, computer_board.miss)
+
+    def encoded(self):
+        date = self.date
+        header = bytearray(DATE.pack(date.year, date.month, date.day, date.hour, date.minute, date.second, date.microsecond))
+
+        header += write_text(self.difficulty)
+        header += PROGRESS.pack(round(self.progress * 10000))
+        header += self.hits.to_bytes(MASK_BYTES, 'little') + self.misses.to_bytes(MASK_BYTES, 'little')
+
+        return bytes(header)
+
+    ## Reads a header, returns (header, new offset) ##
+    @classmethod
+    def decode(cls, data, offset):
+        date = datetime.datetime(*DATE.unpack_from(data, offset))
+        difficulty, offset = read_text(data, offset + DATE.size)
+
+        progress, = PROGRESS.unpack_from(data, offset)
+        offset += PROGRESS.size
+
+        hits = int.from_bytes(data[offset:offset + MASK_BYTES], 'little')
+        misses = int.from_bytes(data[offset + MASK_BYTES:offset + 2 * MASK_BYTES], 'little')
+
+        return cls(date, difficulty, progress / 10000, hits, misses), offset + 2 * MASK_BYTES
+
+
+### A saved game that's only decoded the first time it's read ###
+#   – Reads like the dict from Game.get_data_summary
+#   – header is its SaveHeader, which never needs the game decoded
+#   – Writing it back out reuses the encoded bytes if it was never decoded
+#####
+class SaveRecord(Mapping):
+    def __init__(self, raw, version=VERSION, header=None):
+        self.raw = raw
+        self.version = version
+        self.data = None
+
+        # Files from before headers had none, it's worked out from the game then
+        self.header = header if header is not None else SaveHeader.of(self)
+
+    ## Record of a game's data (see Game.get_data_summary), encoded straight away ##
+    @classmethod
+    def of(cls, data):
+        return cls(encode_record(data), header=SaveHeader.of(data))
+
+    def decoded(self):
+        if self.data is None:
+            self.data = RECORD_DECODERS[self.version](self.raw)
+
+        return self.data
+
+    def __getitem__(self, key):
+        return self.decoded()[key]
+
+    def __iter__(self):
+        return iter(self.decoded())
+
+    def __len__(self):
+        return len(self.decoded())
+
+    ## Bytes of the record in the current version ##
+    def encoded(self):
+        if self.data is None and RECORD_DECODERS[self.version] is RECORD_DECODERS[VERSION]:
+            return self.raw
+
+        return encode_record(self.decoded())
+
+
+### Saved games, a list of SaveRecords (or dicts) ###
+def encode_saves(saves):
+    saves = [save if isinstance(save, SaveRecord) else SaveRecord.of(save) for save in saves]
+    records = [save.encoded() for save in saves]
+
+    payload = bytearray(struct.pack('<H', len(saves)))
+
+    for save, record in zip(saves, records):
+        payload += save.header.encoded() + RECORD_LENGTH.pack(len(record))
+
+    for record in records:
+        payload += record
+
+    return pack(SAVES, bytes(payload))
+
+
+### Saved games as SaveRecords, nothing but the headers is decoded until it's read ###
+def decode_saves(data):
+    version, payload = unpack(SAVES, data)
+    count, = struct.unpack_from('<H', payload)
+
+    # Files from before headers, each game is decoded for its header
+    if version < 3:
+        saves = []
+        offset = 2
+
+        for i in range(count):
+            length, = RECORD_LENGTH.unpack_from(payload, offset)
+            offset += RECORD_LENGTH.size
+
+            saves.append(SaveRecord(payload[offset:offset + length], version))
+            offset += length
+
+        return saves
+
+    headers = []
+    offset = 2
+
+    for i in range(count):
+        header, offset = SaveHeader.decode(payload, offset)
+        length, = RECORD_LENGTH.unpack_from(payload, offset)
+        offset += RECORD_LENGTH.size
+
+        headers.append((header, length))
+
+    saves = []
+
+    for header, length in headers:
+        saves.append(SaveRecord(payload[offset:offset + length], version, header))
+        offset += length
+
+    return saves
+
+
+# Payload decoders for each version that's been written, keyed by version
+STATS_DECODERS = {1: decode_stats_v1, 2: decode_stats_v1, 3: decode_stats_v1, 4: decode_stats_v1}
+RECORD_DECODERS = {1: decode_record_v1, 2: decode_record_v2, 3: decode_record_v2, 4: decode_record_v2}
+
+
+### Reads the old text files (a python repr) without eval ###
+#   – Only literals, and datetime.datetime(...) calls with literal arguments
+#   – Raises SaveFormatError for anything else
+#####
+def read_legacy(text):
+    try:
+        tree = ast.parse(text.strip(), mode='eval')
+    except SyntaxError as error:
+        raise SaveFormatError("old save file can't be read: {}".format(error))
+
+    def convert(node):
+        if isinstance(node, ast.Call):
+            func = node.func
+            is_datetime = (isinstance(func, ast.Attribute) and func.attr == 'datetime' and
+                           isinstance(func.value, ast.Name) and func.value.id == 'datetime') or \
+                          (isinstance(func, ast.Name) and func.id == 'datetime')
+
+            if not is_datetime or node.keywords:
+                raise SaveFormatError("old save file has an unexpected call")
+
+            return datetime.datetime(*[convert(arg) for arg in node.args])
+
+        if isinstance(node, ast.Dict):
+            return {convert(key): convert(value) for key, value in zip(node.keys, node.values)}
+        if isinstance(node, ast.List):
+            return [convert(element) for element in node.elts]
+        if isinstance(node, ast.Tuple):
+            return tuple(convert(element) for element in node.elts)
+
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            raise SaveFormatError("old save file has an unexpected value")
+
+    return convert(tree.body)
+
+
+### Reads a file's bytes, None if there's no file ###
+def read_file(path):
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+### Makes sure renames in a folder are on disk (only possible on POSIX systems) ###
+def sync_folder(folder):
+    if os.name != 'posix':
+        return
+
+    descriptor = os.open(folder or '.', os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+### Writes bytes to '<path>.tmp' and syncs it, making the folder if needed ###
+def write_temp(path, data):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    with open(path + '.tmp', 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+    return path + '.tmp'
+
+
+### Replaces a file with new bytes, there's either the old file or the new one, never half of one ###
+def write_file(path, data):
+    os.replace(write_temp(path, data), path)
+    sync_folder(os.path.dirname(path))
+
+
+### Replaces several files together, after a crash either all change or none do (see recover) ###
+def write_files(files, journal_path):
+    for path, data in files.items():
+        write_temp(path, data)
+
+    # The journal being on disk is what commits the files
+    write_file(journal_path, pack(JOURNAL, "\n".join(files).encode('utf-8')))
+
+    for path in files:
+        os.replace(path + '.tmp', path)
+
+    for folder in set(os.path.dirname(path) for path in files):
+        sync_folder(folder)
+
+    os.remove(journal_path)
+
+
+### Finishes or throws away a write_files() that was cut off ###
+#   – With a readable journal, every file it lists that still has a temp file is renamed into place
+#   – Otherwise temp files of the given paths were never committed, and are removed
+#   – Returns True if anything had to be done
+#####
+def recover(journal_path, paths):
+    committed = []
+
+    data = read_file(journal_path)
+    if data is not None:
+        try:
+            version, payload = unpack(JOURNAL, data)
+            committed = payload.decode('utf-8').split("\n")
+        except SaveFormatError:
+            pass
+
+    changed = data is not None
+
+    for path in set(committed) | set(paths):
+        if os.path.isfile(path + '.tmp'):
+            if path in committed:
+                os.replace(path + '.tmp', path)
+            else:
+                os.remove(path + '.tmp')
+
+            changed = True
+
+    if data is not None:
+        os.remove(journal_path)
+
+    return changed
+
+
+### Writes files on a thread of its own, so saving never holds up the window ###
+#   – submit() hands over the files to write as {path: bytes}, they're written
+#     together with write_files()
+#   – If more files are submitted while a write is going on, only the latest of
+#     each is written once it's done
+#   – flush() waits for everything submitted to be written, close() also stops the thread
+#####
+class BackgroundWriter(object):
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+
+        # Files waiting to be written, {path: bytes}
+        self.pending = {}
+        self.busy = False
+        self.closed = False
+
+        # Last error the thread ran into (it's also printed), None if there wasn't one
+        self.error = None
+
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="BackgroundWriter", daemon=True)
+        self.thread.start()
+
+    ## Queues files to be written ##
+    def submit(self, files):
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("writer is closed")
+
+            self.pending.update(files)
+            self.condition.notify_all()
+
+    ## Waits until everything submitted so far has been written ##
+    def flush(self):
+        with self.condition:
+            while self.pending or self.busy:
+                self.condition.wait()
+
+    ## Writes anything left, then stops the thread ##
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        self.thread.join()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+
+                if not self.pending:
+                    return
+
+                files, self.pending = self.pending, {}
+                self.busy = True
+
+            try:
+                write_files(files, self.journal_path)
+            except OSError as error:
+                self.error = error
+                print("Couldn't save {}: {}".format(", ".join(files), error))
+
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+
+### Loads stats from a file, returns (stats, whether it was in the old format) ###
+# Note: Returns (None, False) if there's no file
+def load_stats(path):
+    data = read_file(path)
+
+    if data is None:
+        return None, False
+    if is_binary(data):
+        return decode_stats(data), False
+
+    return read_legacy(data.decode('utf-8')), True
+
+
+### Loads saved games as SaveRecords, returns (saves, whether it was in an old format) ###
+#   – Old formats are the text files, and binary files from before headers
+#   – Returns (None, False) if there's no file
+#####
+def load_saves(path):
+    data = read_file(path)
+
+    if data is None:
+        return None, False
+    if is_binary(data):
+        return decode_saves(data), HEADER.unpack_from(data)[1] < 3
+
+    return [SaveRecord.of(save) for save in read_legacy(data.decode('utf-8'))], True
+
+
+def save_stats(path, stats):
+    write_file(path, encode_stats(stats))
+
+
+def save_saves(path, saves):
+    write_file(path, encode_saves(saves))
+
+
+### Any number of saved games, each in a file of its own, plus an index of their headers ###
+#   – Positions (0 is the oldest) are what callers use, ids are only for file names
+#   – The index is kept as its encoded bytes, headers are only unpacked when
+#     they're asked for, so memory doesn't grow with objects for every save
+#   – add() and remove() return the files to write as {path: bytes}, for
+#     write_files() or a BackgroundWriter, the index being one of them
+#   – Files of removed saves are left until the next load(), which removes any
+#     file the index doesn't list (so a crash never leaves the index pointing at nothing)
+#   – Save files that can't be read while rebuilding the index are moved aside as
+#     *.damaged (and kept), the rest of the saves carry on as normal
+#####
+class SaveStore(object):
+    def __init__(self, folder):
+        self.folder = folder
+        self.index_path = os.path.join(folder, 'index.bts')
+
+        # Id the next save gets, ids aren't reused
+        self.next_id = 1
+
+        # INDEX_ENTRY for each save, oldest first
+        self.entries = bytearray()
+
+        # Records added or read since loading, keyed by id (they may not be written yet)
+        self.records = {}
+
+    def __len__(self):
+        return len(self.entries) // INDEX_ENTRY.size
+
+    ## Record of the save at a position, only decoded when it's read ##
+    def __getitem__(self, position):
+        return self.record(position)
+
+    def path_of(self, save_id):
+        return os.path.join(self.folder, '{}.bts'.format(save_id))
+
+    ## Reads the index, removing files of saves it doesn't have (damaged ones are kept) ##
+    #   – A missing or damaged index is rebuilt from the files, returns True if it was
+    ##
+    def load(self):
+        data = read_file(self.index_path)
+
+        try:
+            if data is None:
+                raise SaveFormatError("there's no index")
+
+            version, payload = unpack(INDEX, data)
+        except SaveFormatError:
+            if data is None and not os.path.isdir(self.folder):
+                return False
+
+            self.rebuild()
+            return True
+
+        self.next_id, = NEXT_ID.unpack_from(payload)
+        self.entries = bytearray(payload[NEXT_ID.size:])
+
+        listed = set(self.path_of(self.id_at(position)) for position in range(len(self)))
+
+        for name in os.listdir(self.folder):
+            path = os.path.join(self.folder, name)
+
+            if path != self.index_path and path not in listed and not name.endswith('.damaged'):
+                os.remove(path)
+
+        return False
+
+    ## Makes the index again from every save file in the folder, moving aside any that can't be read ##
+    # Note: Ids of damaged saves aren't given out again
+    def rebuild(self):
+        ids = sorted(int(name[:-4]) for name in os.listdir(self.folder)
+                     if name.endswith('.bts') and name[:-4].isdigit())
+
+        self.entries = bytearray()
+        self.next_id = ids[-1] + 1 if ids else 1
+
+        for save_id in ids:
+            try:
+                header = self.read(save_id).header
+            except SaveFormatError as error:
+                path = self.path_of(save_id)
+                print("{} can't be read ({}), it's been moved aside".format(path, error))
+                os.replace(path, path + '.damaged')
+                continue
+
+            self.entries += self.entry(save_id, header)
+
+    ## Id of the save at a position ##
+    def id_at(self, position):
+        return INDEX_ENTRY.unpack_from(self.entries, position * INDEX_ENTRY.size)[0]
+
+    ## SaveHeader of the save at a position ##
+    def header(self, position):
+        fields = INDEX_ENTRY.unpack_from(self.entries, position * INDEX_ENTRY.size)
+
+        return SaveHeader(datetime.datetime(*fields[1:8]), fields[8].rstrip(b'\0').decode('utf-8'),
+                          fields[9] / 10000, int.from_bytes(fields[10], 'little'), int.from_bytes(fields[11], 'little'))
+
+    ## Record of the save at a position ##
+    def record(self, position):
+        save_id = self.id_at(position)
+
+        if save_id not in self.records:
+            self.records[save_id] = self.read(save_id, self.header(position))
+
+        return self.records[save_id]
+
+    ## Reads a save's file, the header is worked out from it if not given ##
+    def read(self, save_id, header=None):
+        data = read_file(self.path_of(save_id))
+        if data is None:
+            raise SaveFormatError("save {} is missing".format(save_id))
+
+        version, payload = unpack(GAME, data)
+        return SaveRecord(payload, version, header)
+
+    def entry(self, save_id, header):
+        date = header.date
+
+        return INDEX_ENTRY.pack(save_id, date.year, date.month, date.day, date.hour, date.minute, date.second,
+                                date.microsecond, header.difficulty.encode('utf-8'), round(header.progress * 10000),
+                                header.hits.to_bytes(MASK_BYTES, 'little'), header.misses.to_bytes(MASK_BYTES, 'little'))
+
+    def encoded_index(self):
+        return pack(INDEX, NEXT_ID.pack(self.next_id) + bytes(self.entries))
+
+    ## Adds a save (a SaveRecord, or a dict from Game.get_data_summary), returns the files to write ##
+    def add(self, save):
+        if not isinstance(save, SaveRecord):
+            save = SaveRecord.of(save)
+
+        save_id = self.next_id
+        self.next_id += 1
+
+        self.entries += self.entry(save_id, save.header)
+        self.records[save_id] = save
+
+        return {self.path_of(save_id): pack(GAME, save.encoded()),
+                self.index_path: self.encoded_index()}
+
+    ## Removes the save at a position, returns the files to write ##
+    def remove(self, position):
+        self.records.pop(self.id_at(position), None)
+
+        start = position * INDEX_ENTRY.size
+        del self.entries[start:start + INDEX_ENTRY.size]
+
+        return {self.index_path: self.encoded_index()}
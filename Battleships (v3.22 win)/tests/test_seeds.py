@@ -0,0 +1,65 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: Checks that any seed random.Random takes makes a game that can be
+# saved (frameworks/storage.py) and recorded (frameworks/history.py)
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python -m unittest discover tests
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks import storage
+from frameworks.engine import SEED_RANGE, Game, play_headless
+from frameworks.history import History
+
+
+class SeedTest(unittest.TestCase):
+    def setUp(self):
+        self.history = History(":memory:")
+
+    def tearDown(self):
+        self.history.close()
+
+    ## Plays a game on a seed, checks it's saved and recorded with the same seed ##
+    def assert_saves(self, seed):
+        game = play_headless(Game(seed=seed))
+        self.assertTrue(0 <= game.seed < SEED_RANGE)
+
+        record = storage.SaveRecord(storage.encode_record(game.get_data_summary()))
+        self.assertEqual(record["seed"], game.seed)
+
+        self.history.record(game, 'player' if game.boards['computer'].all_sunk() else 'computer')
+        self.assertEqual(self.history.query("SELECT seed FROM games ORDER BY id DESC LIMIT 1")[0][0], game.seed)
+        self.assertIsNone(self.history.error)
+
+        return game
+
+    def test_negative_seed(self):
+        self.assertEqual(self.assert_saves(-1).seed, SEED_RANGE - 1)
+
+    def test_large_seed(self):
+        self.assertEqual(self.assert_saves(SEED_RANGE + 5).seed, 5)
+        self.assert_saves(1 << 64)
+
+    def test_string_seed(self):
+        game = self.assert_saves("7/hard/master")
+        self.assertEqual(Game(seed="7/hard/master").seed, game.seed)
+
+    def test_seed_in_range_is_kept(self):
+        self.assertEqual(self.assert_saves(1234).seed, 1234)
+
+    ## The same seed plays the same game, so a saved seed replays it ##
+    def test_same_seed_same_game(self):
+        first, second = play_headless(Game(seed=-42)), play_headless(Game(seed=-42))
+        self.assertEqual(first.get_data_summary()["replay"], second.get_data_summary()["replay"])
+
+
+if __name__ == "__main__":
+    unittest.main()
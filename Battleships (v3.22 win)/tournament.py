@@ -0,0 +1,252 @@
+# # # # # # # # # # # # # # # # # # # #
+#
+# Purpose: AI-vs-AI tournament between the computer difficulties
+# – Every pair of difficulties plays a number of seeded games
+# – Win rates, mean shots-to-win and shot-count distributions
+# – Results printed as a table, optionally saved as CSV and/or JSON
+#
+# Each side is a computer logic with the retries ('virtual turns') it gets on
+# its difficulty, see frameworks/engine.py (RETRIES, STRATEGIES, choose_shot).
+# Sides take turns to fire until they miss, like the game. Who fires first
+# alternates from game to game.
+#
+# Every game has its own random number generator, seeded from --seed, the two
+# difficulties and the game number, so results are the same whatever the
+# number of worker processes.
+#
+# Usage (from the 'Battleships (v3.22 win)' folder):
+#   python tournament.py [--games N] [--seed S] [--workers W]
+#                        [--difficulties easy hard ...] [--csv FILE] [--json FILE]
+#
+# # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import random
+import statistics
+import sys
+import time
+
+from frameworks.bitboard import Bitboard, coords_of
+from frameworks.engine import DIFFICULTIES, RETRIES, STRATEGIES, ComputerLogic, MonteCarloLogic, choose_shot
+
+
+# Computer logic and retries for each side that can be entered, keyed by name
+CONFIGS = {difficulty: (STRATEGIES.get(difficulty, ComputerLogic), RETRIES.get(difficulty, 1))
+           for difficulty in DIFFICULTIES}
+CONFIGS['montecarlo'] = (MonteCarloLogic, 1)
+
+
+### Seed for one game, the same in every process (string seeds aren't hash randomised) ###
+def game_seed(seed, first, second, number):
+    return "{}/{}/{}/{}".format(seed, first, second, number)
+
+
+### Plays one game between two configurations ###
+#   – Returns (index of the winner, shots fired by each side)
+#   – Side 0 fires first on even game numbers, side 1 on odd ones
+#####
+def play_game(first, second, number, seed):
+    rng = random.Random(game_seed(seed, first, second, number))
+
+    logics = []
+    retries = []
+
+    for name in (first, second):
+        logic_class, side_retries = CONFIGS[name]
+        logics.append(logic_class(rng=rng))
+        retries.append(side_retries)
+
+    # Board each side fires on, laid out by the other side
+    boards = [Bitboard(logics[1].generate_layout()), Bitboard(logics[0].generate_layout())]
+
+    shots = [0, 0]
+    turn = number % 2
+
+    while True:
+        logic, board = logics[turn], boards[turn]
+        coord = choose_shot(logic, board, retries[turn])
+
+        # Fires until it misses
+        while True:
+            shots[turn] += 1
+            ship_index, sunk = board.fire(coord)
+
+            if ship_index is None:
+                logic.set_hit_spaces([coord])
+                break
+
+            if board.all_sunk():
+                return turn, shots
+
+            coord = logic.square_hit(coord, sunk=sunk, ship=coords_of(board.ships[ship_index]))
+
+        turn = 1 - turn
+
+
+### Pool worker: plays the game described by a task tuple ###
+def run_task(task):
+    first, second, number, seed = task
+    winner, shots = play_game(first, second, number, seed)
+
+    return first, second, winner, shots
+
+
+### Plays every game, in parallel over 'workers' processes ###
+# Note: Returns {(first, second): [(winner, shots), ...]}
+def run_tournament(names, games, seed, workers, progress=None):
+    pairings = list(itertools.combinations(names, 2))
+    tasks = [(first, second, number, seed) for first, second in pairings for number in range(games)]
+    results = {pairing: [] for pairing in pairings}
+
+    if workers == 1:
+        outcomes = map(run_task, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        outcomes = pool.imap_unordered(run_task, tasks, chunksize=max(1, len(tasks) // (workers * 16)))
+
+    try:
+        for done, (first, second, winner, shots) in enumerate(outcomes, 1):
+            results[(first, second)].append((winner, shots))
+
+            if progress:
+                progress(done, len(tasks))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    return results
+
+
+### Summary of a list of shots-to-win counts ###
+def describe(shots_to_win):
+    if not shots_to_win:
+        return {"mean": None, "median": None, "min": None, "max": None, "distribution": {}}
+
+    distribution = {}
+    for shots in sorted(shots_to_win):
+        distribution[shots] = distribution.get(shots, 0) + 1
+
+    return {"mean": statistics.mean(shots_to_win),
+            "median": statistics.median(shots_to_win),
+            "min": min(shots_to_win),
+            "max": max(shots_to_win),
+            "distribution": distribution}
+
+
+### Turns the raw results into one row per side of each pairing, plus overall rows ###
+def summarise(names, results):
+    matchups = []
+    overall = {name: {"games": 0, "wins": 0, "shots_to_win": []} for name in names}
+
+    for (first, second), games in results.items():
+        for side, (name, opponent) in enumerate(((first, second), (second, first))):
+            shots_to_win = [shots[side] for winner, shots in games if winner == side]
+
+            overall[name]["games"] += len(games)
+            overall[name]["wins"] += len(shots_to_win)
+            overall[name]["shots_to_win"] += shots_to_win
+
+            row = {"difficulty": name, "opponent": opponent, "games": len(games), "wins": len(shots_to_win),
+                   "win_rate": len(shots_to_win) / len(games) if games else None}
+            row.update(describe(shots_to_win))
+            matchups.append(row)
+
+    totals = []
+    for name in names:
+        entry = overall[name]
+        row = {"difficulty": name, "opponent": "all", "games": entry["games"], "wins": entry["wins"],
+               "win_rate": entry["wins"] / entry["games"] if entry["games"] else None}
+        row.update(describe(entry["shots_to_win"]))
+        totals.append(row)
+
+    return matchups, totals
+
+
+### Formats a number (or None) for the table ###
+def cell(value, fmt):
+    return "-" if value is None else fmt.format(value)
+
+
+### Prints the summary rows as a table ###
+def print_table(title, rows):
+    print(title)
+    print("{:<12}{:<12}{:>8}{:>8}{:>10}{:>12}{:>8}{:>6}{:>6}".format(
+        "difficulty", "opponent", "games", "wins", "win %", "mean shots", "median", "min", "max"))
+
+    for row in rows:
+        print("{:<12}{:<12}{:>8}{:>8}{:>10}{:>12}{:>8}{:>6}{:>6}".format(
+            row["difficulty"], row["opponent"], row["games"], row["wins"],
+            cell(row["win_rate"] and row["win_rate"] * 100, "{:.1f}"), cell(row["mean"], "{:.1f}"),
+            cell(row["median"], "{:g}"), cell(row["min"], "{}"), cell(row["max"], "{}")))
+
+    print()
+
+
+### Writes the summary rows to a CSV file (distributions as 'shots:count' pairs) ###
+def write_csv(path, rows):
+    fields = ["difficulty", "opponent", "games", "wins", "win_rate", "mean", "median", "min", "max", "distribution"]
+
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+
+        for row in rows:
+            row = dict(row)
+            row["distribution"] = " ".join("{}:{}".format(shots, count) for shots, count in row["distribution"].items())
+            writer.writerow(row)
+
+
+### Writes the settings and summary rows to a JSON file ###
+def write_json(path, settings, matchups, totals):
+    with open(path, "w") as file:
+        json.dump({"settings": settings, "matchups": matchups, "overall": totals}, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plays the computer difficulties against each other.")
+    parser.add_argument("--difficulties", nargs="+", choices=list(CONFIGS), default=list(DIFFICULTIES),
+                        help="sides in the tournament, every pair plays (default: every difficulty)")
+    parser.add_argument("--games", type=int, default=1000, help="games played by each pair")
+    parser.add_argument("--seed", type=int, default=2018)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="processes to play on")
+    parser.add_argument("--csv", help="file to save the results to as CSV")
+    parser.add_argument("--json", help="file to save the results to as JSON")
+    args = parser.parse_args()
+
+    names = list(dict.fromkeys(args.difficulties))
+    if len(names) < 2:
+        parser.error("at least two different difficulties are needed")
+
+    def progress(done, total):
+        if done % 500 == 0 or done == total:
+            sys.stderr.write("\r{} / {} games".format(done, total))
+            sys.stderr.flush()
+
+    start = time.perf_counter()
+    results = run_tournament(names, args.games, args.seed, max(1, args.workers), progress)
+    elapsed = time.perf_counter() - start
+    sys.stderr.write("\n")
+
+    matchups, totals = summarise(names, results)
+
+    print("{} games in {:.1f} s on {} worker(s), seed {}\n".format(
+        sum(len(games) for games in results.values()), elapsed, max(1, args.workers), args.seed))
+    print_table("Head to head:", matchups)
+    print_table("Overall:", totals)
+
+    if args.csv:
+        write_csv(args.csv, matchups + totals)
+    if args.json:
+        settings = {"difficulties": names, "games": args.games, "seed": args.seed}
+        write_json(args.json, settings, matchups, totals)
+
+
+if __name__ == "__main__":
+    main()